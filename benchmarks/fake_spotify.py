@@ -0,0 +1,631 @@
+"""Local stand-in for the Spotify Web API and Musixmatch used by the benchmarks.
+
+The server generates a synthetic account from a few size knobs and serves
+the endpoints the integration calls, adding a fixed latency to every
+response. Objects are derived from their index, so even large accounts
+cost little memory on the server side. Call counts per endpoint are
+available from ``GET /_stats`` and reset with ``POST /_stats/reset``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import random
+import re
+from typing import Any
+
+from aiohttp import web
+
+API_PREFIX = "/v1/"
+MM_PATH = "/ws/1.1/track.get"
+USER_ID = "benchuser"
+HISTORY_PLAYLIST_ID = "history000000000000000"
+
+TRACK_POOL = 50000
+ARTIST_POOL = 10000
+TRACKS_PER_ALBUM = 12
+ID_SEGMENT = re.compile(r"(?<=/)[a-z]*\d{6,}(?=/|$)")
+GENRES = ["indie", "rock", "pop", "jazz", "house", "folk", "metal", "soul"]
+
+
+def _id(prefix: str, index: int) -> str:
+    """Return a 22 character Spotify style ID."""
+    return f"{prefix}{index:0{22 - len(prefix)}d}"
+
+
+def _index(item_id: str) -> int:
+    return int(re.sub(r"\D", "", item_id) or 0)
+
+
+@dataclass
+class SyntheticAccount:
+    """Library shape of a generated account."""
+
+    playlists: int = 10
+    followed_artists: int = 50
+    history_tracks: int = 1000
+    seed: int = 1
+    playlist_sizes: list[int] = field(default_factory=list)
+    history: list[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        rng = random.Random(self.seed)
+        if not self.playlist_sizes:
+            ## A few empty playlists exercise the "no items" filter
+            self.playlist_sizes = [
+                0 if rng.random() < 0.05 else rng.randint(5, 250)
+                for _ in range(self.playlists)
+            ]
+        if not self.history:
+            self.history = rng.sample(range(TRACK_POOL), self.history_tracks)
+
+
+## Object builders
+
+
+def artist_obj(index: int, full: bool = True) -> dict[str, Any]:
+    artist_id = _id("ar", index % ARTIST_POOL)
+    artist = {
+        "id": artist_id,
+        "name": f"Artist {index % ARTIST_POOL}",
+        "uri": f"spotify:artist:{artist_id}",
+        "type": "artist",
+    }
+    if full:
+        artist.update(
+            {
+                "genres": [GENRES[index % len(GENRES)]],
+                "images": [{"url": f"https://i.example/{artist_id}", "height": 640}],
+                "popularity": index % 100,
+                "followers": {"total": index * 37 % 5000000},
+            }
+        )
+    return artist
+
+
+def album_obj(index: int) -> dict[str, Any]:
+    album_id = _id("al", index)
+    return {
+        "id": album_id,
+        "name": f"Album {index}",
+        "uri": f"spotify:album:{album_id}",
+        "artists": [artist_obj(index, full=False)],
+        "images": [{"url": f"https://i.example/{album_id}", "height": 640}],
+        "release_date": f"{1970 + index % 54}-01-01",
+        "total_tracks": TRACKS_PER_ALBUM,
+        "label": "Bench Records",
+        "copyrights": [],
+        "genres": [],
+    }
+
+
+def track_obj(index: int) -> dict[str, Any]:
+    track_id = _id("tr", index)
+    return {
+        "id": track_id,
+        "name": f"Track {index}",
+        "uri": f"spotify:track:{track_id}",
+        "type": "track",
+        "duration_ms": 150000 + index % 120000,
+        "popularity": index % 100,
+        "track_number": index % TRACKS_PER_ALBUM + 1,
+        "external_ids": {"isrc": f"US{index:010d}"},
+        "artists": [artist_obj(index, full=False)],
+        "album": album_obj(index // TRACKS_PER_ALBUM),
+    }
+
+
+def audio_features_obj(index: int) -> dict[str, Any]:
+    rng = random.Random(index)
+    features = {
+        key: round(rng.random(), 3)
+        for key in (
+            "acousticness",
+            "danceability",
+            "energy",
+            "instrumentalness",
+            "liveness",
+            "speechiness",
+            "valence",
+        )
+    }
+    features.update(
+        {
+            "id": _id("tr", index),
+            "loudness": -rng.random() * 20,
+            "tempo": 60 + rng.random() * 120,
+            "time_signature": 4,
+        }
+    )
+    return features
+
+
+def playlist_obj(
+    playlist_id: str, name: str, total: int, owner: str = USER_ID
+) -> dict[str, Any]:
+    return {
+        "id": playlist_id,
+        "name": name,
+        "uri": f"spotify:playlist:{playlist_id}",
+        "description": f"{name} description",
+        "images": [{"url": f"https://i.example/{playlist_id}"}],
+        "owner": {"id": owner, "display_name": owner},
+        "tracks": {"total": total},
+        "snapshot_id": f"snap-{playlist_id}-{total}",
+    }
+
+
+class FakeSpotify:
+    """aiohttp application serving a synthetic account."""
+
+    def __init__(self, account: SyntheticAccount, latency: float = 0.0) -> None:
+        self.account = account
+        self.latency = latency
+        self.calls: Counter = Counter()
+        self.base_url = ""
+        self._snapshot = 0
+        self._created: dict[str, dict[str, Any]] = {}
+        self._routes: list[tuple[str, re.Pattern, Any]] = [
+            ("GET", re.compile(r"^me$"), self.me),
+            ("GET", re.compile(r"^me/playlists$"), self.my_playlists),
+            ("GET", re.compile(r"^me/following$"), self.followed_artists),
+            (
+                "GET",
+                re.compile(r"^me/(following|tracks|albums)/contains$"),
+                self.contains,
+            ),
+            ("GET", re.compile(r"^me/(tracks|albums)$"), self.saved),
+            ("GET", re.compile(r"^me/top/(artists|tracks)$"), self.top),
+            ("GET", re.compile(r"^me/player/devices$"), self.devices),
+            ("GET", re.compile(r"^me/player(/currently-playing)?$"), self.playing),
+            ("GET", re.compile(r"^me/player/queue$"), self.queue),
+            ("GET", re.compile(r"^me/player/recently-played$"), self.recent),
+            ("GET", re.compile(r"^playlists/([^/]+)$"), self.playlist),
+            ("GET", re.compile(r"^playlists/([^/]+)/tracks$"), self.playlist_items),
+            (
+                "GET",
+                re.compile(r"^playlists/([^/]+)/followers/contains$"),
+                self.true_list,
+            ),
+            ("POST", re.compile(r"^playlists/([^/]+)/tracks$"), self.playlist_add),
+            ("DELETE", re.compile(r"^playlists/([^/]+)/tracks$"), self.playlist_remove),
+            ("POST", re.compile(r"^users/([^/]+)/playlists$"), self.playlist_create),
+            ("GET", re.compile(r"^tracks$"), self.tracks),
+            ("GET", re.compile(r"^tracks/([^/]+)$"), self.track),
+            ("GET", re.compile(r"^audio-features$"), self.audio_features),
+            ("GET", re.compile(r"^artists$"), self.artists),
+            ("GET", re.compile(r"^artists/([^/]+)$"), self.artist),
+            ("GET", re.compile(r"^artists/([^/]+)/albums$"), self.artist_albums),
+            ("GET", re.compile(r"^artists/([^/]+)/top-tracks$"), self.top_tracks),
+            (
+                "GET",
+                re.compile(r"^artists/([^/]+)/related-artists$"),
+                self.related_artists,
+            ),
+            ("GET", re.compile(r"^albums/([^/]+)/tracks$"), self.album_tracks),
+            ("GET", re.compile(r"^search$"), self.search),
+            ("GET", re.compile(r"^browse/categories$"), self.categories),
+            (
+                "GET",
+                re.compile(r"^browse/categories/([^/]+)/playlists$"),
+                self.category_playlists,
+            ),
+            (
+                "GET",
+                re.compile(r"^recommendations/available-genre-seeds$"),
+                self.genre_seeds,
+            ),
+            ("GET", re.compile(r"^recommendations$"), self.recommendations),
+        ]
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/_stats", self.stats)
+        app.router.add_post("/_stats/reset", self.reset_stats)
+        app.router.add_get(MM_PATH, self.musixmatch)
+        app.router.add_route("*", API_PREFIX + "{path:.*}", self.dispatch)
+        return app
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"total": sum(self.calls.values()), "endpoints": dict(self.calls)}
+        )
+
+    async def reset_stats(self, request: web.Request) -> web.Response:
+        self.calls.clear()
+        return web.json_response({})
+
+    async def musixmatch(self, request: web.Request) -> web.Response:
+        self.calls["musixmatch track.get"] += 1
+        await asyncio.sleep(self.latency)
+        isrc = request.query.get("track_isrc", "")
+        return web.json_response(
+            {
+                "message": {
+                    "header": {"status_code": 200},
+                    "body": {
+                        "track": {"track_share_url": f"https://mm.example/{isrc}"}
+                    },
+                }
+            },
+            content_type="text/plain",
+        )
+
+    async def dispatch(self, request: web.Request) -> web.StreamResponse:
+        path = request.match_info["path"].strip("/")
+        for method, pattern, handler in self._routes:
+            if method == request.method and (match := pattern.match(path)):
+                self.calls[f"{method} {ID_SEGMENT.sub('{id}', path)}"] += 1
+                await asyncio.sleep(self.latency)
+                return await handler(request, *match.groups())
+
+        self.calls[f"{request.method} {path}"] += 1
+        await asyncio.sleep(self.latency)
+        if request.method == "GET":
+            return web.json_response(
+                {"error": {"status": 404, "message": "Not found"}}, status=404
+            )
+        ## Player commands and other writes succeed without a body
+        return web.Response(status=204)
+
+    ## Paging helpers
+
+    def _page(
+        self, request: web.Request, items: list[Any], total: int | None = None
+    ) -> dict[str, Any]:
+        """Slice a full list into the page the request asked for."""
+        limit = int(request.query.get("limit", 20))
+        offset = int(request.query.get("offset", 0))
+        total = len(items) if total is None else total
+        return self._paged(request, items[offset : offset + limit], total)
+
+    @staticmethod
+    def _paged(request: web.Request, page: list[Any], total: int) -> dict[str, Any]:
+        """Wrap one page of items in a Spotify paging object."""
+        limit = int(request.query.get("limit", 20))
+        offset = int(request.query.get("offset", 0))
+        next_url = None
+        if offset + limit < total:
+            query = dict(request.query, offset=str(offset + limit), limit=str(limit))
+            next_url = str(request.url.with_query(query))
+        return {
+            "items": page,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next": next_url,
+        }
+
+    @staticmethod
+    def _ids(request: web.Request) -> list[str]:
+        return [
+            item.split(":")[-1]
+            for item in request.query.get("ids", "").split(",")
+            if item
+        ]
+
+    ## Profile and library
+
+    async def me(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "id": USER_ID,
+                "display_name": "Bench User",
+                "country": "US",
+                "product": "premium",
+                "images": [],
+            }
+        )
+
+    def _playlists(self) -> list[dict[str, Any]]:
+        playlists = [
+            playlist_obj(
+                _id("pl", index),
+                f"Daily Mix {index}" if index % 25 == 0 else f"Playlist {index}",
+                size,
+                "spotify" if index % 25 == 0 else USER_ID,
+            )
+            for index, size in enumerate(self.account.playlist_sizes)
+        ]
+        playlists.append(
+            playlist_obj(HISTORY_PLAYLIST_ID, "History", len(self.account.history))
+        )
+        return playlists + list(self._created.values())
+
+    async def my_playlists(self, request: web.Request) -> web.Response:
+        return web.json_response(self._page(request, self._playlists()))
+
+    async def followed_artists(self, request: web.Request) -> web.Response:
+        limit = int(request.query.get("limit", 20))
+        after = request.query.get("after")
+        start = _index(after) + 1 if after else 0
+        end = min(start + limit, self.account.followed_artists)
+        items = [artist_obj(index) for index in range(start, end)]
+        next_url = None
+        if end < self.account.followed_artists:
+            next_url = str(
+                request.url.with_query(
+                    dict(request.query, after=_id("ar", end - 1), limit=str(limit))
+                )
+            )
+        return web.json_response(
+            {
+                "artists": {
+                    "items": items,
+                    "next": next_url,
+                    "total": self.account.followed_artists,
+                    "cursors": {"after": _id("ar", end - 1) if next_url else None},
+                    "limit": limit,
+                }
+            }
+        )
+
+    async def contains(self, request: web.Request, kind: str) -> web.Response:
+        return web.json_response([_index(item) % 3 == 0 for item in self._ids(request)])
+
+    async def saved(self, request: web.Request, kind: str) -> web.Response:
+        builder = track_obj if kind == "tracks" else album_obj
+        limit = int(request.query.get("limit", 20))
+        offset = int(request.query.get("offset", 0))
+        items = [{kind[:-1]: builder(index)} for index in range(offset, offset + limit)]
+        return web.json_response(self._paged(request, items, 5000))
+
+    async def top(self, request: web.Request, kind: str) -> web.Response:
+        builder = artist_obj if kind == "artists" else track_obj
+        return web.json_response(
+            self._page(request, [builder(i * 7) for i in range(99)])
+        )
+
+    ## Player
+
+    async def devices(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"devices": [{"id": "device1", "name": "Bench Speaker", "is_active": True}]}
+        )
+
+    async def playing(self, request: web.Request, _current: str | None) -> web.Response:
+        index = self.account.history[0] if self.account.history else 1
+        return web.json_response(
+            {
+                "is_playing": True,
+                "progress_ms": 30000,
+                "item": track_obj(index),
+                "context": {
+                    "type": "playlist",
+                    "uri": f"spotify:playlist:{_id('pl', 1)}",
+                },
+                "device": {"id": "device1", "name": "Bench Speaker"},
+                "shuffle_state": False,
+                "repeat_state": "off",
+            }
+        )
+
+    async def queue(self, request: web.Request) -> web.Response:
+        history = self.account.history
+        return web.json_response(
+            {
+                "currently_playing": track_obj(history[0]) if history else None,
+                "queue": [track_obj(index) for index in history[1:21]],
+            }
+        )
+
+    async def recent(self, request: web.Request) -> web.Response:
+        limit = int(request.query.get("limit", 20))
+        return web.json_response(
+            {
+                "items": [
+                    {"track": track_obj(index), "played_at": "2024-01-01T00:00:00Z"}
+                    for index in self.account.history[:limit]
+                ],
+                "cursors": {"after": "1704067200000"},
+            }
+        )
+
+    ## Playlists
+
+    def _playlist_tracks(self, playlist_id: str) -> list[int]:
+        if playlist_id == HISTORY_PLAYLIST_ID:
+            return self.account.history
+        if playlist_id in self._created:
+            return self._created[playlist_id]["_tracks"]
+        index = _index(playlist_id)
+        size = self.account.playlist_sizes[index]
+        return [(index * 131 + offset) % TRACK_POOL for offset in range(size)]
+
+    async def playlist(self, request: web.Request, playlist_id: str) -> web.Response:
+        tracks = self._playlist_tracks(playlist_id)
+        playlist = playlist_obj(playlist_id, f"Playlist {playlist_id}", len(tracks))
+        playlist["snapshot_id"] = f"snap-{self._snapshot}"
+        return web.json_response(playlist)
+
+    async def playlist_items(
+        self, request: web.Request, playlist_id: str
+    ) -> web.Response:
+        limit = int(request.query.get("limit", 100))
+        offset = int(request.query.get("offset", 0))
+        tracks = self._playlist_tracks(playlist_id)
+        items = [
+            {"track": track_obj(index), "added_at": "2024-01-01T00:00:00Z"}
+            for index in tracks[offset : offset + limit]
+        ]
+        return web.json_response(self._paged(request, items, len(tracks)))
+
+    async def true_list(self, request: web.Request, _playlist_id: str) -> web.Response:
+        return web.json_response([True])
+
+    async def playlist_add(
+        self, request: web.Request, playlist_id: str
+    ) -> web.Response:
+        body = await request.json()
+        tracks = self._playlist_tracks(playlist_id)
+        position = body.get("position") or 0
+        tracks[position:position] = [_index(uri) for uri in body.get("uris", [])]
+        self._snapshot += 1
+        return web.json_response({"snapshot_id": f"snap-{self._snapshot}"}, status=201)
+
+    async def playlist_remove(
+        self, request: web.Request, playlist_id: str
+    ) -> web.Response:
+        body = await request.json()
+        tracks = self._playlist_tracks(playlist_id)
+        for item in body.get("tracks", []):
+            index = _index(item["uri"])
+            positions = item.get("positions")
+            if positions:
+                for position in sorted(positions, reverse=True):
+                    if position < len(tracks) and tracks[position] == index:
+                        del tracks[position]
+            else:
+                tracks[:] = [track for track in tracks if track != index]
+        self._snapshot += 1
+        return web.json_response({"snapshot_id": f"snap-{self._snapshot}"})
+
+    async def playlist_create(self, request: web.Request, _user: str) -> web.Response:
+        body = await request.json()
+        playlist_id = _id("new", len(self._created))
+        playlist = playlist_obj(playlist_id, body.get("name", ""), 0)
+        self._created[playlist_id] = playlist | {"_tracks": []}
+        return web.json_response(playlist, status=201)
+
+    ## Catalog
+
+    async def tracks(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"tracks": [track_obj(_index(item)) for item in self._ids(request)]}
+        )
+
+    async def track(self, request: web.Request, track_id: str) -> web.Response:
+        return web.json_response(track_obj(_index(track_id)))
+
+    async def audio_features(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "audio_features": [
+                    audio_features_obj(_index(item)) for item in self._ids(request)
+                ]
+            }
+        )
+
+    async def artists(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"artists": [artist_obj(_index(item)) for item in self._ids(request)]}
+        )
+
+    async def artist(self, request: web.Request, artist_id: str) -> web.Response:
+        return web.json_response(artist_obj(_index(artist_id)))
+
+    async def artist_albums(self, request: web.Request, artist_id: str) -> web.Response:
+        base = _index(artist_id)
+        albums = [album_obj(base + offset * ARTIST_POOL) for offset in range(12)]
+        return web.json_response(self._page(request, albums))
+
+    async def top_tracks(self, request: web.Request, artist_id: str) -> web.Response:
+        base = _index(artist_id)
+        return web.json_response(
+            {"tracks": [track_obj(base + offset * ARTIST_POOL) for offset in range(10)]}
+        )
+
+    async def related_artists(
+        self, request: web.Request, artist_id: str
+    ) -> web.Response:
+        base = _index(artist_id)
+        return web.json_response(
+            {"artists": [artist_obj(base + offset) for offset in range(1, 21)]}
+        )
+
+    async def album_tracks(self, request: web.Request, album_id: str) -> web.Response:
+        base = _index(album_id) * TRACKS_PER_ALBUM
+        tracks = [track_obj(base + offset) for offset in range(TRACKS_PER_ALBUM)]
+        return web.json_response(self._page(request, tracks))
+
+    ## Browse and search
+
+    async def search(self, request: web.Request) -> web.Response:
+        query = request.query.get("q", "")
+        limit = int(request.query.get("limit", 10))
+        seed = sum(map(ord, query))
+        results: dict[str, Any] = {}
+        for kind in request.query.get("type", "").split(","):
+            if kind == "playlist":
+                name = re.sub(r"^(this is |)", "", query, flags=re.I).title()
+                items = [
+                    playlist_obj(_id("sp", seed), f"This Is {name}", 50, "spotify"),
+                    playlist_obj(_id("sr", seed), f"{name} Radio", 50, "spotify"),
+                ] + [
+                    playlist_obj(_id("sx", seed + offset), f"{name} mix {offset}", 30)
+                    for offset in range(limit - 2)
+                ]
+            elif kind == "artist":
+                items = [artist_obj(seed + offset) for offset in range(limit)]
+            elif kind == "album":
+                items = [album_obj(seed + offset) for offset in range(limit)]
+            else:
+                items = [track_obj(seed + offset) for offset in range(limit)]
+            results[f"{kind}s"] = {"items": items, "total": len(items), "next": None}
+        return web.json_response(results)
+
+    async def categories(self, request: web.Request) -> web.Response:
+        items = [
+            {"id": f"cat{index}", "name": f"Category {index}"} for index in range(60)
+        ]
+        return web.json_response({"categories": self._page(request, items)})
+
+    async def category_playlists(
+        self, request: web.Request, category_id: str
+    ) -> web.Response:
+        items = [
+            playlist_obj(_id("cp", index), f"{category_id} {index}", 40, "spotify")
+            for index in range(30)
+        ]
+        return web.json_response({"playlists": self._page(request, items)})
+
+    async def genre_seeds(self, request: web.Request) -> web.Response:
+        return web.json_response({"genres": GENRES})
+
+    async def recommendations(self, request: web.Request) -> web.Response:
+        limit = int(request.query.get("limit", 20))
+        seed = sum(map(ord, request.query_string))
+        return web.json_response(
+            {
+                "tracks": [
+                    track_obj((seed + offset * 17) % TRACK_POOL)
+                    for offset in range(limit)
+                ],
+                "seeds": [{"id": "seed", "type": "artist"}],
+            }
+        )
+
+
+async def start_server(
+    account: SyntheticAccount, latency: float, host: str = "127.0.0.1", port: int = 0
+) -> tuple[web.AppRunner, FakeSpotify, str]:
+    """Start the fake server and return its runner, app and base URL."""
+    fake = FakeSpotify(account, latency)
+    runner = web.AppRunner(fake.app())
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = runner.addresses[0][1]
+    fake.base_url = f"http://{host}:{bound_port}"
+    return runner, fake, fake.base_url
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--playlists", type=int, default=10)
+    parser.add_argument("--artists", type=int, default=50)
+    parser.add_argument("--history", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    account = SyntheticAccount(args.playlists, args.artists, args.history)
+    fake = FakeSpotify(account, args.latency)
+    web.run_app(fake.app(), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
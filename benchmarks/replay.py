@@ -0,0 +1,173 @@
+"""Serve a capture recorded by the spotify_capture_start service.
+
+Requests are matched to recorded exchanges by method, path and query, with
+scrubbed query values ignored, falling back to method and path alone.
+Repeated requests get the recorded responses in order, the last one
+repeating once they run out. Each response is delayed by its recorded
+duration times ``speed``: 1 keeps the original timing, 0.1 compresses it
+tenfold and 0 serves as fast as possible.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter, defaultdict
+import json
+from pathlib import Path
+import sys
+from typing import Any
+
+from aiohttp import web
+from yarl import URL
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from benchmarks.fake_spotify import API_PREFIX, MM_PATH
+
+SPOTIFY_API_BASE = "https://api.spotify.com/v1/"
+SCRUBBED = "**REDACTED**"
+
+
+def load_capture(path: Path) -> list[dict[str, Any]]:
+    """Read the exchanges of a capture file in recorded order."""
+    with path.open(encoding="utf-8") as file:
+        exchanges = [json.loads(line) for line in file if line.strip()]
+    return sorted(exchanges, key=lambda exchange: exchange["offset"])
+
+
+def _path(exchange: dict[str, Any]) -> str:
+    if exchange["service"] == "musixmatch":
+        return URL(exchange["path"]).path.rsplit("/", 1)[-1]
+    return exchange["path"].strip("/")
+
+
+def _query(query: dict[str, str], scrubbed: set[str]) -> tuple:
+    return tuple(sorted((k, v) for k, v in query.items() if k not in scrubbed))
+
+
+class ReplayServer:
+    """aiohttp application answering from a capture."""
+
+    def __init__(self, exchanges: list[dict[str, Any]], speed: float = 1.0) -> None:
+        self.speed = speed
+        self.calls: Counter = Counter()
+        self.unmatched: Counter = Counter()
+        self.base_url = ""
+        self._exact: dict[tuple, list[dict[str, Any]]] = defaultdict(list)
+        self._loose: dict[tuple, list[dict[str, Any]]] = defaultdict(list)
+        self._served: Counter = Counter()
+        self._scrubbed: set[str] = set()
+
+        for exchange in exchanges:
+            self._scrubbed.update(
+                key for key, value in exchange["query"].items() if value == SCRUBBED
+            )
+        for exchange in exchanges:
+            loose = (exchange["service"], exchange["method"], _path(exchange))
+            exact = loose + (_query(exchange["query"], self._scrubbed),)
+            self._exact[exact].append(exchange)
+            self._loose[loose].append(exchange)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/_stats", self.stats)
+        app.router.add_post("/_stats/reset", self.reset_stats)
+        app.router.add_get(MM_PATH, self.musixmatch)
+        app.router.add_route("*", API_PREFIX + "{path:.*}", self.spotify)
+        return app
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "total": sum(self.calls.values()),
+                "endpoints": dict(self.calls),
+                "unmatched": dict(self.unmatched),
+            }
+        )
+
+    async def reset_stats(self, request: web.Request) -> web.Response:
+        self.calls.clear()
+        self.unmatched.clear()
+        return web.json_response({})
+
+    def _next(self, key: tuple, candidates: list[dict[str, Any]]) -> dict[str, Any]:
+        index = min(self._served[key], len(candidates) - 1)
+        self._served[key] += 1
+        return candidates[index]
+
+    async def _answer(
+        self, service: str, request: web.Request, path: str
+    ) -> web.Response:
+        loose = (service, request.method, path)
+        exact = loose + (_query(dict(request.query), self._scrubbed),)
+        self.calls[f"{request.method} {service}:{path}"] += 1
+
+        if exact in self._exact:
+            exchange = self._next(exact, self._exact[exact])
+        elif loose in self._loose:
+            exchange = self._next(loose, self._loose[loose])
+        else:
+            self.unmatched[f"{request.method} {path}"] += 1
+            return web.json_response(
+                {"error": {"status": 404, "message": "Not in capture"}}, status=404
+            )
+
+        await asyncio.sleep(exchange["duration"] * self.speed)
+        if exchange["body"] is None:
+            return web.Response(status=exchange["status"])
+
+        ## Paging links point at Spotify, send the client back to the replay
+        body = json.dumps(exchange["body"]).replace(
+            SPOTIFY_API_BASE, f"{self.base_url}{API_PREFIX}"
+        )
+        headers = {"ETag": exchange["etag"]} if exchange.get("etag") else None
+        return web.Response(
+            text=body,
+            status=exchange["status"],
+            content_type="application/json" if service == "spotify" else "text/plain",
+            headers=headers,
+        )
+
+    async def spotify(self, request: web.Request) -> web.Response:
+        return await self._answer(
+            "spotify", request, request.match_info["path"].strip("/")
+        )
+
+    async def musixmatch(self, request: web.Request) -> web.Response:
+        return await self._answer("musixmatch", request, "track.get")
+
+
+async def start_server(
+    capture: Path, speed: float, host: str = "127.0.0.1", port: int = 0
+) -> tuple[web.AppRunner, ReplayServer, str]:
+    """Start a replay server and return its runner, app and base URL."""
+    replay = ReplayServer(load_capture(capture), speed)
+    runner = web.AppRunner(replay.app())
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    replay.base_url = f"http://{host}:{runner.addresses[0][1]}"
+    return runner, replay, replay.base_url
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", type=Path)
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    async def serve() -> None:
+        _runner, replay, base_url = await start_server(
+            args.capture, args.speed, port=args.port
+        )
+        print(f"Replaying {args.capture} at {base_url}{API_PREFIX}")
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
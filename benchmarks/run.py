@@ -0,0 +1,416 @@
+"""Run the service handlers end to end against the fake Spotify server.
+
+Each handler runs on a fresh client stack (connection pool, scheduler,
+response cache, catalog store and metrics) against a synthetic account of
+the chosen size, and the run reports wall time, API calls, peak Python
+memory and executor thread use. Repeated runs reuse the stack, so the
+first run is cold and later runs show the effect of the caches. With
+``--replay`` the handlers run against a recorded capture instead.
+
+    python -m benchmarks.run --sizes small,medium --latency 0.03
+    python -m benchmarks.run --replay capture.jsonl --speed 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+import json
+import multiprocessing
+from pathlib import Path
+import sys
+import tempfile
+import threading
+from time import perf_counter, time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from homeassistant.core import HomeAssistant
+
+from benchmarks import replay
+from benchmarks.fake_spotify import (
+    HISTORY_PLAYLIST_ID,
+    MM_PATH,
+    USER_ID,
+    SyntheticAccount,
+    start_server,
+)
+from custom_components.spotify_plus import (
+    HomeAssistantSpotifyData,
+    _async_create_websession,
+    lyrics,
+)
+from custom_components.spotify_plus.analysis import SpotifyHistoryAnalysis
+from custom_components.spotify_plus.api import SpotifyApiClient
+from custom_components.spotify_plus.artists import (
+    SpotifyMyArtists,
+    SpotifyTopArtists,
+)
+from custom_components.spotify_plus.catalog import CatalogStore
+from custom_components.spotify_plus.const import (
+    DEFAULT_POOL_SIZE,
+    SCHEDULER_BURST,
+    SCHEDULER_RATE,
+    SPOTIFY_SCOPES,
+)
+from custom_components.spotify_plus.coordinator import PlaybackCoordinator
+from custom_components.spotify_plus.metrics import ApiMetrics
+from custom_components.spotify_plus.playlists import SpotifyPlaylists
+from custom_components.spotify_plus.scheduler import RequestScheduler
+from custom_components.spotify_plus.search import SpotifySearch
+from custom_components.spotify_plus.songdata import SpotifySongData
+from custom_components.spotify_plus.tools import SpotifyMusicMachine
+
+## Synthetic account shapes, from a light user to a heavy collector
+SIZES = {
+    "small": {"playlists": 10, "followed_artists": 50, "history_tracks": 1000},
+    "medium": {"playlists": 200, "followed_artists": 500, "history_tracks": 5000},
+    "large": {"playlists": 2000, "followed_artists": 5000, "history_tracks": 12000},
+}
+
+## Handler name: (entity factory, method name, service call data)
+HANDLERS: dict[str, tuple[Callable[[HomeAssistantSpotifyData], Any], str, dict]] = {
+    "spotify_playlists": (
+        lambda data: SpotifyPlaylists(data, USER_ID, "Bench", "US"),
+        "spotify_playlists",
+        {},
+    ),
+    "spotify_my_artists": (
+        lambda data: SpotifyMyArtists(data, USER_ID, "Bench", "US"),
+        "spotify_my_artists",
+        {},
+    ),
+    "spotify_top_artists": (
+        lambda data: SpotifyTopArtists(data, USER_ID, "Bench", "US"),
+        "spotify_top_artists",
+        {},
+    ),
+    "spotify_history_analysis": (
+        lambda data: SpotifyHistoryAnalysis(
+            data, USER_ID, "Bench", "US", HISTORY_PLAYLIST_ID
+        ),
+        "spotify_history_analysis",
+        {},
+    ),
+    "spotify_search": (
+        lambda data: SpotifySearch(data, USER_ID, "Bench", "US"),
+        "spotify_search",
+        {"search_term": "Artist 42", "search_type": "Artist Profile"},
+    ),
+    "get_song_data": (
+        lambda data: SpotifySongData(data, USER_ID, "Bench", "US", "bench"),
+        "get_song_data",
+        {},
+    ),
+    "spotify_music_machine": (
+        lambda data: SpotifyMusicMachine(data, USER_ID, "Bench", "US"),
+        "spotify_music_machine",
+        {"name": "Benchmark Mix", "play_now": False},
+    ),
+}
+
+
+class StaticAuth:
+    """Never expiring token standing in for the OAuth session and refresher."""
+
+    def __init__(self) -> None:
+        self.token = {
+            "access_token": "benchmark",
+            "scope": " ".join(SPOTIFY_SCOPES),
+            "expires_at": time() + 365 * 24 * 60 * 60,
+        }
+
+    @property
+    def access_token(self) -> str:
+        return self.token["access_token"]
+
+    @property
+    def expires_in(self) -> float:
+        return self.token["expires_at"] - time()
+
+    async def async_ensure_valid(self) -> None:
+        return None
+
+    async def async_refresh(self) -> None:
+        return None
+
+
+@dataclass
+class RunResult:
+    """Costs of one handler run."""
+
+    handler: str
+    size: str
+    run: int
+    wall_s: float
+    api_calls: int
+    peak_mem_mib: float | None
+    peak_threads: int
+    executor_jobs: int
+    error: str | None = None
+
+
+def _serve(source: SyntheticAccount | Path, delay: float, ready: Any) -> None:
+    """Run the fake or replay server in its own process so it is not measured."""
+
+    async def serve() -> None:
+        if isinstance(source, Path):
+            _runner, _app, base_url = await replay.start_server(source, delay)
+        else:
+            _runner, _app, base_url = await start_server(source, delay)
+        ready.put(base_url)
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+class ThreadSampler:
+    """Track the highest number of live threads while a run is active."""
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+        self.peak = 0
+
+    async def _sample(self) -> None:
+        while True:
+            self.peak = max(self.peak, threading.active_count())
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        self.peak = threading.active_count()
+        self._task = asyncio.create_task(self._sample())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+
+async def _build_data(
+    hass: HomeAssistant, base_url: str, args: argparse.Namespace, workdir: str
+) -> tuple[HomeAssistantSpotifyData, list[Callable[[], Any]]]:
+    """Create the client stack the integration would build for an entry."""
+    auth = StaticAuth()
+    websession = _async_create_websession(args.pool_size)
+    scheduler = RequestScheduler(args.pool_size, rate=args.rate, burst=args.burst)
+    catalog = CatalogStore(hass, str(Path(workdir) / "catalog.db"))
+    await catalog.async_setup()
+    metrics = ApiMetrics()
+    client = SpotifyApiClient(
+        auth, websession, scheduler, catalog, metrics, api_base=f"{base_url}/v1/"
+    )
+    current_user = await client.me()
+    playback = PlaybackCoordinator(hass, client, "Bench", current_user["id"])
+    await playback.async_refresh()
+    data = HomeAssistantSpotifyData(
+        client=client,
+        current_user=current_user,
+        devices=SimpleNamespace(data=[]),
+        playback=playback,
+        session=auth,
+        auth=auth,
+        websession=websession,
+        scheduler=scheduler,
+        catalog=catalog,
+        metrics=metrics,
+    )
+    return data, [websession.close, catalog.async_close]
+
+
+async def _server_calls(base_url: str, reset: bool = False) -> int:
+    async with aiohttp.ClientSession() as session:
+        if reset:
+            async with session.post(f"{base_url}/_stats/reset"):
+                return 0
+        async with session.get(f"{base_url}/_stats") as response:
+            return (await response.json())["total"]
+
+
+async def run_handler(
+    hass: HomeAssistant,
+    base_url: str,
+    size: str,
+    name: str,
+    args: argparse.Namespace,
+) -> list[RunResult]:
+    """Run one handler on a fresh client stack, repeating as requested."""
+    factory, method, call_data = HANDLERS[name]
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        data, cleanups = await _build_data(hass, base_url, args, workdir)
+        entity = factory(data)
+        entity.hass = hass
+        entity.async_write_ha_state = lambda: None
+        handler = getattr(entity, method)
+
+        executor_jobs = 0
+        add_executor_job = hass.async_add_executor_job
+
+        def counting_executor_job(target, *target_args):
+            nonlocal executor_jobs
+            executor_jobs += 1
+            return add_executor_job(target, *target_args)
+
+        hass.async_add_executor_job = counting_executor_job
+        try:
+            for run in range(1, args.repeat + 1):
+                await _server_calls(base_url, reset=True)
+                executor_jobs = 0
+                sampler = ThreadSampler()
+                if args.memory:
+                    tracemalloc.start()
+                sampler.start()
+                error = None
+                started = perf_counter()
+                try:
+                    await handler(SimpleNamespace(data=dict(call_data)))
+                except Exception as err:  # pylint: disable=broad-except
+                    error = f"{type(err).__name__}: {err}"
+                wall = perf_counter() - started
+                sampler.stop()
+                peak_mem = None
+                if args.memory:
+                    peak_mem = tracemalloc.get_traced_memory()[1] / 2**20
+                    tracemalloc.stop()
+
+                results.append(
+                    RunResult(
+                        handler=name,
+                        size=size,
+                        run=run,
+                        wall_s=round(wall, 3),
+                        api_calls=await _server_calls(base_url),
+                        peak_mem_mib=None if peak_mem is None else round(peak_mem, 2),
+                        peak_threads=sampler.peak,
+                        executor_jobs=executor_jobs,
+                        error=error,
+                    )
+                )
+        finally:
+            hass.async_add_executor_job = add_executor_job
+            for cleanup in cleanups:
+                await cleanup()
+    return results
+
+
+def _print_table(results: list[RunResult]) -> None:
+    header = (
+        f"{'handler':<26}{'size':<8}{'run':>4}{'wall s':>10}{'calls':>8}"
+        f"{'peak MiB':>10}{'threads':>9}{'exec':>6}"
+    )
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        memory = "-" if result.peak_mem_mib is None else f"{result.peak_mem_mib:.2f}"
+        print(
+            f"{result.handler:<26}{result.size:<8}{result.run:>4}"
+            f"{result.wall_s:>10.3f}{result.api_calls:>8}{memory:>10}"
+            f"{result.peak_threads:>9}{result.executor_jobs:>6}"
+            + (f"  ERROR {result.error}" if result.error else "")
+        )
+
+
+async def main(args: argparse.Namespace) -> list[RunResult]:
+    hass = HomeAssistant(tempfile.mkdtemp(prefix="spotify_plus_bench_"))
+    results: list[RunResult] = []
+    context = multiprocessing.get_context("spawn")
+
+    if args.replay:
+        sources = [("replay", args.replay, args.speed)]
+    else:
+        sources = [
+            (size, SyntheticAccount(**SIZES[size], seed=args.seed), args.latency)
+            for size in args.sizes
+        ]
+
+    for size, source, delay in sources:
+        ready = context.Queue()
+        server = context.Process(
+            target=_serve, args=(source, delay, ready), daemon=True
+        )
+        server.start()
+        try:
+            base_url = ready.get(timeout=60)
+            lyrics.MM_API = f"{base_url}{MM_PATH}"
+            for name in args.handlers:
+                results.extend(await run_handler(hass, base_url, size, name, args))
+        finally:
+            server.terminate()
+            server.join()
+
+    await hass.async_stop(force=True)
+    return results
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default="small,medium,large",
+        type=lambda value: value.split(","),
+        help=f"account sizes to run, from {', '.join(SIZES)}",
+    )
+    parser.add_argument(
+        "--handlers",
+        default=",".join(HANDLERS),
+        type=lambda value: value.split(","),
+        help="comma separated service handlers to run",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.03, help="seconds added per response"
+    )
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        help="serve a capture file instead of a synthetic account",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="replay delay factor, 1 keeps the recorded timing and 0 removes it",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="runs per stack")
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE)
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=SCHEDULER_RATE,
+        help="scheduler requests per second, raise it to take rate limiting out",
+    )
+    parser.add_argument("--burst", type=int, default=SCHEDULER_BURST)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--no-memory",
+        dest="memory",
+        action="store_false",
+        help="skip tracemalloc, which slows runs down",
+    )
+    parser.add_argument("--json", type=Path, help="also write results to a file")
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        if size not in SIZES:
+            parser.error(f"unknown size {size}")
+    for name in args.handlers:
+        if name not in HANDLERS:
+            parser.error(f"unknown handler {name}")
+    return args
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    run_results = asyncio.run(main(arguments))
+    _print_table(run_results)
+    if arguments.json:
+        arguments.json.write_text(
+            json.dumps([asdict(result) for result in run_results], indent=2)
+        )
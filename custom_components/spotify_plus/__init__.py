@@ -1,26 +1,44 @@
 """Spotify Tools Custom Component."""
+
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any
 
 import aiohttp
-import requests
-from spotipy import Spotify, SpotifyException
+from spotipy import SpotifyException
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.config_entry_oauth2_flow import (
     OAuth2Session,
     async_get_config_entry_implementation,
 )
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-
-from .const import DOMAIN, _LOGGER, SPOTIFY_SCOPES
+from homeassistant.util.ssl import get_default_context
+
+from .api import SpotifyApiClient
+from .auth import TokenRefresher
+from .capture import CaptureRecorder, capture_path
+from .catalog import CatalogStore
+from .const import (
+    DOMAIN,
+    _LOGGER,
+    DEFAULT_POOL_SIZE,
+    POOL_DNS_CACHE_TTL,
+    POOL_KEEPALIVE_TIMEOUT,
+    SPOTIFY_SCOPES,
+)
+from .coordinator import PlaybackCoordinator
+from .library import LibraryIndex
+from .metrics import ApiMetrics
+from .scheduler import RequestScheduler
 
 CONFIG_SCHEMA = cv.removed(DOMAIN, raise_if_present=False)
 PLATFORMS = [Platform.SENSOR, Platform.MEDIA_PLAYER]
@@ -30,17 +48,61 @@ PLATFORMS = [Platform.SENSOR, Platform.MEDIA_PLAYER]
 class HomeAssistantSpotifyData:
     """Spotify data stored in the Home Assistant data object."""
 
-    client: Spotify
+    client: SpotifyApiClient
     current_user: dict[str, Any]
     devices: DataUpdateCoordinator[list[dict[str, Any]]]
+    playback: PlaybackCoordinator
     session: OAuth2Session
+    auth: TokenRefresher
+    websession: aiohttp.ClientSession
+    scheduler: RequestScheduler
+    catalog: CatalogStore
+    metrics: ApiMetrics
+
+
+def _async_create_websession(pool_size: int) -> aiohttp.ClientSession:
+    """Create the keep-alive connection pool shared by all calls of an entry."""
+    connector = aiohttp.TCPConnector(
+        limit=pool_size,
+        keepalive_timeout=POOL_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=POOL_DNS_CACHE_TTL,
+        ssl=get_default_context(),
+    )
+    return aiohttp.ClientSession(connector=connector)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Spotify integration."""
+
+    async def capture_start(call: ServiceCall) -> None:
+        """Record API traffic of every account to a capture file."""
+        for entry_id, data in hass.data.get(DOMAIN, {}).items():
+            if data.client.recorder is None:
+                data.client.recorder = CaptureRecorder(
+                    hass, capture_path(hass, entry_id), data.client.api_base
+                )
+                _LOGGER.info("Spotify capture started: %s", data.client.recorder.path)
+
+        if duration := call.data.get("duration"):
+            async_call_later(hass, float(duration), capture_stop)
+
+    async def capture_stop(_call: Any = None) -> None:
+        """Stop recording and write the capture files."""
+        for data in hass.data.get(DOMAIN, {}).values():
+            await _async_stop_capture(data)
+
+    hass.services.async_register(DOMAIN, "spotify_capture_start", capture_start)
+    hass.services.async_register(DOMAIN, "spotify_capture_stop", capture_stop)
     return True
 
 
+async def _async_stop_capture(data: "HomeAssistantSpotifyData") -> None:
+    """Stop the capture of an entry if one is running."""
+    if (recorder := data.client.recorder) is not None:
+        data.client.recorder = None
+        await recorder.async_stop()
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Spotify from a config entry."""
     implementation = await async_get_config_entry_implementation(hass, entry)
@@ -51,28 +113,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except aiohttp.ClientError as err:
         raise ConfigEntryNotReady from err
 
-    spotify = Spotify(auth=session.token["access_token"])
+    pool_size = int(entry.options.get("connection_pool_size", DEFAULT_POOL_SIZE))
+    websession = _async_create_websession(pool_size)
+    entry.async_on_unload(websession.close)
+    scheduler = RequestScheduler(max_in_flight=pool_size)
+    catalog = CatalogStore(
+        hass, hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry.entry_id}.catalog.db")
+    )
+    await catalog.async_setup()
+    entry.async_on_unload(catalog.async_close)
+    auth = TokenRefresher(hass, session)
+    auth.async_start()
+    entry.async_on_unload(auth.async_stop)
+    metrics = ApiMetrics()
+    spotify = SpotifyApiClient(auth, websession, scheduler, catalog, metrics)
 
     try:
-        current_user = await hass.async_add_executor_job(spotify.me)
-    except SpotifyException as err:
+        current_user = await spotify.me()
+    except (aiohttp.ClientError, SpotifyException) as err:
         raise ConfigEntryNotReady from err
 
     if not current_user:
         raise ConfigEntryNotReady
 
     async def _update_devices() -> list[dict[str, Any]]:
-        if not session.valid_token:
-            await session.async_ensure_token_valid()
-            await hass.async_add_executor_job(
-                spotify.set_auth, session.token["access_token"]
-            )
-
         try:
-            devices: dict[str, Any] | None = await hass.async_add_executor_job(
-                spotify.devices
-            )
-        except (requests.RequestException, SpotifyException) as err:
+            devices: dict[str, Any] | None = await spotify.devices()
+        except (aiohttp.ClientError, SpotifyException) as err:
             raise UpdateFailed from err
 
         if devices is None:
@@ -80,23 +147,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         return devices.get("devices", [])
 
-    device_coordinator: DataUpdateCoordinator[
-        list[dict[str, Any]]
-    ] = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=f"{entry.title} Devices",
-        update_interval=timedelta(seconds=150),
-        update_method=_update_devices,
+    device_coordinator: DataUpdateCoordinator[list[dict[str, Any]]] = (
+        DataUpdateCoordinator(
+            hass,
+            _LOGGER,
+            name=f"{entry.title} Devices",
+            update_interval=timedelta(seconds=150),
+            update_method=_update_devices,
+        )
     )
     await device_coordinator.async_config_entry_first_refresh()
 
+    playback_coordinator = PlaybackCoordinator(
+        hass, spotify, entry.title, current_user["id"]
+    )
+    await playback_coordinator.async_config_entry_first_refresh()
+
+    library = LibraryIndex(hass, spotify, entry.entry_id)
+    await library.async_load()
+    spotify.library = library
+    library.async_start()
+    entry.async_on_unload(library.async_stop)
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = HomeAssistantSpotifyData(
         client=spotify,
         current_user=current_user,
         devices=device_coordinator,
+        playback=playback_coordinator,
         session=session,
+        auth=auth,
+        websession=websession,
+        scheduler=scheduler,
+        catalog=catalog,
+        metrics=metrics,
     )
 
     if not set(session.token["scope"].split(" ")).issuperset(SPOTIFY_SCOPES):
@@ -109,5 +193,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload Spotify config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        await _async_stop_capture(hass.data[DOMAIN][entry.entry_id])
         del hass.data[DOMAIN][entry.entry_id]
     return unload_ok
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, Optional
 from collections import defaultdict
-import requests
+import aiohttp
 from spotipy import SpotifyException
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
@@ -20,7 +20,7 @@ def spotify_exception_handler(func):
             result = await func(self, *args, **kwargs)
             self._attr_available = True
             return result
-        except requests.RequestException:
+        except aiohttp.ClientError:
             self._attr_available = False
         except SpotifyException as exc:
             self._attr_available = False
@@ -103,8 +103,7 @@ class SpotifyHistoryAnalysis(RestoreEntity):
         playlist_items = []
 
         ## Fetch Playlist Metadata
-        playlist_details = await self.hass.async_add_executor_job(
-            self.data.client.playlist_items,
+        playlist_details = await self.data.client.playlist_items(
             self._history_playlist_id,
             "items(track(artists(name))), next",
             100,
@@ -112,13 +111,11 @@ class SpotifyHistoryAnalysis(RestoreEntity):
             self._user_country,
         )
 
-        playlist_items = playlist_details["items"]
+        playlist_items = list(playlist_details["items"])
 
         ## Return all playlist items
         while playlist_details["next"]:
-            playlist_details = await self.hass.async_add_executor_job(
-                self.data.client.next, playlist_details
-            )
+            playlist_details = await self.data.client.next(playlist_details)
             playlist_items += playlist_details["items"]
 
         ## Count Artists
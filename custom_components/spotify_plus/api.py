@@ -0,0 +1,953 @@
+"""Asyncio client for the Spotify Web API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import json
+from time import monotonic
+from typing import Any
+
+import aiohttp
+from spotipy import SpotifyException
+
+from .auth import TokenRefresher
+from .batcher import IdBatcher
+from .cache import ResponseCache, cache_ttl
+from .capture import CaptureRecorder
+from .catalog import CatalogStore
+from .const import (
+    _LOGGER,
+    API_DEFAULT_RETRY_AFTER,
+    API_MAX_RETRIES,
+    BATCH_MAX_ARTISTS,
+    BATCH_MAX_AUDIO_FEATURES,
+    BATCH_MAX_CONTAINS_ALBUMS,
+    BATCH_MAX_CONTAINS_ARTISTS,
+    BATCH_MAX_CONTAINS_TRACKS,
+    BATCH_MAX_TRACKS,
+    PAGE_MAX_ALBUM_TRACKS,
+    SPOTIFY_API_BASE,
+)
+from .library import LibraryIndex
+from .metrics import ApiMetrics, endpoint_name
+from .scheduler import RequestScheduler
+
+API_TIMEOUT = aiohttp.ClientTimeout(total=20)
+
+AUDIO_FEATURE_ATTRIBUTES = [
+    "acousticness",
+    "danceability",
+    "duration_ms",
+    "energy",
+    "instrumentalness",
+    "key",
+    "liveness",
+    "loudness",
+    "mode",
+    "popularity",
+    "speechiness",
+    "tempo",
+    "time_signature",
+    "valence",
+]
+
+
+def _get_id(kind: str, value: str) -> str:
+    """Return the bare Spotify ID from an ID, URI or open.spotify.com URL."""
+    fields = value.split(":")
+    if len(fields) >= 3 and fields[-2] == kind:
+        return fields[-1]
+    fields = value.split("/")
+    if len(fields) >= 3 and fields[-2] == kind:
+        return fields[-1].split("?")[0]
+    return value
+
+
+def _get_uri(kind: str, value: str) -> str:
+    """Return a Spotify URI for an ID, URI or open.spotify.com URL."""
+    if value.startswith("spotify:"):
+        return value
+    return f"spotify:{kind}:{_get_id(kind, value)}"
+
+
+def _retry_after(response: aiohttp.ClientResponse) -> float:
+    """Return the delay requested by a 429 response in seconds."""
+    try:
+        return max(float(response.headers["Retry-After"]), 0)
+    except (KeyError, ValueError):
+        return API_DEFAULT_RETRY_AFTER
+
+
+def _join_ids(kind: str, values: list[str] | None) -> str:
+    """Return a comma separated list of bare Spotify IDs."""
+    return ",".join(_get_id(kind, value) for value in values or [])
+
+
+class SpotifyApiClient:
+    """Spotify Web API client running on the event loop.
+
+    Method names and arguments follow spotipy so call sites read the same,
+    but every request is a coroutine on the shared aiohttp session instead
+    of a blocking call in an executor thread.
+    """
+
+    def __init__(
+        self,
+        auth: TokenRefresher,
+        websession: aiohttp.ClientSession,
+        scheduler: RequestScheduler,
+        catalog: CatalogStore | None = None,
+        metrics: ApiMetrics | None = None,
+        api_base: str = SPOTIFY_API_BASE,
+    ) -> None:
+        """Initialize."""
+        self._auth = auth
+        self._websession = websession
+        self._scheduler = scheduler
+        self._catalog = catalog
+        self._metrics = metrics or ApiMetrics()
+        self._api_base = api_base
+        self._in_flight: dict[tuple[str, tuple], asyncio.Future] = {}
+        self._cache = ResponseCache()
+        self._batchers: dict[str, IdBatcher] = {}
+        self.recorder: CaptureRecorder | None = None
+        self.library: LibraryIndex | None = None
+
+    @property
+    def api_base(self) -> str:
+        """Return the base URL requests are sent to."""
+        return self._api_base
+
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Return response cache counters."""
+        return {
+            "entries": len(self._cache),
+            "hits": self._cache.hits,
+            "revalidated": self._cache.revalidated,
+            "misses": self._cache.misses,
+            "in_flight": len(self._in_flight),
+        }
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        payload: Any = None,
+        cache: bool = True,
+    ) -> Any:
+        """Perform a request and return the decoded JSON body.
+
+        Catalog GETs are served from the response cache while fresh, and
+        identical GET requests made while one is already running share that
+        request and its result, so results must be treated as read-only.
+        With ``cache`` off a GET always goes to Spotify on its own.
+        """
+        if not url.startswith("http"):
+            url = f"{self._api_base}{url}"
+
+        if params:
+            params = {
+                key: str(value).lower() if isinstance(value, bool) else value
+                for key, value in params.items()
+                if value is not None
+            }
+
+        if method != "GET":
+            _status, _etag, data = await self._send(method, url, params, payload)
+            ## Writes make cached reads of the same resource stale
+            resource = "/".join(self._path(url).split("/")[:2])
+            self._cache.invalidate(f"{self._api_base}{resource}")
+            return data
+
+        if not cache:
+            _status, _etag, data = await self._send(method, url, params)
+            return data
+
+        key = (url, tuple(sorted((params or {}).items())))
+        if (entry := self._cache.get(key)) is not None and entry.fresh:
+            self._cache.hits += 1
+            return entry.body
+
+        if (pending := self._in_flight.get(key)) is None:
+            pending = asyncio.ensure_future(self._fetch(key, url, params))
+            self._in_flight[key] = pending
+            pending.add_done_callback(lambda task: self._forget(key, task))
+        else:
+            _LOGGER.debug("Joining in-flight request %s", url)
+
+        return await asyncio.shield(pending)
+
+    def _path(self, url: str) -> str:
+        """Return the endpoint path of a URL relative to the API base."""
+        return url.removeprefix(self._api_base).split("?")[0]
+
+    def _forget(self, key: tuple[str, tuple], task: asyncio.Future) -> None:
+        """Drop a finished shared request."""
+        self._in_flight.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every waiter went away
+            task.exception()
+
+    async def _fetch(
+        self, key: tuple[str, tuple], url: str, params: dict[str, Any] | None
+    ) -> Any:
+        """GET a resource, revalidating a stale cached copy by ETag."""
+        if (ttl := cache_ttl(self._path(url))) is None:
+            _status, _etag, data = await self._send("GET", url, params)
+            return data
+
+        entry = self._cache.get(key)
+        status, etag, data = await self._send(
+            "GET", url, params, etag=entry.etag if entry else None
+        )
+        if status == 304 and entry is not None:
+            self._cache.revalidated += 1
+            self._cache.refresh(key, ttl)
+            return entry.body
+
+        self._cache.misses += 1
+        self._cache.set(key, data, etag, ttl)
+        return data
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        payload: Any = None,
+        etag: str | None = None,
+    ) -> tuple[int, str | None, Any]:
+        """Send a request through the scheduler, retrying throttled calls.
+
+        Returns the status, the ETag and the decoded body of the response.
+        """
+        await self._auth.async_ensure_valid()
+
+        reauthorized = False
+        endpoint = f"{method} {endpoint_name(self._path(url))}"
+        with self._metrics.measure("spotify", endpoint) as call:
+            for _attempt in range(API_MAX_RETRIES + 1):
+                headers = {"Authorization": f"Bearer {self._auth.access_token}"}
+                if etag is not None:
+                    headers["If-None-Match"] = etag
+                try:
+                    async with self._scheduler.slot():
+                        sent = monotonic()
+                        async with self._websession.request(
+                            method,
+                            url,
+                            params=params,
+                            json=payload,
+                            headers=headers,
+                            timeout=API_TIMEOUT,
+                        ) as response:
+                            body = await response.read()
+                except asyncio.TimeoutError as err:
+                    raise aiohttp.ServerTimeoutError(
+                        f"Timeout requesting {url}"
+                    ) from err
+
+                if self.recorder is not None:
+                    self.recorder.record(
+                        "spotify",
+                        method,
+                        url,
+                        params,
+                        response.status,
+                        response.headers.get("ETag"),
+                        body,
+                        sent,
+                        monotonic() - sent,
+                    )
+
+                if response.status == 401 and not reauthorized:
+                    ## Token revoked or expired early, refresh once and retry
+                    reauthorized = True
+                    await self._auth.async_refresh()
+                    continue
+
+                if response.status != 429:
+                    break
+
+                self._scheduler.record_throttled(_retry_after(response))
+
+            call.status = response.status
+            call.size = len(body)
+            call.retries = _attempt
+
+        _LOGGER.debug("Spotify %s %s returned %s", method, url, response.status)
+
+        if response.status >= 400:
+            raise self._exception(response, url, body)
+
+        self._scheduler.record_success()
+
+        data = json.loads(body) if body and response.status not in (204, 304) else None
+        return response.status, response.headers.get("ETag"), data
+
+    @staticmethod
+    def _exception(
+        response: aiohttp.ClientResponse, url: str, body: bytes
+    ) -> SpotifyException:
+        """Build a SpotifyException from an error response."""
+        message = "error"
+        reason = None
+        try:
+            error = json.loads(body)["error"]
+            if isinstance(error, dict):
+                message = error.get("message", message)
+                reason = error.get("reason")
+            else:
+                message = str(error)
+        except (ValueError, KeyError, TypeError):
+            pass
+
+        return SpotifyException(
+            response.status,
+            -1,
+            f"{url}:\n {message}",
+            reason=reason,
+            headers=dict(response.headers),
+        )
+
+    async def _get(self, url: str, **params: Any) -> Any:
+        """Perform a GET request."""
+        return await self._request("GET", url, params)
+
+    async def _get_uncached(self, url: str, **params: Any) -> Any:
+        """Perform a GET request that bypasses the response cache."""
+        return await self._request("GET", url, params, cache=False)
+
+    async def _post(self, url: str, payload: Any = None, **params: Any) -> Any:
+        """Perform a POST request."""
+        return await self._request("POST", url, params, payload)
+
+    async def _put(self, url: str, payload: Any = None, **params: Any) -> Any:
+        """Perform a PUT request."""
+        return await self._request("PUT", url, params, payload)
+
+    async def _delete(self, url: str, payload: Any = None, **params: Any) -> Any:
+        """Perform a DELETE request."""
+        return await self._request("DELETE", url, params, payload)
+
+    def _batcher(
+        self,
+        name: str,
+        max_size: int,
+        fetch: Callable[[list[str]], Awaitable[list[Any]]],
+    ) -> IdBatcher:
+        """Return the batcher collecting lookups of one endpoint."""
+        if (batcher := self._batchers.get(name)) is None:
+            batcher = self._batchers[name] = IdBatcher(fetch, max_size)
+        return batcher
+
+    async def _catalog_lookup(
+        self,
+        kind: str,
+        ids: list[str],
+        fetch: Callable[[list[str]], Awaitable[list[Any]]],
+    ) -> list[Any]:
+        """Return catalog objects by ID, fetching only those not stored on disk."""
+        found = await self._catalog.async_get_many(kind, ids) if self._catalog else {}
+        if missing := [
+            item_id for item_id in dict.fromkeys(ids) if item_id not in found
+        ]:
+            fetched = {
+                item_id: item
+                for item_id, item in zip(missing, await fetch(missing))
+                if item is not None
+            }
+            found.update(fetched)
+            if self._catalog:
+                await self._catalog.async_set_many(kind, fetched)
+        return [found.get(item_id) for item_id in ids]
+
+    async def _library_contains(
+        self, kind: str, ids: list[str], batcher: IdBatcher
+    ) -> list[bool]:
+        """Answer a contains check from the library index when it is synced."""
+        if self.library is not None:
+            if (found := self.library.contains(kind, ids)) is not None:
+                return found
+        return await batcher.get_many(ids)
+
+    def _library_update(
+        self, kind: str, id_kind: str, values: list[str], saved: bool
+    ) -> None:
+        """Apply a save or removal to the library index."""
+        if self.library is not None:
+            self.library.async_update(
+                kind, [_get_id(id_kind, value) for value in values], saved
+            )
+
+    async def next(self, result: dict[str, Any]) -> dict[str, Any] | None:
+        """Return the next page of a paged result."""
+        if result.get("next"):
+            return await self._get(result["next"])
+        return None
+
+    ## User profile and library
+
+    async def me(self) -> dict[str, Any]:
+        """Return the current user profile."""
+        return await self._get("me")
+
+    async def current_user_followed_artists(
+        self, limit: int = 20, after: str | None = None
+    ) -> dict[str, Any]:
+        """Return artists followed by the current user."""
+        return await self._get("me/following", type="artist", limit=limit, after=after)
+
+    async def current_user_following_artists(
+        self, ids: list[str] | None = None
+    ) -> list[bool]:
+        """Check if the current user follows the given artists."""
+
+        async def fetch(batch: list[str]) -> list[bool]:
+            return await self._get(
+                "me/following/contains", type="artist", ids=",".join(batch)
+            )
+
+        return await self._library_contains(
+            "artists",
+            [_get_id("artist", artist) for artist in ids or []],
+            self._batcher("following_artists", BATCH_MAX_CONTAINS_ARTISTS, fetch),
+        )
+
+    async def user_follow_artists(self, ids: list[str]) -> None:
+        """Follow artists."""
+        await self._put("me/following", type="artist", ids=_join_ids("artist", ids))
+        self._library_update("artists", "artist", ids, True)
+
+    async def user_unfollow_artists(self, ids: list[str]) -> None:
+        """Unfollow artists."""
+        await self._delete("me/following", type="artist", ids=_join_ids("artist", ids))
+        self._library_update("artists", "artist", ids, False)
+
+    async def current_user_saved_tracks(
+        self, limit: int = 20, offset: int = 0, market: str | None = None
+    ) -> dict[str, Any]:
+        """Return tracks saved in the current user library."""
+        return await self._get("me/tracks", limit=limit, offset=offset, market=market)
+
+    async def current_user_saved_tracks_contains(
+        self, tracks: list[str] | None = None
+    ) -> list[bool]:
+        """Check if tracks are saved in the current user library."""
+
+        async def fetch(batch: list[str]) -> list[bool]:
+            return await self._get("me/tracks/contains", ids=",".join(batch))
+
+        return await self._library_contains(
+            "tracks",
+            [_get_id("track", track) for track in tracks or []],
+            self._batcher("saved_tracks", BATCH_MAX_CONTAINS_TRACKS, fetch),
+        )
+
+    async def current_user_saved_tracks_add(self, tracks: list[str]) -> None:
+        """Save tracks to the current user library."""
+        await self._put("me/tracks", ids=_join_ids("track", tracks))
+        self._library_update("tracks", "track", tracks, True)
+
+    async def current_user_saved_tracks_delete(self, tracks: list[str]) -> None:
+        """Remove tracks from the current user library."""
+        await self._delete("me/tracks", ids=_join_ids("track", tracks))
+        self._library_update("tracks", "track", tracks, False)
+
+    async def current_user_saved_albums(
+        self, limit: int = 20, offset: int = 0, market: str | None = None
+    ) -> dict[str, Any]:
+        """Return albums saved in the current user library."""
+        return await self._get("me/albums", limit=limit, offset=offset, market=market)
+
+    async def current_user_saved_albums_contains(
+        self, albums: list[str] | None = None
+    ) -> list[bool]:
+        """Check if albums are saved in the current user library."""
+
+        async def fetch(batch: list[str]) -> list[bool]:
+            return await self._get("me/albums/contains", ids=",".join(batch))
+
+        return await self._library_contains(
+            "albums",
+            [_get_id("album", album) for album in albums or []],
+            self._batcher("saved_albums", BATCH_MAX_CONTAINS_ALBUMS, fetch),
+        )
+
+    async def current_user_saved_albums_add(self, albums: list[str]) -> None:
+        """Save albums to the current user library."""
+        await self._put("me/albums", ids=_join_ids("album", albums))
+        self._library_update("albums", "album", albums, True)
+
+    async def current_user_saved_albums_delete(self, albums: list[str]) -> None:
+        """Remove albums from the current user library."""
+        await self._delete("me/albums", ids=_join_ids("album", albums))
+        self._library_update("albums", "album", albums, False)
+
+    async def current_user_playlists(
+        self, limit: int = 50, offset: int = 0
+    ) -> dict[str, Any]:
+        """Return playlists owned or followed by the current user."""
+        return await self._get("me/playlists", limit=limit, offset=offset)
+
+    async def current_user_follow_playlist(
+        self, playlist_id: str, public: bool = True
+    ) -> None:
+        """Follow a playlist."""
+        return await self._put(
+            f"playlists/{_get_id('playlist', playlist_id)}/followers",
+            payload={"public": public},
+        )
+
+    async def current_user_unfollow_playlist(self, playlist_id: str) -> None:
+        """Unfollow a playlist."""
+        return await self._delete(
+            f"playlists/{_get_id('playlist', playlist_id)}/followers"
+        )
+
+    async def current_user_recently_played(
+        self, limit: int = 50, after: int | None = None, before: int | None = None
+    ) -> dict[str, Any]:
+        """Return the recently played tracks of the current user."""
+        return await self._get(
+            "me/player/recently-played", limit=limit, after=after, before=before
+        )
+
+    async def current_user_top_artists(
+        self, limit: int = 20, offset: int = 0, time_range: str = "medium_term"
+    ) -> dict[str, Any]:
+        """Return the top artists of the current user."""
+        return await self._get(
+            "me/top/artists", time_range=time_range, limit=limit, offset=offset
+        )
+
+    async def current_user_top_tracks(
+        self, limit: int = 20, offset: int = 0, time_range: str = "medium_term"
+    ) -> dict[str, Any]:
+        """Return the top tracks of the current user."""
+        return await self._get(
+            "me/top/tracks", time_range=time_range, limit=limit, offset=offset
+        )
+
+    ## Player
+
+    async def devices(self) -> dict[str, Any]:
+        """Return the available playback devices."""
+        return await self._get("me/player/devices")
+
+    async def current_playback(
+        self, market: str | None = None, additional_types: str | None = None
+    ) -> dict[str, Any] | None:
+        """Return the current playback state."""
+        return await self._get(
+            "me/player", market=market, additional_types=additional_types
+        )
+
+    async def currently_playing(
+        self, market: str | None = None, additional_types: str | None = None
+    ) -> dict[str, Any] | None:
+        """Return the currently playing item."""
+        return await self._get(
+            "me/player/currently-playing",
+            market=market,
+            additional_types=additional_types,
+        )
+
+    async def queue(self) -> dict[str, Any]:
+        """Return the playback queue."""
+        return await self._get("me/player/queue")
+
+    async def start_playback(
+        self,
+        device_id: str | None = None,
+        context_uri: str | None = None,
+        uris: list[str] | None = None,
+        offset: dict[str, Any] | None = None,
+        position_ms: int | None = None,
+    ) -> None:
+        """Start or resume playback."""
+        payload: dict[str, Any] = {}
+        if context_uri is not None:
+            payload["context_uri"] = context_uri
+        if uris is not None:
+            payload["uris"] = uris
+        if offset is not None:
+            payload["offset"] = offset
+        if position_ms is not None:
+            payload["position_ms"] = position_ms
+        return await self._put("me/player/play", payload=payload, device_id=device_id)
+
+    async def pause_playback(self, device_id: str | None = None) -> None:
+        """Pause playback."""
+        return await self._put("me/player/pause", device_id=device_id)
+
+    async def next_track(self, device_id: str | None = None) -> None:
+        """Skip to the next track."""
+        return await self._post("me/player/next", device_id=device_id)
+
+    async def previous_track(self, device_id: str | None = None) -> None:
+        """Skip to the previous track."""
+        return await self._post("me/player/previous", device_id=device_id)
+
+    async def seek_track(self, position_ms: int, device_id: str | None = None) -> None:
+        """Seek to a position in the current track."""
+        return await self._put(
+            "me/player/seek", position_ms=position_ms, device_id=device_id
+        )
+
+    async def volume(self, volume_percent: int, device_id: str | None = None) -> None:
+        """Set the playback volume."""
+        return await self._put(
+            "me/player/volume", volume_percent=volume_percent, device_id=device_id
+        )
+
+    async def shuffle(self, state: bool, device_id: str | None = None) -> None:
+        """Toggle shuffle."""
+        return await self._put("me/player/shuffle", state=state, device_id=device_id)
+
+    async def repeat(self, state: str, device_id: str | None = None) -> None:
+        """Set the repeat mode."""
+        return await self._put("me/player/repeat", state=state, device_id=device_id)
+
+    async def transfer_playback(self, device_id: str, force_play: bool = True) -> None:
+        """Transfer playback to another device."""
+        return await self._put(
+            "me/player", payload={"device_ids": [device_id], "play": force_play}
+        )
+
+    ## Catalog
+
+    async def track(
+        self, track_id: str, market: str | None = None
+    ) -> dict[str, Any] | None:
+        """Return a single track."""
+        return (await self.tracks([track_id], market))["tracks"][0]
+
+    async def tracks(
+        self, tracks: list[str], market: str | None = None
+    ) -> dict[str, Any]:
+        """Return several tracks."""
+
+        async def fetch(ids: list[str]) -> list[Any]:
+            results = await self._get("tracks", ids=",".join(ids), market=market)
+            return results["tracks"]
+
+        batcher = self._batcher(f"tracks:{market}", BATCH_MAX_TRACKS, fetch)
+        ids = [_get_id("track", track) for track in tracks]
+        return {"tracks": await self._catalog_lookup("track", ids, batcher.get_many)}
+
+    async def audio_features(self, tracks: list[str]) -> list[dict[str, Any] | None]:
+        """Return audio features for several tracks."""
+
+        async def fetch(ids: list[str]) -> list[Any]:
+            results = await self._get("audio-features", ids=",".join(ids))
+            return (results or {}).get("audio_features", [])
+
+        batcher = self._batcher("audio_features", BATCH_MAX_AUDIO_FEATURES, fetch)
+        ids = [_get_id("track", track) for track in tracks]
+        return await self._catalog_lookup("audio_features", ids, batcher.get_many)
+
+    async def artist(self, artist_id: str) -> dict[str, Any] | None:
+        """Return a single artist."""
+        return (await self.artists([artist_id]))["artists"][0]
+
+    async def artists(self, artists: list[str]) -> dict[str, Any]:
+        """Return several artists."""
+
+        async def fetch(ids: list[str]) -> list[Any]:
+            results = await self._get("artists", ids=",".join(ids))
+            return results["artists"]
+
+        batcher = self._batcher("artists", BATCH_MAX_ARTISTS, fetch)
+        ids = [_get_id("artist", artist) for artist in artists]
+        return {"artists": await self._catalog_lookup("artist", ids, batcher.get_many)}
+
+    async def artist_albums(
+        self,
+        artist_id: str,
+        album_type: str | None = None,
+        country: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Return the albums of an artist."""
+        return await self._get(
+            f"artists/{_get_id('artist', artist_id)}/albums",
+            include_groups=album_type,
+            country=country,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def artist_related_artists(self, artist_id: str) -> dict[str, Any]:
+        """Return artists related to an artist."""
+        return await self._get(
+            f"artists/{_get_id('artist', artist_id)}/related-artists"
+        )
+
+    async def artist_top_tracks(
+        self, artist_id: str, country: str = "US"
+    ) -> dict[str, Any]:
+        """Return the top tracks of an artist."""
+        return await self._get(
+            f"artists/{_get_id('artist', artist_id)}/top-tracks", country=country
+        )
+
+    async def album_all_tracks(
+        self, album_id: str, market: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Return every track of an album, pages after the first in parallel."""
+        album_id = _get_id("album", album_id)
+        url = f"albums/{album_id}/tracks"
+
+        async def fetch(_keys: list[str]) -> list[Any]:
+            first = await self._get(url, limit=PAGE_MAX_ALBUM_TRACKS, market=market)
+            pages = await asyncio.gather(
+                *(
+                    self._get(
+                        url, limit=PAGE_MAX_ALBUM_TRACKS, offset=offset, market=market
+                    )
+                    for offset in range(
+                        PAGE_MAX_ALBUM_TRACKS, first["total"], PAGE_MAX_ALBUM_TRACKS
+                    )
+                )
+            )
+            return [[item for page in (first, *pages) for item in page["items"]]]
+
+        ## Stored whole, so a full album costs one local read
+        (items,) = await self._catalog_lookup(
+            "album_tracks", [f"{album_id}:all"], fetch
+        )
+        return items
+
+    async def search(
+        self,
+        q: str,
+        limit: int = 10,
+        offset: int = 0,
+        type: str = "track",  # pylint: disable=redefined-builtin
+        market: str | None = None,
+    ) -> dict[str, Any]:
+        """Search the catalog."""
+        return await self._get(
+            "search", q=q, limit=limit, offset=offset, type=type, market=market
+        )
+
+    ## Browse and recommendations
+
+    async def categories(
+        self,
+        country: str | None = None,
+        locale: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Return browse categories."""
+        return await self._get(
+            "browse/categories",
+            country=country,
+            locale=locale,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def category_playlists(
+        self,
+        category_id: str,
+        country: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Return the playlists of a browse category."""
+        return await self._get(
+            f"browse/categories/{category_id}/playlists",
+            country=country,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def recommendation_genre_seeds(self) -> dict[str, Any]:
+        """Return the genres usable as recommendation seeds."""
+        return await self._get("recommendations/available-genre-seeds")
+
+    async def recommendations(
+        self,
+        seed_artists: list[str] | None = None,
+        seed_genres: list[str] | None = None,
+        seed_tracks: list[str] | None = None,
+        limit: int = 20,
+        country: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Return recommendations for the given seeds and tunable attributes."""
+        params: dict[str, Any] = {"limit": limit, "market": country}
+        if seed_artists:
+            params["seed_artists"] = _join_ids("artist", seed_artists)
+        if seed_genres:
+            params["seed_genres"] = ",".join(seed_genres)
+        if seed_tracks:
+            params["seed_tracks"] = _join_ids("track", seed_tracks)
+        for attribute in AUDIO_FEATURE_ATTRIBUTES:
+            for prefix in ("min_", "max_", "target_"):
+                if (param := f"{prefix}{attribute}") in kwargs:
+                    params[param] = kwargs[param]
+        return await self._get("recommendations", **params)
+
+    ## Playlists
+
+    async def playlist(
+        self,
+        playlist_id: str,
+        fields: str | None = None,
+        market: str | None = None,
+        additional_types: tuple[str, ...] = ("track",),
+        cache: bool = True,
+    ) -> dict[str, Any]:
+        """Return a playlist."""
+        get = self._get if cache else self._get_uncached
+        return await get(
+            f"playlists/{_get_id('playlist', playlist_id)}",
+            fields=fields,
+            market=market,
+            additional_types=",".join(additional_types),
+        )
+
+    async def playlist_items(
+        self,
+        playlist_id: str,
+        fields: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        market: str | None = None,
+        additional_types: tuple[str, ...] = ("track", "episode"),
+        cache: bool = True,
+    ) -> dict[str, Any]:
+        """Return a page of playlist items."""
+        get = self._get if cache else self._get_uncached
+        return await get(
+            f"playlists/{_get_id('playlist', playlist_id)}/tracks",
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            market=market,
+            additional_types=",".join(additional_types),
+        )
+
+    async def playlist_is_following(
+        self, playlist_id: str, user_ids: list[str]
+    ) -> list[bool]:
+        """Check if users follow a playlist."""
+        return await self._get(
+            f"playlists/{_get_id('playlist', playlist_id)}/followers/contains",
+            ids=",".join(user_ids),
+        )
+
+    async def playlist_add_items(
+        self, playlist_id: str, items: list[str], position: int | None = None
+    ) -> dict[str, Any]:
+        """Add items to a playlist."""
+        return await self._post(
+            f"playlists/{_get_id('playlist', playlist_id)}/tracks",
+            payload={"uris": [_get_uri("track", item) for item in items]},
+            position=position,
+        )
+
+    async def playlist_remove_all_occurrences_of_items(
+        self, playlist_id: str, items: list[str], snapshot_id: str | None = None
+    ) -> dict[str, Any]:
+        """Remove every occurrence of the given items from a playlist."""
+        payload: dict[str, Any] = {
+            "tracks": [{"uri": _get_uri("track", item)} for item in items]
+        }
+        if snapshot_id:
+            payload["snapshot_id"] = snapshot_id
+        return await self._delete(
+            f"playlists/{_get_id('playlist', playlist_id)}/tracks", payload=payload
+        )
+
+    async def playlist_remove_specific_occurrences_of_items(
+        self,
+        playlist_id: str,
+        items: list[dict[str, Any]],
+        snapshot_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Remove items at positions, each ``{"uri": ..., "positions": [...]}``."""
+        payload: dict[str, Any] = {
+            "tracks": [
+                {"uri": _get_uri("track", item["uri"]), "positions": item["positions"]}
+                for item in items
+            ]
+        }
+        if snapshot_id:
+            payload["snapshot_id"] = snapshot_id
+        return await self._delete(
+            f"playlists/{_get_id('playlist', playlist_id)}/tracks", payload=payload
+        )
+
+    async def playlist_change_details(
+        self,
+        playlist_id: str,
+        name: str | None = None,
+        public: bool | None = None,
+        collaborative: bool | None = None,
+        description: str | None = None,
+    ) -> None:
+        """Change the details of a playlist."""
+        payload: dict[str, Any] = {}
+        if name is not None:
+            payload["name"] = name
+        if isinstance(public, bool):
+            payload["public"] = public
+        if isinstance(collaborative, bool):
+            payload["collaborative"] = collaborative
+        if description is not None:
+            payload["description"] = description
+        return await self._put(
+            f"playlists/{_get_id('playlist', playlist_id)}", payload=payload
+        )
+
+    async def user_playlist_create(
+        self,
+        user: str,
+        name: str,
+        public: bool = True,
+        collaborative: bool = False,
+        description: str = "",
+    ) -> dict[str, Any]:
+        """Create a playlist for a user."""
+        return await self._post(
+            f"users/{user}/playlists",
+            payload={
+                "name": name,
+                "public": public,
+                "collaborative": collaborative,
+                "description": description,
+            },
+        )
+
+    async def user_playlist_add_tracks(
+        self,
+        user: str,  # pylint: disable=unused-argument
+        playlist_id: str,
+        tracks: list[str],
+        position: int | None = None,
+    ) -> dict[str, Any]:
+        """Add tracks to a playlist, spotipy compatible signature."""
+        return await self.playlist_add_items(playlist_id, tracks, position)
+
+    async def user_playlist_change_details(
+        self,
+        user: str,  # pylint: disable=unused-argument
+        playlist_id: str,
+        name: str | None = None,
+        public: bool | None = None,
+        collaborative: bool | None = None,
+        description: str | None = None,
+    ) -> None:
+        """Change the details of a playlist, spotipy compatible signature."""
+        return await self.playlist_change_details(
+            playlist_id, name, public, collaborative, description
+        )
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, Optional
 import asyncio
-import requests
+import aiohttp
 from spotipy import SpotifyException
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.entity import DeviceInfo
@@ -20,7 +20,7 @@ def spotify_exception_handler(func):
             result = await func(self, *args, **kwargs)
             self._attr_available = True
             return result
-        except requests.RequestException:
+        except aiohttp.ClientError:
             self._attr_available = False
         except SpotifyException as exc:
             self._attr_available = False
@@ -85,57 +85,55 @@ class SpotifyMyArtists(RestoreEntity):
         """Return the state attributes of the sensor."""
         return self._extra_attributes
 
-    async def search_playlists_async(self, semaphore, artist):
+    async def search_playlists_async(self, artist):
         """Search for Artist Playlists."""
-        async with semaphore:
-            artist_playlist_uri_1 = "spotify:"
-            artist_playlist_uri_2 = "spotify:"
-            artist_playlist_name_1 = "N/A"
-            artist_playlist_name_2 = "N/A"
-
-            artist_name = artist.get("name", "")
-            if not artist_name:
-                _LOGGER.error("Artist name missing")
-                return
-
-            search_param = artist_name.lower()
-            pl1 = f"This Is {artist_name}"
-            pl2 = f"{artist_name} Radio"
-
-            srch = await self.hass.async_add_executor_job(
-                self.data.client.search,
-                search_param,
-                20,
-                0,
-                "playlist",
-                self._user_country,
-            )
-            
-            playlists = srch.get("playlists", {}).get("items")
-            if playlists is None or not isinstance(playlists, list):
-                _LOGGER.error("Playlists are missing or not a list")
-                return
-
-            for p_list in playlists:
-                owner = p_list.get("owner")
-                if owner is not None and isinstance(owner, dict) and owner.get("id") == "spotify":
-                    p_list_name = p_list.get("name")
-                    if p_list_name == pl1:
-                        artist_playlist_uri_1 = p_list.get("uri")
-                        artist_playlist_name_1 = p_list_name
-                    elif p_list_name == pl2:
-                        artist_playlist_uri_2 = p_list.get("uri")
-                        artist_playlist_name_2 = p_list_name
-
-            return {
-                "name": artist.get("name"),
-                "uri": artist.get("uri"),
-                "image": artist.get("images", [{}])[0].get("url"),
-                "artist_playlist_name": artist_playlist_name_1,
-                "artist_playlist": artist_playlist_uri_1,
-                "artist_radio_name": artist_playlist_name_2,
-                "artist_radio": artist_playlist_uri_2,
-            }
+        artist_playlist_uri_1 = "spotify:"
+        artist_playlist_uri_2 = "spotify:"
+        artist_playlist_name_1 = "N/A"
+        artist_playlist_name_2 = "N/A"
+
+        artist_name = artist.get("name", "")
+        if not artist_name:
+            _LOGGER.error("Artist name missing")
+            return
+
+        search_param = artist_name.lower()
+        pl1 = f"This Is {artist_name}"
+        pl2 = f"{artist_name} Radio"
+
+        srch = await self.data.client.search(
+            search_param, 20, 0, "playlist", self._user_country
+        )
+
+        playlists = srch.get("playlists", {}).get("items")
+        if playlists is None or not isinstance(playlists, list):
+            _LOGGER.error("Playlists are missing or not a list")
+            return
+
+        for p_list in playlists:
+            owner = p_list.get("owner")
+            if (
+                owner is not None
+                and isinstance(owner, dict)
+                and owner.get("id") == "spotify"
+            ):
+                p_list_name = p_list.get("name")
+                if p_list_name == pl1:
+                    artist_playlist_uri_1 = p_list.get("uri")
+                    artist_playlist_name_1 = p_list_name
+                elif p_list_name == pl2:
+                    artist_playlist_uri_2 = p_list.get("uri")
+                    artist_playlist_name_2 = p_list_name
+
+        return {
+            "name": artist.get("name"),
+            "uri": artist.get("uri"),
+            "image": artist.get("images", [{}])[0].get("url"),
+            "artist_playlist_name": artist_playlist_name_1,
+            "artist_playlist": artist_playlist_uri_1,
+            "artist_radio_name": artist_playlist_name_2,
+            "artist_radio": artist_playlist_uri_2,
+        }
 
     @spotify_exception_handler
     async def spotify_my_artists(self, call):
@@ -143,22 +141,17 @@ class SpotifyMyArtists(RestoreEntity):
         artist_items = []
         artists = []
 
-        my_artists = await self.hass.async_add_executor_job(
-            self.data.client.current_user_followed_artists, 50
-        )
-        artist_items = my_artists["artists"]["items"]
+        my_artists = await self.data.client.current_user_followed_artists(50)
+        artist_items = list(my_artists["artists"]["items"])
 
         while my_artists["artists"]["next"]:
             cur = my_artists["artists"]["cursors"]["after"]
-            my_artists = await self.hass.async_add_executor_job(
-                self.data.client.current_user_followed_artists, 50, cur
-            )
+            my_artists = await self.data.client.current_user_followed_artists(50, cur)
             artist_items += my_artists["artists"]["items"]
 
-        semaphore = asyncio.Semaphore(6)
         tasks = []
         for artist in artist_items:
-            tasks.append(self.search_playlists_async(semaphore, artist))
+            tasks.append(self.search_playlists_async(artist))
         artist_results = await asyncio.gather(*tasks)
 
         artists = sorted(
@@ -228,57 +221,55 @@ class SpotifyTopArtists(RestoreEntity):
         return self._extra_attributes
 
     @spotify_exception_handler
-    async def search_playlists_async(self, semaphore, artist):
+    async def search_playlists_async(self, artist):
         """Search for Artist Playlists."""
-        async with semaphore:
-            artist_playlist_uri_1 = "spotify:"
-            artist_playlist_uri_2 = "spotify:"
-            artist_playlist_name_1 = "N/A"
-            artist_playlist_name_2 = "N/A"
-
-            artist_name = artist.get("name", "")
-            if not artist_name:
-                _LOGGER.error("Artist name missing")
-                return
-
-            search_param = artist_name.lower()
-            pl1 = f"This Is {artist_name}"
-            pl2 = f"{artist_name} Radio"
-
-            srch = await self.hass.async_add_executor_job(
-                self.data.client.search,
-                search_param,
-                20,
-                0,
-                "playlist",
-                self._user_country,
-            )
-            
-            playlists = srch.get("playlists", {}).get("items")
-            if playlists is None or not isinstance(playlists, list):
-                _LOGGER.error("Playlists are missing or not a list")
-                return
-
-            for p_list in playlists:
-                owner = p_list.get("owner")
-                if owner is not None and isinstance(owner, dict) and owner.get("id") == "spotify":
-                    p_list_name = p_list.get("name")
-                    if p_list_name == pl1:
-                        artist_playlist_uri_1 = p_list.get("uri")
-                        artist_playlist_name_1 = p_list_name
-                    elif p_list_name == pl2:
-                        artist_playlist_uri_2 = p_list.get("uri")
-                        artist_playlist_name_2 = p_list_name
-
-            return {
-                "name": artist.get("name"),
-                "uri": artist.get("uri"),
-                "image": artist.get("images", [{}])[0].get("url"),
-                "artist_playlist_name": artist_playlist_name_1,
-                "artist_playlist": artist_playlist_uri_1,
-                "artist_radio_name": artist_playlist_name_2,
-                "artist_radio": artist_playlist_uri_2,
-            }
+        artist_playlist_uri_1 = "spotify:"
+        artist_playlist_uri_2 = "spotify:"
+        artist_playlist_name_1 = "N/A"
+        artist_playlist_name_2 = "N/A"
+
+        artist_name = artist.get("name", "")
+        if not artist_name:
+            _LOGGER.error("Artist name missing")
+            return
+
+        search_param = artist_name.lower()
+        pl1 = f"This Is {artist_name}"
+        pl2 = f"{artist_name} Radio"
+
+        srch = await self.data.client.search(
+            search_param, 20, 0, "playlist", self._user_country
+        )
+
+        playlists = srch.get("playlists", {}).get("items")
+        if playlists is None or not isinstance(playlists, list):
+            _LOGGER.error("Playlists are missing or not a list")
+            return
+
+        for p_list in playlists:
+            owner = p_list.get("owner")
+            if (
+                owner is not None
+                and isinstance(owner, dict)
+                and owner.get("id") == "spotify"
+            ):
+                p_list_name = p_list.get("name")
+                if p_list_name == pl1:
+                    artist_playlist_uri_1 = p_list.get("uri")
+                    artist_playlist_name_1 = p_list_name
+                elif p_list_name == pl2:
+                    artist_playlist_uri_2 = p_list.get("uri")
+                    artist_playlist_name_2 = p_list_name
+
+        return {
+            "name": artist.get("name"),
+            "uri": artist.get("uri"),
+            "image": artist.get("images", [{}])[0].get("url"),
+            "artist_playlist_name": artist_playlist_name_1,
+            "artist_playlist": artist_playlist_uri_1,
+            "artist_radio_name": artist_playlist_name_2,
+            "artist_radio": artist_playlist_uri_2,
+        }
 
     @spotify_exception_handler
     async def spotify_top_artists(self, call):
@@ -289,18 +280,13 @@ class SpotifyTopArtists(RestoreEntity):
         ## This is a bit of a hack. The endpoint is only supposed
         ## to return 50 artists, but if you set the offset to 49
         ## and request the max limit of 50, you can get 99 artists
-        my_artists = await self.hass.async_add_executor_job(
-            self.data.client.current_user_top_artists, 49, 0
-        )
-        my_artists2 = await self.hass.async_add_executor_job(
-            self.data.client.current_user_top_artists, 50, 49
-        )
+        my_artists = await self.data.client.current_user_top_artists(49, 0)
+        my_artists2 = await self.data.client.current_user_top_artists(50, 49)
         artist_items = my_artists["items"] + my_artists2["items"]
 
-        semaphore = asyncio.Semaphore(8)
         tasks = []
         for artist in artist_items:
-            tasks.append(self.search_playlists_async(semaphore, artist))
+            tasks.append(self.search_playlists_async(artist))
         artist_results = await asyncio.gather(*tasks)
 
         artists = sorted(
@@ -0,0 +1,124 @@
+"""Background OAuth token refresh shared by every Spotify call of an entry."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from time import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
+from homeassistant.helpers.event import async_call_later
+
+from .const import _LOGGER, TOKEN_REFRESH_MARGIN, TOKEN_REFRESH_RETRY
+
+
+class TokenRefresher:
+    """Renew the access token ahead of its expiry.
+
+    A timer refreshes the token ``TOKEN_REFRESH_MARGIN`` seconds before it
+    expires and stores it on the config entry, so requests always read a
+    valid token without waiting on the token endpoint. Concurrent refreshes,
+    for example after a 401 while the timer is running, share one call.
+    """
+
+    def __init__(self, hass: HomeAssistant, session: OAuth2Session) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._session = session
+        self._refreshing: asyncio.Task | None = None
+        self._unsub_timer: Callable[[], None] | None = None
+        self._stopped = False
+
+    @property
+    def token(self) -> dict[str, Any]:
+        """Return the current token."""
+        return self._session.token
+
+    @property
+    def access_token(self) -> str:
+        """Return the current access token."""
+        return self._session.token["access_token"]
+
+    @property
+    def expires_in(self) -> float:
+        """Return the seconds left before the current token expires."""
+        return self._session.token["expires_at"] - time()
+
+    @callback
+    def async_start(self) -> None:
+        """Schedule the first refresh."""
+        self._stopped = False
+        self._schedule(self.expires_in - TOKEN_REFRESH_MARGIN)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the refresh timer, a refresh still running schedules none."""
+        self._stopped = True
+        self._cancel_timer()
+
+    @callback
+    def _cancel_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    async def async_ensure_valid(self) -> None:
+        """Refresh inline only if the timer could not keep the token valid."""
+        if self.expires_in <= 0:
+            await self.async_refresh()
+
+    async def async_refresh(self) -> None:
+        """Refresh the token now, joining a refresh already running."""
+        if self._refreshing is None:
+            self._refreshing = self._hass.async_create_task(self._refresh())
+            # Mark the exception as retrieved in case every waiter went away
+            self._refreshing.add_done_callback(
+                lambda task: task.cancelled() or task.exception()
+            )
+        await asyncio.shield(self._refreshing)
+
+    async def _refresh(self) -> None:
+        self._cancel_timer()
+        try:
+            new_token = await self._session.implementation.async_refresh_token(
+                self._session.token
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            ## Any failure, timeouts and malformed responses included, must
+            ## leave a retry behind or the token silently stops renewing
+            _LOGGER.warning("Spotify token refresh failed: %s", err)
+            self._schedule(TOKEN_REFRESH_RETRY)
+            raise
+        finally:
+            self._refreshing = None
+
+        ## Swap the whole token in one update, readers never see a partial one
+        self._hass.config_entries.async_update_entry(
+            self._session.config_entry,
+            data={**self._session.config_entry.data, "token": new_token},
+        )
+        _LOGGER.debug("Spotify token refreshed, valid for %ds", self.expires_in)
+        self._schedule(self.expires_in - TOKEN_REFRESH_MARGIN)
+
+    @callback
+    def _schedule(self, delay: float) -> None:
+        self._cancel_timer()
+        if self._stopped:
+            return
+        self._unsub_timer = async_call_later(
+            self._hass, max(delay, 0), self._async_timer_fired
+        )
+
+    @callback
+    def _async_timer_fired(self, _now: Any) -> None:
+        self._unsub_timer = None
+        self._hass.async_create_task(self._async_timer_refresh())
+
+    async def _async_timer_refresh(self) -> None:
+        try:
+            await self.async_refresh()
+        except Exception:  # pylint: disable=broad-except
+            ## Logged and rescheduled by _refresh
+            pass
@@ -0,0 +1,89 @@
+"""Micro-batching of ID based Spotify lookups."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .const import BATCH_WINDOW
+
+
+class IdBatcher:
+    """Collect ID lookups made within a short window into max size requests.
+
+    Callers ask for any number of IDs and get results in the same order.
+    IDs requested by concurrent callers are merged and deduplicated, then
+    sent in chunks of at most ``max_size`` once the window closes or a full
+    chunk is waiting. ``fetch`` takes a list of IDs and returns one result
+    per ID in the same order.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[list[str]], Awaitable[list[Any]]],
+        max_size: int,
+        window: float = BATCH_WINDOW,
+    ) -> None:
+        """Initialize."""
+        self._fetch = fetch
+        self._max_size = max_size
+        self._window = window
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def get_many(self, ids: list[str]) -> list[Any]:
+        """Return the result for every ID."""
+        if not ids:
+            return []
+
+        loop = asyncio.get_running_loop()
+        futures = []
+        for item_id in ids:
+            future = loop.create_future()
+            self._pending.setdefault(item_id, []).append(future)
+            futures.append(future)
+
+        if len(self._pending) >= self._max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results
+
+    def _flush(self) -> None:
+        """Send every waiting ID in max size chunks."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, {}
+        ids = list(pending)
+        for start in range(0, len(ids), self._max_size):
+            chunk = ids[start : start + self._max_size]
+            asyncio.create_task(
+                self._dispatch(chunk, {item_id: pending[item_id] for item_id in chunk})
+            )
+
+    async def _dispatch(
+        self, ids: list[str], waiters: dict[str, list[asyncio.Future]]
+    ) -> None:
+        """Fetch one chunk and resolve its waiters."""
+        try:
+            results = await self._fetch(ids)
+        except Exception as err:  # pylint: disable=broad-except
+            for futures in waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(err)
+            return
+
+        results = list(results or []) + [None] * (len(ids) - len(results or []))
+        for item_id, result in zip(ids, results):
+            for future in waiters[item_id]:
+                if not future.done():
+                    future.set_result(result)
@@ -0,0 +1,98 @@
+"""In-memory response cache for Spotify catalog endpoints."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import re
+from time import monotonic
+from typing import Any
+
+from .const import (
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL_BROWSE,
+    CACHE_TTL_CATALOG,
+    CACHE_TTL_PLAYLIST,
+    CACHE_TTL_SEARCH,
+)
+
+## First match wins, paths are relative to the API base without query string.
+## Anything not listed (player state, library, recommendations) is never cached.
+CACHE_RULES: list[tuple[re.Pattern, int]] = [
+    (
+        re.compile(r"^artists/[^/]+/(top-tracks|related-artists|albums)$"),
+        CACHE_TTL_BROWSE,
+    ),
+    (re.compile(r"^(tracks|artists|albums|audio-features)(/|$)"), CACHE_TTL_CATALOG),
+    (
+        re.compile(r"^(browse/|recommendations/available-genre-seeds$)"),
+        CACHE_TTL_BROWSE,
+    ),
+    (re.compile(r"^playlists/[^/]+(/tracks)?$"), CACHE_TTL_PLAYLIST),
+    (re.compile(r"^search$"), CACHE_TTL_SEARCH),
+]
+
+
+def cache_ttl(path: str) -> int | None:
+    """Return the cache lifetime of an endpoint in seconds, None if uncached."""
+    for pattern, ttl in CACHE_RULES:
+        if pattern.match(path):
+            return ttl
+    return None
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body."""
+
+    body: Any
+    etag: str | None
+    expires: float
+
+    @property
+    def fresh(self) -> bool:
+        """Return True while the entry can be served without revalidation."""
+        return monotonic() < self.expires
+
+
+class ResponseCache:
+    """Least recently used cache of decoded responses with a TTL per entry."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+        """Initialize."""
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Any, CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def get(self, key: Any) -> CacheEntry | None:
+        """Return an entry, fresh or stale with an ETag, or None."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+        if not entry.fresh and entry.etag is None:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: Any, body: Any, etag: str | None, ttl: int) -> None:
+        """Store a response."""
+        self._entries[key] = CacheEntry(body, etag, monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def refresh(self, key: Any, ttl: int) -> None:
+        """Extend the lifetime of an entry confirmed by a 304 response."""
+        if (entry := self._entries.get(key)) is not None:
+            entry.expires = monotonic() + ttl
+
+    def invalidate(self, prefix: str) -> None:
+        """Drop every entry whose URL starts with prefix."""
+        for key in [key for key in self._entries if key[0].startswith(prefix)]:
+            del self._entries[key]
@@ -0,0 +1,111 @@
+"""Capture of Spotify API traffic for offline replay."""
+
+from __future__ import annotations
+
+import json
+from time import monotonic, time
+from typing import Any
+
+from yarl import URL
+
+from homeassistant.core import HomeAssistant
+
+from .const import _LOGGER, CAPTURE_FLUSH_EVERY
+
+## Keys whose values never leave the process, in queries and response bodies
+SCRUB_KEYS = {"access_token", "refresh_token", "apikey", "code", "client_secret"}
+SCRUBBED = "**REDACTED**"
+
+
+def scrub(value: Any) -> Any:
+    """Return a copy of a decoded body with secrets replaced."""
+    if isinstance(value, dict):
+        return {
+            key: SCRUBBED if key in SCRUB_KEYS else scrub(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [scrub(item) for item in value]
+    return value
+
+
+class CaptureRecorder:
+    """Append every request and response of a client to a JSON lines file.
+
+    Each line holds the service, method, path relative to the API base,
+    query, status, ETag, decoded body, the offset from the start of the
+    capture and the request duration, all in seconds. Authorization headers
+    are never recorded and secrets in queries and bodies are scrubbed. Lines
+    are written by the executor in batches.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str, api_base: str) -> None:
+        """Initialize."""
+        self._hass = hass
+        self.path = path
+        self._api_base = api_base
+        self._started = monotonic()
+        self._buffer: list[str] = []
+        self.count = 0
+
+    def record(
+        self,
+        service: str,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        status: int,
+        etag: str | None,
+        body: bytes,
+        started: float,
+        duration: float,
+    ) -> None:
+        """Add one exchange, started is a monotonic timestamp."""
+        parsed = URL(url)
+        query = {**parsed.query, **{k: str(v) for k, v in (params or {}).items()}}
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            data = body.decode(errors="replace")
+
+        self._buffer.append(
+            json.dumps(
+                {
+                    "service": service,
+                    "method": method,
+                    "path": str(parsed.with_query(None)).removeprefix(self._api_base),
+                    "query": scrub(query),
+                    "status": status,
+                    "etag": etag,
+                    "body": scrub(data),
+                    "offset": round(started - self._started, 4),
+                    "duration": round(duration, 4),
+                },
+                separators=(",", ":"),
+            )
+        )
+        self.count += 1
+        if len(self._buffer) >= CAPTURE_FLUSH_EVERY:
+            self._hass.async_create_task(self.async_flush())
+
+    async def async_flush(self) -> None:
+        """Write buffered exchanges to disk."""
+        lines, self._buffer = self._buffer, []
+        if lines:
+            await self._hass.async_add_executor_job(self._write, lines)
+
+    def _write(self, lines: list[str]) -> None:
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+    async def async_stop(self) -> None:
+        """Flush and report the capture."""
+        await self.async_flush()
+        _LOGGER.info(
+            "Spotify capture of %s requests saved to %s", self.count, self.path
+        )
+
+
+def capture_path(hass: HomeAssistant, entry_id: str) -> str:
+    """Return a new capture file path for an entry."""
+    return hass.config.path(f"spotify_plus_capture_{entry_id}_{int(time())}.jsonl")
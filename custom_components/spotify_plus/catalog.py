@@ -0,0 +1,135 @@
+"""Persistent on-disk store of Spotify catalog objects."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from time import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import _LOGGER, CATALOG_MAX_AGE, CATALOG_MAX_ROWS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS catalog_accessed_at ON catalog (accessed_at);
+"""
+
+
+class CatalogStore:
+    """SQLite store of catalog objects and Musixmatch lyrics links.
+
+    Rows are keyed by object kind and ID, the ISRC for lyrics, and survive
+    restarts, so the first lookups after a reboot are answered locally. The
+    least recently read rows are evicted once the store grows past
+    ``max_rows``. All disk access runs in the executor.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, path: str, max_rows: int = CATALOG_MAX_ROWS
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._path = path
+        self._max_rows = max_rows
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    async def async_setup(self) -> None:
+        """Open the database."""
+        await self._hass.async_add_executor_job(self._open)
+
+    async def async_close(self) -> None:
+        """Close the database."""
+        await self._hass.async_add_executor_job(self._close)
+
+    async def async_get_many(
+        self, kind: str, ids: list[str], max_age: float | None = None
+    ) -> dict[str, Any]:
+        """Return the stored objects of a kind found for the given IDs."""
+        if max_age is None:
+            max_age = CATALOG_MAX_AGE.get(kind)
+        return await self._hass.async_add_executor_job(
+            self._get_many, kind, list(dict.fromkeys(ids)), max_age
+        )
+
+    async def async_set_many(self, kind: str, items: dict[str, Any]) -> None:
+        """Store objects of a kind by ID."""
+        if items:
+            await self._hass.async_add_executor_job(self._set_many, kind, items)
+
+    def _open(self) -> None:
+        with self._lock:
+            try:
+                self._connection = sqlite3.connect(
+                    self._path, check_same_thread=False, isolation_level=None
+                )
+                self._connection.execute("PRAGMA journal_mode=WAL")
+                self._connection.executescript(SCHEMA)
+            except sqlite3.Error as err:
+                _LOGGER.error("Spotify catalog store unavailable: %s", err)
+                self._connection = None
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _get_many(
+        self, kind: str, ids: list[str], max_age: float | None
+    ) -> dict[str, Any]:
+        if self._connection is None or not ids:
+            return {}
+
+        now = time()
+        oldest = now - max_age if max_age is not None else 0
+        found: dict[str, Any] = {}
+        with self._lock:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                rows = self._connection.execute(
+                    f"SELECT id, data FROM catalog WHERE kind = ? AND stored_at >= ? "
+                    f"AND id IN ({','.join('?' * len(chunk))})",
+                    (kind, oldest, *chunk),
+                ).fetchall()
+                found.update((row[0], json.loads(row[1])) for row in rows)
+
+            if found:
+                self._connection.executemany(
+                    "UPDATE catalog SET accessed_at = ? WHERE kind = ? AND id = ?",
+                    [(now, kind, item_id) for item_id in found],
+                )
+        return found
+
+    def _set_many(self, kind: str, items: dict[str, Any]) -> None:
+        if self._connection is None:
+            return
+
+        now = time()
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO catalog VALUES (?, ?, ?, ?, ?)",
+                [
+                    (kind, item_id, json.dumps(item), now, now)
+                    for item_id, item in items.items()
+                ],
+            )
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM catalog"
+            ).fetchone()
+            if count > self._max_rows:
+                self._connection.execute(
+                    "DELETE FROM catalog WHERE rowid IN (SELECT rowid FROM catalog "
+                    "ORDER BY accessed_at LIMIT ?)",
+                    (count - self._max_rows,),
+                )
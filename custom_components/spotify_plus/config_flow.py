@@ -1,4 +1,5 @@
 """Config flow for Spotify."""
+
 from __future__ import annotations
 
 from collections.abc import Mapping
@@ -12,7 +13,13 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_entry_oauth2_flow
 from homeassistant import config_entries
 from homeassistant.core import callback
-from .const import DOMAIN, SPOTIFY_SCOPES
+from .const import (
+    CAPTURE_PERCENT,
+    CAPTURE_SECONDS,
+    DEFAULT_POOL_SIZE,
+    DOMAIN,
+    SPOTIFY_SCOPES,
+)
 
 
 class SpotifyFlowHandler(
@@ -119,6 +126,46 @@ class SpotifySensorOptionsFlow(config_entries.OptionsFlow):
                             "spotify_history_playlist_id", ""
                         ),
                     ): str,
+                    vol.Optional(
+                        "connection_pool_size",
+                        default=self.config_entry.options.get(
+                            "connection_pool_size", DEFAULT_POOL_SIZE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+                    vol.Optional(
+                        "api_stats_sensors",
+                        default=self.config_entry.options.get(
+                            "api_stats_sensors", False
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        "refresh_on_track_change",
+                        default=self.config_entry.options.get(
+                            "refresh_on_track_change", False
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        "history_capture",
+                        default=self.config_entry.options.get("history_capture", False),
+                    ): bool,
+                    vol.Optional(
+                        "history_capture_percent",
+                        default=self.config_entry.options.get(
+                            "history_capture_percent", CAPTURE_PERCENT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                    vol.Optional(
+                        "history_capture_seconds",
+                        default=self.config_entry.options.get(
+                            "history_capture_seconds", CAPTURE_SECONDS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        "history_capture_to_playlist",
+                        default=self.config_entry.options.get(
+                            "history_capture_to_playlist", False
+                        ),
+                    ): bool,
                 }
             ),
         )
@@ -1,4 +1,5 @@
-""" Constants for Spotify Plus."""
+"""Constants for Spotify Plus."""
+
 import logging
 
 from homeassistant.components.media_player import MediaType
@@ -8,7 +9,114 @@ MUSIC_REC_TOLERANCE = 0.20
 MUSIC_REC_TRACK_COUNT = 100
 MUSIC_PLAYLIST_DESC = "Created by Spotify+ Tools for Home Assistant"
 
+EVENT_PLAYBACK_CHANGED = f"{DOMAIN}_playback_changed"
+
 MM_API = "https://api.musixmatch.com/ws/1.1/track.get"
+SPOTIFY_API_BASE = "https://api.spotify.com/v1/"
+
+## Shared HTTP connection pool per config entry
+DEFAULT_POOL_SIZE = 10
+POOL_KEEPALIVE_TIMEOUT = 60
+POOL_DNS_CACHE_TTL = 300
+
+## Access token refresh, seconds before expiry and retry delay after a failure
+TOKEN_REFRESH_MARGIN = 300
+TOKEN_REFRESH_RETRY = 30
+
+## Playback polling in seconds, shared by every entity of an account
+PLAYBACK_SNAPSHOT_MAX_AGE = 2
+PLAYBACK_INTERVAL_FAST = 1
+PLAYBACK_FAST_WINDOW = 10
+PLAYBACK_INTERVAL_PLAYING = 15
+PLAYBACK_INTERVAL_PAUSED = 60
+PLAYBACK_INTERVAL_IDLE = 120
+PLAYBACK_TRACK_END_MARGIN = 1
+PLAYBACK_POSITION_DRIFT = 2
+PLAYBACK_PROGRESS_TICK = 5
+
+## Queue reads retried while a recent command has not shown up yet
+QUEUE_SETTLE_WINDOW = 5
+QUEUE_RETRY_DELAY = 0.5
+QUEUE_RETRIES = 2
+
+## Request scheduling, shared by every call of an account
+SCHEDULER_RATE = 8.0
+SCHEDULER_BURST = 20
+SCHEDULER_MIN_IN_FLIGHT = 2
+SCHEDULER_INCREASE_AFTER = 20
+API_MAX_RETRIES = 3
+API_DEFAULT_RETRY_AFTER = 1.0
+
+## Response cache lifetimes in seconds
+CACHE_MAX_ENTRIES = 512
+CACHE_TTL_CATALOG = 24 * 60 * 60
+CACHE_TTL_BROWSE = 6 * 60 * 60
+CACHE_TTL_SEARCH = 15 * 60
+CACHE_TTL_PLAYLIST = 5 * 60
+
+## Song data enrichment, library flags are re-checked much more often
+SONGDATA_CACHE_MAX_ENTRIES = 256
+SONGDATA_TTL_CATALOG = CACHE_TTL_CATALOG
+SONGDATA_TTL_PLAYLIST = CACHE_TTL_PLAYLIST
+SONGDATA_TTL_LIBRARY = 60
+
+## Look-ahead of queued tracks warmed for song data, wait between idle checks
+PREFETCH_QUEUE_DEPTH = 3
+PREFETCH_IDLE_WAIT = 0.25
+
+## Library index of saved and followed items, seconds
+LIBRARY_PAGE_SIZE = 50
+LIBRARY_SYNC_INTERVAL = 15 * 60
+LIBRARY_FULL_SYNC_AGE = 24 * 60 * 60
+LIBRARY_SAVE_DELAY = 30
+
+## Recently played buffer, plays kept, exposed by Extras and save delay
+RECENT_MAX_ITEMS = 500
+RECENT_PAGE_SIZE = 50
+RECENT_EXTRAS_ITEMS = 30
+RECENT_SAVE_DELAY = 30
+
+## History playlist position index, page size and save delay
+HISTORY_PAGE_SIZE = 100
+HISTORY_SAVE_DELAY = 30
+
+## History write-behind queue, seconds between flushes and tracks per write
+HISTORY_FLUSH_INTERVAL = 30
+HISTORY_WRITE_BATCH = 100
+HISTORY_QUEUE_SAVE_DELAY = 1
+
+## Automatic play capture, default thresholds, plays kept and save delay
+CAPTURE_PERCENT = 50
+CAPTURE_SECONDS = 240
+CAPTURE_MAX_ITEMS = 1000
+CAPTURE_SAVE_DELAY = 30
+
+## ID lookup batching, window in seconds and Spotify's per request maximums
+BATCH_WINDOW = 0.02
+BATCH_MAX_ARTISTS = 50
+BATCH_MAX_TRACKS = 50
+BATCH_MAX_AUDIO_FEATURES = 100
+BATCH_MAX_CONTAINS_TRACKS = 50
+BATCH_MAX_CONTAINS_ALBUMS = 20
+BATCH_MAX_CONTAINS_ARTISTS = 50
+PAGE_MAX_ALBUM_TRACKS = 50
+
+## Call metrics, latencies kept per endpoint
+METRICS_WINDOW = 500
+
+## Traffic capture, exchanges buffered before each write
+CAPTURE_FLUSH_EVERY = 50
+
+## Persistent catalog store, ages in seconds (None keeps rows until evicted)
+CATALOG_MAX_ROWS = 20000
+CATALOG_MAX_AGE = {
+    "track": 30 * 24 * 60 * 60,
+    "audio_features": None,
+    "artist": 24 * 60 * 60,
+    "album_tracks": 30 * 24 * 60 * 60,
+    "lyrics": 30 * 24 * 60 * 60,
+    "lyrics_miss": 24 * 60 * 60,
+}
 
 _LOGGER = logging.getLogger(__name__)
 
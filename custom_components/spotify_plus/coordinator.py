@@ -0,0 +1,183 @@
+"""Playback state coordinator shared by every entity of an account."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import timedelta
+from time import monotonic
+from typing import Any
+
+import aiohttp
+from spotipy import SpotifyException
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .api import SpotifyApiClient
+from .const import (
+    _LOGGER,
+    EVENT_PLAYBACK_CHANGED,
+    PLAYBACK_FAST_WINDOW,
+    PLAYBACK_INTERVAL_FAST,
+    PLAYBACK_INTERVAL_IDLE,
+    PLAYBACK_INTERVAL_PAUSED,
+    PLAYBACK_INTERVAL_PLAYING,
+    PLAYBACK_SNAPSHOT_MAX_AGE,
+    PLAYBACK_TRACK_END_MARGIN,
+)
+
+
+def playback_summary(playback: dict[str, Any] | None) -> dict[str, Any]:
+    """Return the track, context and device of a snapshot, None when absent."""
+    playback = playback or {}
+    item = playback.get("item") or {}
+    context = playback.get("context") or {}
+    device = playback.get("device") or {}
+    return {
+        "track": (
+            {
+                "uri": item["uri"],
+                "name": item.get("name"),
+                "artist": (item.get("artists") or [{}])[0].get("name"),
+            }
+            if item.get("uri")
+            else None
+        ),
+        "context": (
+            {"uri": context["uri"], "type": context.get("type")}
+            if context.get("uri")
+            else None
+        ),
+        "device": (
+            {"id": device["id"], "name": device.get("name")}
+            if device.get("id")
+            else None
+        ),
+    }
+
+
+def playback_started(event_data: Mapping[str, Any], user_id: str) -> bool:
+    """Return whether a playback changed event starts a new item or context."""
+    if event_data["user_id"] != user_id:
+        return False
+    return any(
+        event_data[key]["new"] for key in ("track", "context") if key in event_data
+    )
+
+
+class PlaybackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Poll the playback state once and share the snapshot.
+
+    ``data`` is the latest ``me/player`` response, or an empty dict when
+    nothing is playing. The media player listens for updates, while
+    service handlers ask for a recent snapshot with ``async_get_snapshot``
+    instead of making their own playback calls.
+
+    The poll interval follows the playback: slow when idle or paused, just
+    after the predicted end of the current track while playing, and fast
+    for a short window after a command so its effect shows up quickly.
+
+    When the track, context or device differs from the previous snapshot an
+    ``spotify_plus_playback_changed`` event is fired with the changed parts
+    only, each as ``{"old": ..., "new": ...}``.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, client: SpotifyApiClient, name: str, user_id: str
+    ):
+        """Initialize."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{name} Playback",
+            update_interval=timedelta(seconds=PLAYBACK_INTERVAL_PLAYING),
+        )
+        self.client = client
+        self.user_id = user_id
+        self.updated_at = 0.0
+        self.command_at = 0.0
+        self._fast_until = 0.0
+        self._unsub_command_refresh = None
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        try:
+            playback = await self.client.current_playback(
+                additional_types="track,episode"
+            )
+        except (aiohttp.ClientError, SpotifyException) as err:
+            raise UpdateFailed from err
+
+        self.updated_at = monotonic()
+        self.update_interval = timedelta(seconds=self._next_interval(playback))
+        if self.data is not None:
+            self._fire_changes(self.data, playback)
+        return playback or {}
+
+    def _fire_changes(
+        self, old: dict[str, Any] | None, new: dict[str, Any] | None
+    ) -> None:
+        """Fire the playback changed event if the track, context or device changed."""
+        before, after = playback_summary(old), playback_summary(new)
+        changes = {
+            key: {"old": before[key], "new": after[key]}
+            for key in after
+            if before[key] != after[key]
+        }
+        if changes:
+            self.hass.bus.async_fire(
+                EVENT_PLAYBACK_CHANGED,
+                {"user_id": self.user_id, "changed": list(changes), **changes},
+            )
+
+    def _next_interval(self, playback: dict[str, Any] | None) -> float:
+        """Return the seconds until the next poll for a playback state."""
+        if monotonic() < self._fast_until:
+            return PLAYBACK_INTERVAL_FAST
+        if not playback or not playback.get("device"):
+            return PLAYBACK_INTERVAL_IDLE
+        if not playback.get("is_playing"):
+            return PLAYBACK_INTERVAL_PAUSED
+
+        ## Ads carry no item, so there is no end to predict
+        duration = (playback.get("item") or {}).get("duration_ms")
+        if not duration:
+            return PLAYBACK_INTERVAL_PLAYING
+
+        ## Wake up right after the track should have ended
+        remaining = (duration - (playback.get("progress_ms") or 0)) / 1000
+        return max(
+            PLAYBACK_INTERVAL_FAST,
+            min(PLAYBACK_INTERVAL_PLAYING, remaining + PLAYBACK_TRACK_END_MARGIN),
+        )
+
+    @callback
+    def async_note_command(self) -> None:
+        """Poll fast for a short window after a playback command."""
+        self.command_at = monotonic()
+        self._fast_until = self.command_at + PLAYBACK_FAST_WINDOW
+        self.update_interval = timedelta(seconds=PLAYBACK_INTERVAL_FAST)
+        if self._unsub_command_refresh is None:
+            self._unsub_command_refresh = async_call_later(
+                self.hass, PLAYBACK_INTERVAL_FAST, self._async_command_refresh
+            )
+
+    async def _async_command_refresh(self, _now: Any) -> None:
+        self._unsub_command_refresh = None
+        await self.async_refresh()
+
+    @property
+    def age(self) -> float:
+        """Return the seconds since the last successful poll."""
+        return monotonic() - self.updated_at
+
+    async def async_get_snapshot(
+        self, max_age: float = PLAYBACK_SNAPSHOT_MAX_AGE
+    ) -> dict[str, Any] | None:
+        """Return the playback state, polling first if it is older than max_age.
+
+        Returns None when nothing is playing, like ``currently_playing``.
+        """
+        if self.age > max_age:
+            await self.async_refresh()
+        return self.data or None
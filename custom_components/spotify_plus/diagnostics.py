@@ -0,0 +1,42 @@
+"""Diagnostics support for Spotify Plus."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import HomeAssistantSpotifyData
+from .const import DOMAIN
+
+TO_REDACT = {
+    "access_token",
+    "refresh_token",
+    "mm_api_token",
+    "id",
+    "display_name",
+    "email",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: HomeAssistantSpotifyData = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "metrics": data.metrics.as_dict(),
+        "scheduler": {
+            "limit": data.scheduler.limit,
+            "in_flight": data.scheduler.in_flight,
+        },
+        "cache": data.client.cache_stats,
+        "library": data.client.library.counts if data.client.library else None,
+        "token_expires_in": round(data.auth.expires_in),
+    }
@@ -2,10 +2,34 @@
 
 from typing import Any, Dict, Optional
 import asyncio
+from time import monotonic
+import aiohttp
+from spotipy import SpotifyException
+from homeassistant.core import Event
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity import DeviceInfo
 from . import HomeAssistantSpotifyData
-from .const import DOMAIN, _LOGGER
+from .coordinator import playback_started
+from .const import (
+    DOMAIN,
+    _LOGGER,
+    EVENT_PLAYBACK_CHANGED,
+    QUEUE_RETRIES,
+    QUEUE_RETRY_DELAY,
+    QUEUE_SETTLE_WINDOW,
+    RECENT_EXTRAS_ITEMS,
+)
+from .prefetch import QueuePrefetcher
+from .recent import RecentPlays
+
+
+def _queue_key(spotify_queue: dict[str, Any]) -> tuple:
+    """Return the currently playing and queued URIs of a queue response."""
+    return (
+        (spotify_queue.get("currently_playing") or {}).get("uri"),
+        tuple(track.get("uri") for track in spotify_queue.get("queue", [])),
+    )
 
 
 class SpotifyExtras(Entity):
@@ -17,7 +41,13 @@ class SpotifyExtras(Entity):
     _attr_icon = "mdi:newspaper-variant"
 
     def __init__(
-        self, data: HomeAssistantSpotifyData, user_id: str, name: str, user_country: str
+        self,
+        data: HomeAssistantSpotifyData,
+        user_id: str,
+        name: str,
+        user_country: str,
+        refresh_on_change: bool = False,
+        mm_api_token: str | None = None,
     ):
         """Initialize the sensor."""
         self._id = user_id
@@ -26,12 +56,39 @@ class SpotifyExtras(Entity):
         self._user_country = user_country
         self._state = None
         self._extra_attributes: Dict[str, Any] = {}
+        self._refresh_on_change = refresh_on_change
+        self._mm_api_token = mm_api_token or None
+        self._prefetcher: QueuePrefetcher | None = None
+        self._recent: RecentPlays | None = None
+        self._queue_key: tuple | None = None
+        self._queue_at = 0.0
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, user_id)},
         )
 
     async def async_added_to_hass(self):
         self.hass.services.async_register(DOMAIN, "spotify_extras", self.spotify_extras)
+        self._prefetcher = QueuePrefetcher(self.hass, self.data, self._mm_api_token)
+        self.async_on_remove(self._prefetcher.async_cancel)
+        self._recent = RecentPlays(
+            self.hass, self.data.client, self.registry_entry.config_entry_id
+        )
+        await self._recent.async_load()
+        if self._refresh_on_change:
+            self.async_on_remove(
+                self.hass.bus.async_listen(
+                    EVENT_PLAYBACK_CHANGED, self._async_playback_changed
+                )
+            )
+
+    async def _async_playback_changed(self, event: Event) -> None:
+        """Refresh when a new item or context of this account starts."""
+        if not playback_started(event.data, self._id):
+            return
+        try:
+            await self.spotify_extras(None)
+        except (HomeAssistantError, aiohttp.ClientError, SpotifyException) as err:
+            _LOGGER.warning("Extras refresh after playback change failed: %s", err)
 
     @property
     def name(self):
@@ -55,27 +112,58 @@ class SpotifyExtras(Entity):
         """Return the state attributes of the sensor."""
         return self._extra_attributes
 
+    def _queue_stale(self, spotify_queue: dict[str, Any]) -> bool:
+        """Return whether a queue read still predates the last playback command."""
+        playback = self.data.playback
+        if monotonic() - playback.command_at > QUEUE_SETTLE_WINDOW:
+            return False
+
+        ## A poll after the command already knows what is playing
+        current = (spotify_queue.get("currently_playing") or {}).get("uri")
+        if playback.updated_at > playback.command_at:
+            playing = ((playback.data or {}).get("item") or {}).get("uri")
+            if playing and playing != current:
+                return True
+
+        ## Otherwise an unchanged queue after the command is suspect
+        unchanged = self._queue_key == _queue_key(spotify_queue)
+        return unchanged and self._queue_at < playback.command_at
+
+    async def _async_queue(self) -> dict[str, Any]:
+        """Read the queue, again only while it looks stale after a command."""
+        spotify_queue = await self.data.client.queue()
+        for _ in range(QUEUE_RETRIES):
+            if not self._queue_stale(spotify_queue):
+                break
+            _LOGGER.debug("Queue not settled after a command, reading again")
+            await asyncio.sleep(QUEUE_RETRY_DELAY)
+            spotify_queue = await self.data.client.queue()
+
+        self._queue_key = _queue_key(spotify_queue)
+        self._queue_at = monotonic()
+        return spotify_queue
+
     async def spotify_extras(self, call):
         """Get Queue and Recent items"""
-        # Apparently the queue needs a cooldown after a change?
-        await asyncio.sleep(1)
-
-        ## Fetch queue and 30 recent items
+        ## Fetch queue and the plays since the last refresh
         try:
-            spotify_queue, spotify_recent = await asyncio.gather(
-                self.hass.async_add_executor_job(self.data.client.queue),
-                self.hass.async_add_executor_job(
-                    self.data.client.current_user_recently_played, 30
-                ),
+            spotify_queue, recent_plays = await asyncio.gather(
+                self._async_queue(),
+                self._recent.async_update(),
             )
         except Exception as err:
             _LOGGER.error("Spotify Queue and Recent Error: %s", err)
             spotify_queue = {"queue": []}
-            spotify_recent = {"items": []}
+            recent_plays = self._recent.plays
+
+        ## Warm song data for the next tracks while the lists are built
+        self._prefetcher.async_schedule(spotify_queue.get("queue", []))
 
         ## Build Queue Data
         queue_list = []
         for track in spotify_queue.get("queue", []):
+            if track.get("type") != "track":
+                continue
             try:
                 track_dict = {
                     "trackname": track["name"],
@@ -90,9 +178,7 @@ class SpotifyExtras(Entity):
 
         ## Bulk check if items are in library, merge with queue items
         uris = [track["trackuri"] for track in queue_list]
-        check_follow = await self.hass.async_add_executor_job(
-            self.data.client.current_user_saved_tracks_contains, uris
-        )
+        check_follow = await self.data.client.current_user_saved_tracks_contains(uris)
 
         for track, value in zip(queue_list, check_follow):
             track["saved"] = value
@@ -100,25 +186,20 @@ class SpotifyExtras(Entity):
         _LOGGER.debug("Queue Retrieved")
 
         ## Build Recent Items Data
-        recent_list = []
-        for item in spotify_recent.get("items", []):
-            try:
-                track_dict = {
-                    "trackname": item["track"]["name"],
-                    "trackartist": item["track"]["artists"][0]["name"],
-                    "trackuri": item["track"]["uri"],
-                    "image": item["track"]["album"].get("images", [{}])[0].get("url"),
-                    "played": item["played_at"],
-                }
-                recent_list.append(track_dict)
-            except Exception as e:
-                _LOGGER.debug(f"Error with {track_dict} - error: {e}")
+        recent_list = [
+            {
+                "trackname": play["name"],
+                "trackartist": play["artist"],
+                "trackuri": play["uri"],
+                "image": play["image"],
+                "played": play["played_at"],
+            }
+            for play in recent_plays[:RECENT_EXTRAS_ITEMS]
+        ]
 
         ## Bulk check if items are in library, merge with recent items
         uris = [track["trackuri"] for track in recent_list]
-        check_follow = await self.hass.async_add_executor_job(
-            self.data.client.current_user_saved_tracks_contains, uris
-        )
+        check_follow = await self.data.client.current_user_saved_tracks_contains(uris)
 
         for track, value in zip(recent_list, check_follow):
             track["saved"] = value
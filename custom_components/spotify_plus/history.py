@@ -1,13 +1,269 @@
 """Adding Tracks to Unique History Playlist."""
 
+import asyncio
 import datetime
+from datetime import timedelta
+import logging
+from time import time
 from typing import Any, Dict, Optional
 
-# from homeassistant.exceptions import HomeAssistantError
+from spotipy import SpotifyException
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 from . import HomeAssistantSpotifyData
-from .const import DOMAIN, _LOGGER
+from .api import SpotifyApiClient
+from .const import (
+    DOMAIN,
+    _LOGGER,
+    CAPTURE_PERCENT,
+    CAPTURE_SECONDS,
+    HISTORY_FLUSH_INTERVAL,
+    HISTORY_PAGE_SIZE,
+    HISTORY_QUEUE_SAVE_DELAY,
+    HISTORY_SAVE_DELAY,
+    HISTORY_WRITE_BATCH,
+)
+from .scrobble import PlayCapture
+
+STORAGE_VERSION = 1
+
+
+class HistoryIndex:
+    """Track URIs of the history playlist in order, tied to a snapshot_id.
+
+    The index is saved across restarts and rebuilt only when the playlist's
+    snapshot_id or length no longer matches, meaning it was edited outside
+    this integration.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: SpotifyApiClient,
+        playlist_id: str,
+        entry_id: str,
+    ) -> None:
+        """Initialize."""
+        self._client = client
+        self._playlist_id = playlist_id
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.history"
+        )
+        self._uris: list[str | None] = []
+        self.snapshot_id: str | None = None
+
+    def __len__(self) -> int:
+        return len(self._uris)
+
+    async def async_load(self) -> None:
+        """Read the index saved by a previous run."""
+        stored = await self._store.async_load()
+        if stored and stored.get("playlist_id") == self._playlist_id:
+            self._uris = stored["uris"]
+            self.snapshot_id = stored["snapshot_id"]
+
+    def positions(self, uri: str) -> list[int]:
+        """Return every position of a track in the playlist."""
+        return [position for position, item in enumerate(self._uris) if item == uri]
+
+    async def async_ensure(self, snapshot_id: str, total: int) -> None:
+        """Rebuild the index unless it matches the playlist's current version."""
+        if snapshot_id == self.snapshot_id and total == len(self._uris):
+            return
+
+        _LOGGER.debug("History playlist changed elsewhere, rebuilding its index")
+        uris: list[str | None] = []
+        offset = 0
+        while True:
+            page = await self._client.playlist_items(
+                self._playlist_id,
+                fields="items(track(uri)),next",
+                limit=HISTORY_PAGE_SIZE,
+                offset=offset,
+                cache=False,
+            )
+            uris.extend((item.get("track") or {}).get("uri") for item in page["items"])
+            if not page.get("next"):
+                break
+            offset += HISTORY_PAGE_SIZE
+        self._uris = uris
+        self.snapshot_id = snapshot_id
+        self._store.async_delay_save(self._data, HISTORY_SAVE_DELAY)
+
+    def top(self, count: int) -> list[str | None]:
+        """Return the first tracks of the playlist."""
+        return self._uris[:count]
+
+    def remove(self, uris: list[str], snapshot_id: str) -> None:
+        """Record that every occurrence of some tracks was removed."""
+        removed = set(uris)
+        self._uris = [item for item in self._uris if item not in removed]
+        self._changed(snapshot_id)
+
+    def insert(self, position: int, uris: list[str], snapshot_id: str) -> None:
+        """Record that tracks were added at a position."""
+        self._uris[position:position] = uris
+        self._changed(snapshot_id)
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next check, after a write of unknown effect."""
+        self.snapshot_id = None
+
+    def _changed(self, snapshot_id: str) -> None:
+        self.snapshot_id = snapshot_id
+        self._store.async_delay_save(self._data, HISTORY_SAVE_DELAY)
+
+    def _data(self) -> dict[str, Any]:
+        return {
+            "playlist_id": self._playlist_id,
+            "snapshot_id": self.snapshot_id,
+            "uris": self._uris,
+        }
+
+
+class HistoryWriter:
+    """Write-behind queue of history playlist additions.
+
+    Plays are queued in storage right away and written on a fixed interval,
+    newest on top. Each flush keeps the latest play of every track and
+    issues one positional remove and one add per 100 tracks, so the write
+    rate stays the same however fast tracks change.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: SpotifyApiClient,
+        playlist_id: str,
+        entry_id: str,
+    ) -> None:
+        """Initialize."""
+        self._client = client
+        self._playlist_id = playlist_id
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.history_queue"
+        )
+        self._lock = asyncio.Lock()
+        self.index = HistoryIndex(hass, client, playlist_id, entry_id)
+        self.pending: list[dict[str, Any]] = []
+        ## Removed by a flush but not added back yet
+        self._unrestored: set[str] = set()
+        self._failing = False
+        self.images: list[dict[str, Any]] = []
+
+    async def async_load(self) -> None:
+        """Read the index and the plays not written before the last shutdown."""
+        await self.index.async_load()
+        stored = await self._store.async_load()
+        if stored and stored.get("playlist_id") == self._playlist_id:
+            self.pending = stored["pending"]
+            self._unrestored = set(stored.get("unrestored", []))
+
+    async def async_save(self) -> None:
+        """Save the plays still waiting to be written."""
+        await self._store.async_save(self._data())
+
+    def add(self, uri: str, name: str, played_at: float | None = None) -> None:
+        """Queue a play for the next flush."""
+        self.pending.append(
+            {"uri": uri, "name": name, "played_at": played_at or time()}
+        )
+        self._store.async_delay_save(self._data, HISTORY_QUEUE_SAVE_DELAY)
+
+    async def async_flush(self) -> list[dict[str, Any]]:
+        """Write the queued plays, returning them newest first."""
+        async with self._lock:
+            if not (batch := self.pending[:]):
+                return []
+
+            ## Latest play of each track, newest first
+            plays: dict[str, dict[str, Any]] = {}
+            for play in sorted(batch, key=lambda play: play["played_at"]):
+                plays.pop(play["uri"], None)
+                plays[play["uri"]] = play
+            newest = list(reversed(plays.values()))
+            uris = [play["uri"] for play in newest]
+
+            try:
+                ## Only the metadata, the tracks come from the local index,
+                ## read past the response cache, edits elsewhere must show
+                playlist_data = await self._client.playlist(
+                    self._playlist_id,
+                    fields="snapshot_id,images,tracks.total",
+                    cache=False,
+                )
+                self.images = playlist_data["images"]
+                await self.index.async_ensure(
+                    playlist_data["snapshot_id"], playlist_data["tracks"]["total"]
+                )
+                if self.index.top(len(uris)) != uris:
+                    await self._async_write(uris)
+            except SpotifyException as err:
+                if not 400 <= err.http_status < 500 or err.http_status == 429:
+                    raise
+                ## Positions may have been stale, read the playlist again
+                self.index.invalidate()
+                if self._unrestored:
+                    ## Tracks were taken out already, keep their plays to add
+                    ## them back once the index is rebuilt
+                    self._store.async_delay_save(self._data, HISTORY_QUEUE_SAVE_DELAY)
+                    _LOGGER.log(
+                        logging.DEBUG if self._failing else logging.WARNING,
+                        "History playlist write failed, retrying %s tracks: %s",
+                        len(batch),
+                        err,
+                    )
+                    self._failing = True
+                    return []
+
+                ## Nothing was removed, retrying a missing or forbidden
+                ## playlist cannot succeed
+                _LOGGER.warning(
+                    "Dropping %s tracks queued for the history playlist: %s",
+                    len(batch),
+                    err,
+                )
+                newest = []
+
+            self._failing = False
+            del self.pending[: len(batch)]
+            self._store.async_delay_save(self._data, HISTORY_QUEUE_SAVE_DELAY)
+            return newest
+
+    async def _async_write(self, uris: list[str]) -> None:
+        """Remove existing occurrences by position, add the tracks on top."""
+        present = [uri for uri in uris if self.index.positions(uri)]
+        for start in range(0, len(present), HISTORY_WRITE_BATCH):
+            chunk = present[start : start + HISTORY_WRITE_BATCH]
+            result = await self._client.playlist_remove_specific_occurrences_of_items(
+                self._playlist_id,
+                [{"uri": uri, "positions": self.index.positions(uri)} for uri in chunk],
+                self.index.snapshot_id,
+            )
+            self.index.remove(chunk, result["snapshot_id"])
+            self._unrestored.update(chunk)
+            self._store.async_delay_save(self._data, HISTORY_QUEUE_SAVE_DELAY)
+
+        for start in range(0, len(uris), HISTORY_WRITE_BATCH):
+            chunk = uris[start : start + HISTORY_WRITE_BATCH]
+            result = await self._client.playlist_add_items(
+                self._playlist_id, chunk, start
+            )
+            self.index.insert(start, chunk, result["snapshot_id"])
+            self._unrestored.difference_update(chunk)
+
+    def _data(self) -> dict[str, Any]:
+        return {
+            "playlist_id": self._playlist_id,
+            "pending": self.pending,
+            "unrestored": sorted(self._unrestored),
+        }
 
 
 class SpotifyAddToHistory(Entity):
@@ -25,6 +281,7 @@ class SpotifyAddToHistory(Entity):
         name: str,
         user_country: str,
         spotify_history_playlist_id: str,
+        options: Optional[Dict[str, Any]] = None,
     ):
         """Initialize the sensor."""
         self.data = data
@@ -34,6 +291,9 @@ class SpotifyAddToHistory(Entity):
         self._state = None
         self._extra_attributes: Dict[str, Any] = {}
         self._history_playlist_id = spotify_history_playlist_id
+        self._writer: HistoryWriter | None = None
+        self._options = options or {}
+        self._capture: PlayCapture | None = None
 
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, user_id)},
@@ -43,6 +303,56 @@ class SpotifyAddToHistory(Entity):
         self.hass.services.async_register(
             DOMAIN, "spotify_add_to_history", self.spotify_add_to_history
         )
+        self._writer = HistoryWriter(
+            self.hass,
+            self.data.client,
+            self._history_playlist_id,
+            self.registry_entry.config_entry_id,
+        )
+        await self._writer.async_load()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_flush,
+                timedelta(seconds=HISTORY_FLUSH_INTERVAL),
+            )
+        )
+        if self._options.get("history_capture", False):
+            self._capture = PlayCapture(
+                self.hass,
+                self.data.playback,
+                self.registry_entry.config_entry_id,
+                self._options.get("history_capture_percent", CAPTURE_PERCENT),
+                self._options.get("history_capture_seconds", CAPTURE_SECONDS),
+                self._handle_captured_play,
+            )
+            await self._capture.async_load()
+            self._capture.async_start()
+
+    async def async_will_remove_from_hass(self):
+        if self._capture is not None:
+            await self._capture.async_stop()
+        await self._writer.async_save()
+
+    def _handle_captured_play(self, play: Dict[str, Any]) -> None:
+        """Queue a captured track for the history playlist if enabled."""
+        self._extra_attributes = {
+            **self._extra_attributes,
+            "Last Captured": play["name"],
+            "Captured Plays": len(self._capture.plays),
+        }
+        if (
+            self._options.get("history_capture_to_playlist", False)
+            and self._history_playlist_id
+            and play["uri"].startswith("spotify:track:")
+        ):
+            self._writer.add(
+                play["uri"],
+                play["name"],
+                dt_util.parse_datetime(play["played_at"]).timestamp(),
+            )
+            self._extra_attributes["Pending"] = len(self._writer.pending)
+        self.async_write_ha_state()
 
     @property
     def name(self):
@@ -67,44 +377,57 @@ class SpotifyAddToHistory(Entity):
         return self._extra_attributes
 
     async def spotify_add_to_history(self, call):
-        """Add the current playing track to the specified history playlist."""
+        """Queue the current playing track for the specified history playlist."""
 
-        current_track = await self.hass.async_add_executor_job(
-            self.data.client.currently_playing, self._user_country
-        )
+        if not self._history_playlist_id:
+            raise HomeAssistantError(
+                "No history playlist is set in the Spotify Plus options"
+            )
 
-        ## Timestamp addition
-        ## Delete existing occurances, add new item to top
-        now = datetime.datetime.now()
-        added_time = now.strftime("%m-%d-%Y %H:%M:%S")
+        current_track = await self.data.playback.async_get_snapshot()
+        if (
+            not current_track
+            or (current_track.get("item") or {}).get("type") != "track"
+        ):
+            _LOGGER.debug("No track playing, nothing added to History")
+            return
+
+        self._writer.add(current_track["item"]["uri"], current_track["item"]["name"])
+        self._state = f"Queued {current_track['item']['name']}"
+        self._extra_attributes = {
+            **self._extra_attributes,
+            "Pending": len(self._writer.pending),
+        }
+        self.async_write_ha_state()
+
+    async def _async_flush(self, _now=None):
+        """Write the queued tracks to the history playlist."""
         try:
-            await self.hass.async_add_executor_job(
-                self.data.client.playlist_remove_all_occurrences_of_items,
-                self._history_playlist_id,
-                [current_track["item"]["uri"]],
-            )
-            await self.hass.async_add_executor_job(
-                self.data.client.playlist_add_items,
-                self._history_playlist_id,
-                [current_track["item"]["uri"]],
-                0,
-            )
-            self._state = f"Added {current_track['item']['name']}"
-            _LOGGER.debug("Track added to History")
+            written = await self._writer.async_flush()
         except Exception as err:
             _LOGGER.error("Playlist History Add Error: %s", err)
+            return
+        if not written:
+            ## A dropped batch still shortens the queue
+            if self._extra_attributes.get("Pending", 0) != len(self._writer.pending):
+                self._extra_attributes = {
+                    **self._extra_attributes,
+                    "Pending": len(self._writer.pending),
+                }
+                self.async_write_ha_state()
+            return
 
-        ## Get updated playlist metadata
-        playlist_data = await self.hass.async_add_executor_job(
-            self.data.client.playlist, self._history_playlist_id
-        )
-
-        playlist_track_total_count = playlist_data["tracks"]["total"]
-        playlist_image = playlist_data["images"]
+        ## Timestamp addition
+        now = datetime.datetime.now()
+        added_time = now.strftime("%m-%d-%Y %H:%M:%S")
 
+        self._state = f"Added {written[0]['name']}"
+        _LOGGER.debug("%s tracks added to History", len(written))
         self._extra_attributes = {
+            **self._extra_attributes,
             "Added at": added_time,
-            "Song Count": playlist_track_total_count,
-            "Playlist Image": playlist_image,
+            "Song Count": len(self._writer.index),
+            "Playlist Image": self._writer.images,
+            "Pending": len(self._writer.pending),
         }
         self.async_write_ha_state()
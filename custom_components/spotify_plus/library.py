@@ -0,0 +1,194 @@
+"""Local index of the saved tracks, saved albums and followed artists."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from time import time
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from spotipy import SpotifyException
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    _LOGGER,
+    LIBRARY_FULL_SYNC_AGE,
+    LIBRARY_PAGE_SIZE,
+    LIBRARY_SAVE_DELAY,
+    LIBRARY_SYNC_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from .api import SpotifyApiClient
+
+LIBRARY_KINDS = ("tracks", "albums", "artists")
+STORAGE_VERSION = 1
+
+
+class LibraryIndex:
+    """Sets of the IDs in an account's library, answering contains checks.
+
+    The sets are loaded from storage at startup and reconciled in the
+    background. Every interval the newest page of each kind is compared with
+    the index, new saves are pulled in page by page, and the kind is rebuilt
+    when the counts still disagree or the last full sync is a day old.
+    Saves and follows made through the client update the sets at once.
+    ``contains`` returns None for a kind that has never been synced, so
+    callers fall back to asking Spotify.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, client: SpotifyApiClient, entry_id: str
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._client = client
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.library"
+        )
+        self._items: dict[str, set[str]] = {}
+        self._full_sync_at = 0.0
+        self._task: asyncio.Task | None = None
+        self._unsub_interval: CALLBACK_TYPE | None = None
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Return the number of indexed IDs per kind."""
+        return {kind: len(items) for kind, items in self._items.items()}
+
+    async def async_load(self) -> None:
+        """Read the index saved by a previous run."""
+        if stored := await self._store.async_load():
+            self._items = {
+                kind: set(stored[kind]) for kind in LIBRARY_KINDS if kind in stored
+            }
+            self._full_sync_at = stored.get("full_sync_at", 0.0)
+
+    @callback
+    def async_start(self) -> None:
+        """Sync now and then on every interval."""
+        self._unsub_interval = async_track_time_interval(
+            self._hass,
+            self._async_schedule_sync,
+            timedelta(seconds=LIBRARY_SYNC_INTERVAL),
+        )
+        self._async_schedule_sync()
+
+    async def async_stop(self) -> None:
+        """Stop syncing and save the index."""
+        if self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        if self._items:
+            await self._store.async_save(self._data())
+
+    @callback
+    def _async_schedule_sync(self, _now: Any = None) -> None:
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_background_task(
+                self.async_sync(), f"{DOMAIN} library sync"
+            )
+
+    def contains(self, kind: str, ids: list[str]) -> list[bool] | None:
+        """Return whether each ID is in the library, None if not synced yet."""
+        if (items := self._items.get(kind)) is None:
+            return None
+        return [item_id in items for item_id in ids]
+
+    @callback
+    def async_update(self, kind: str, ids: list[str], saved: bool) -> None:
+        """Record a save or removal made by this integration."""
+        if (items := self._items.get(kind)) is None:
+            return
+        if saved:
+            items.update(ids)
+        else:
+            items.difference_update(ids)
+        self._store.async_delay_save(self._data, LIBRARY_SAVE_DELAY)
+
+    def _data(self) -> dict[str, Any]:
+        return {
+            **{kind: sorted(items) for kind, items in self._items.items()},
+            "full_sync_at": self._full_sync_at,
+        }
+
+    async def async_sync(self) -> None:
+        """Reconcile the index with Spotify."""
+        full = time() - self._full_sync_at > LIBRARY_FULL_SYNC_AGE
+        try:
+            await self._async_sync_saved("tracks", full)
+            await self._async_sync_saved("albums", full)
+            await self._async_sync_artists(full)
+        except (aiohttp.ClientError, SpotifyException) as err:
+            _LOGGER.debug("Spotify library sync failed: %s", err)
+            return
+
+        if full:
+            self._full_sync_at = time()
+        self._store.async_delay_save(self._data, LIBRARY_SAVE_DELAY)
+        _LOGGER.debug("Spotify library synced: %s", self.counts)
+
+    async def _async_sync_saved(self, kind: str, full: bool) -> None:
+        """Sync saved tracks or albums, which Spotify lists newest first."""
+        if kind == "tracks":
+            fetch = self._client.current_user_saved_tracks
+        else:
+            fetch = self._client.current_user_saved_albums
+        key = kind[:-1]
+
+        page = first = await fetch(LIBRARY_PAGE_SIZE, 0)
+        total = page["total"]
+        collected: set[str] = set()
+        known = self._items.get(kind)
+        if known is not None and not full:
+            ## Walk the newest pages until one holds nothing new
+            offset = 0
+            while True:
+                ids = {item[key]["id"] for item in page["items"]}
+                collected |= ids
+                if ids <= known or not page.get("next"):
+                    break
+                offset += LIBRARY_PAGE_SIZE
+                page = await fetch(LIBRARY_PAGE_SIZE, offset)
+            if len(known | collected) == total:
+                known |= collected
+                return
+
+            ## Something was removed elsewhere, start over
+            page, collected = first, set()
+
+        ## One page at a time so interactive calls are not held up
+        offset = 0
+        while True:
+            collected.update(item[key]["id"] for item in page["items"])
+            if not page.get("next"):
+                break
+            offset += LIBRARY_PAGE_SIZE
+            page = await fetch(LIBRARY_PAGE_SIZE, offset)
+        self._items[kind] = collected
+
+    async def _async_sync_artists(self, full: bool) -> None:
+        """Sync followed artists, which are paged by cursor."""
+        followed = await self._client.current_user_followed_artists(LIBRARY_PAGE_SIZE)
+        result = followed["artists"]
+        ids = {artist["id"] for artist in result["items"]}
+        known = self._items.get("artists")
+        if (
+            known is not None
+            and not full
+            and result["total"] == len(known)
+            and ids <= known
+        ):
+            return
+
+        while result.get("next"):
+            result = (await self._client.next(result))["artists"]
+            ids.update(artist["id"] for artist in result["items"])
+        self._items["artists"] = ids
@@ -0,0 +1,65 @@
+"""Musixmatch lyrics links, stored by ISRC."""
+
+from __future__ import annotations
+
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from .const import MM_API
+
+if TYPE_CHECKING:
+    from . import HomeAssistantSpotifyData
+
+
+async def async_lyrics_link(
+    data: HomeAssistantSpotifyData, api_token: str, isrc: str
+) -> str | None:
+    """Return the Musixmatch lyrics page of a track.
+
+    Links and misses are kept in the catalog store, misses for a shorter
+    time, so repeat listens never reach Musixmatch.
+    """
+    if not isrc:
+        return None
+    catalog = data.catalog
+    if catalog is not None:
+        if isrc in (found := await catalog.async_get_many("lyrics", [isrc])):
+            return found[isrc]
+        if await catalog.async_get_many("lyrics_miss", [isrc]):
+            return None
+
+    url_lyrics = f"{MM_API}?format=json&apikey={api_token}&track_isrc={isrc}"
+
+    with data.metrics.measure("musixmatch", "track.get") as call:
+        sent = monotonic()
+        async with data.websession.get(url_lyrics) as response:
+            call.status = response.status
+            response_body = await response.read()
+            call.size = len(response_body)
+            response_json = await response.json(content_type="text/plain")
+
+    if (recorder := data.client.recorder) is not None:
+        recorder.record(
+            "musixmatch",
+            "GET",
+            url_lyrics,
+            None,
+            response.status,
+            None,
+            response_body,
+            sent,
+            monotonic() - sent,
+        )
+
+    message = response_json.get("message") or {}
+    if "track" in (message.get("body") or {}):
+        link = message["body"]["track"]["track_share_url"]
+        if catalog is not None:
+            await catalog.async_set_many("lyrics", {isrc: link})
+        return link
+
+    ## Only a definite miss is remembered, quota and key errors are not
+    status = (message.get("header") or {}).get("status_code")
+    if status == 404 and catalog is not None:
+        await catalog.async_set_many("lyrics_miss", {isrc: True})
+    return None
@@ -1,12 +1,11 @@
 """Support for interacting with Spotify Connect."""
+
 from __future__ import annotations
 
-from asyncio import run_coroutine_threadsafe
 import datetime as dt
-from datetime import timedelta
 from typing import Any, Dict, Optional
 
-import requests
+import aiohttp
 from spotipy import SpotifyException
 from yarl import URL
 
@@ -23,7 +22,8 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.dt import utc_from_timestamp
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util.dt import utcnow
 
 from . import HomeAssistantSpotifyData
 from .const import (
@@ -31,12 +31,11 @@ from .const import (
     _LOGGER,
     MEDIA_PLAYER_PREFIX,
     PLAYABLE_MEDIA_TYPES,
+    PLAYBACK_POSITION_DRIFT,
+    PLAYBACK_PROGRESS_TICK,
     SPOTIFY_SCOPES,
 )
 
-
-SCAN_INTERVAL = timedelta(seconds=3)
-
 SUPPORT_SPOTIFY = (
     MediaPlayerEntityFeature.NEXT_TRACK
     | MediaPlayerEntityFeature.PAUSE
@@ -72,19 +71,19 @@ async def async_setup_entry(
         entry.data[CONF_ID],
         entry.title,
     )
-    async_add_entities([spotifyplus], True)
+    async_add_entities([spotifyplus])
 
 
 def spotify_exception_handler(func):
     """Decorate Spotify calls to handle Spotify exception."""
 
-    def wrapper(self, *args, **kwargs):
+    async def wrapper(self, *args, **kwargs):
         # pylint: disable=protected-access
         try:
-            result = func(self, *args, **kwargs)
+            result = await func(self, *args, **kwargs)
             self._attr_available = True
             return result
-        except requests.RequestException:
+        except aiohttp.ClientError:
             self._attr_available = False
         except SpotifyException as exc:
             self._attr_available = False
@@ -100,6 +99,7 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
 
     _attr_icon = "mdi:spotify"
     _attr_media_image_remotely_accessible = False
+    _attr_should_poll = False
 
     def __init__(
         self,
@@ -126,6 +126,7 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
         )
         self._currently_playing: dict | None = {}
         self._playlist: dict | None = None
+        self._context_uri: str | None = None
         self._current_artist_id = None
         self._current_album_id = None
         self._current_album_name = None
@@ -136,7 +137,10 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
         self._current_track_isrc = None
         self._current_device_id = None
         self._current_track_length = 1
-        self._current_track_progress = 1
+        ## Position anchor, only moved on state changes or drift
+        self._position: float | None = None
+        self._position_updated_at: dt.datetime | None = None
+        self._position_key: tuple | None = None
         _LOGGER.debug("Media Player Initialized")
 
     @property
@@ -190,28 +194,20 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
     @property
     def media_position(self) -> int | None:
         """Position of current playing media in seconds."""
-        if (
-            not self._currently_playing
-            or self._currently_playing.get("progress_ms") is None
-        ):
-            return None
-        return self._currently_playing["progress_ms"] / 1000
+        return self._position
 
     @property
     def media_position_updated_at(self) -> dt.datetime | None:
         """When was the position of the current playing media valid."""
-        if not self._currently_playing:
-            return None
-        return utc_from_timestamp(self._currently_playing["timestamp"] / 1000)
+        return self._position_updated_at
 
     @property
     def media_image_url(self) -> str | None:
         """Return the media image URL."""
-        item = self._currently_playing.get("item") or {}
         if not self._currently_playing or self._currently_playing.get("item") is None:
             return None
 
-        if not item["album"]["images"]:
+        if not self._current_album_img:
             return None
         return self._current_album_img[0]["url"]
 
@@ -297,37 +293,43 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
         return self._extra_attributes
 
     @spotify_exception_handler
-    def set_volume_level(self, volume: float) -> None:
+    async def async_set_volume_level(self, volume: float) -> None:
         """Set the volume level."""
-        self.data.client.volume(int(volume * 100))
+        await self.data.client.volume(int(volume * 100))
+        self.data.playback.async_note_command()
 
     @spotify_exception_handler
-    def media_play(self) -> None:
+    async def async_media_play(self) -> None:
         """Start or resume playback."""
-        self.data.client.start_playback()
+        await self.data.client.start_playback()
+        self.data.playback.async_note_command()
 
     @spotify_exception_handler
-    def media_pause(self) -> None:
+    async def async_media_pause(self) -> None:
         """Pause playback."""
-        self.data.client.pause_playback()
+        await self.data.client.pause_playback()
+        self.data.playback.async_note_command()
 
     @spotify_exception_handler
-    def media_previous_track(self) -> None:
+    async def async_media_previous_track(self) -> None:
         """Skip to previous track."""
-        self.data.client.previous_track()
+        await self.data.client.previous_track()
+        self.data.playback.async_note_command()
 
     @spotify_exception_handler
-    def media_next_track(self) -> None:
+    async def async_media_next_track(self) -> None:
         """Skip to next track."""
-        self.data.client.next_track()
+        await self.data.client.next_track()
+        self.data.playback.async_note_command()
 
     @spotify_exception_handler
-    def media_seek(self, position: float) -> None:
+    async def async_media_seek(self, position: float) -> None:
         """Send seek command."""
-        self.data.client.seek_track(int(position * 1000))
+        await self.data.client.seek_track(int(position * 1000))
+        self.data.playback.async_note_command()
 
     @spotify_exception_handler
-    def play_media(
+    async def async_play_media(
         self, media_type: MediaType | str, media_id: str, **kwargs: Any
     ) -> None:
         """Play media."""
@@ -354,56 +356,115 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
         ):
             kwargs["device_id"] = self.data.devices.data[0].get("id")
 
-        self.data.client.start_playback(**kwargs)
+        await self.data.client.start_playback(**kwargs)
+        self.data.playback.async_note_command()
         _LOGGER.debug("Play Event %s", kwargs)
 
     @spotify_exception_handler
-    def select_source(self, source: str) -> None:
+    async def async_select_source(self, source: str) -> None:
         """Select playback device."""
         for device in self.data.devices.data:
             if device["name"] == source:
-                self.data.client.transfer_playback(
+                await self.data.client.transfer_playback(
                     device["id"], self.state == MediaPlayerState.PLAYING
                 )
+                self.data.playback.async_note_command()
                 return
 
     @spotify_exception_handler
-    def set_shuffle(self, shuffle: bool) -> None:
+    async def async_set_shuffle(self, shuffle: bool) -> None:
         """Enable/Disable shuffle mode."""
-        self.data.client.shuffle(shuffle)
+        await self.data.client.shuffle(shuffle)
+        self.data.playback.async_note_command()
 
     @spotify_exception_handler
-    def set_repeat(self, repeat: RepeatMode) -> None:
+    async def async_set_repeat(self, repeat: RepeatMode) -> None:
         """Set repeat mode."""
         if repeat not in REPEAT_MODE_MAPPING_TO_SPOTIFY:
             raise ValueError(f"Unsupported repeat mode: {repeat}")
-        self.data.client.repeat(REPEAT_MODE_MAPPING_TO_SPOTIFY[repeat])
+        await self.data.client.repeat(REPEAT_MODE_MAPPING_TO_SPOTIFY[repeat])
+        self.data.playback.async_note_command()
+
+    @property
+    def available(self) -> bool:
+        """Return True while commands and playback polling succeed."""
+        return self._attr_available and self.data.playback.last_update_success
+
+    async def async_update(self) -> None:
+        """Poll playback now, used by homeassistant.update_entity."""
+        await self.data.playback.async_request_refresh()
 
     @spotify_exception_handler
-    def update(self) -> None:
-        """Update state and attributes."""
+    async def _async_update_playlist(self, uri: str) -> None:
+        """Fetch the playlist being played."""
+        self._playlist = await self.data.client.playlist(uri)
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_playback_update(self) -> None:
+        """Handle a new playback snapshot from the coordinator."""
         if not self.enabled:
             return
 
-        if not self.data.session.valid_token or self.data.client is None:
-            run_coroutine_threadsafe(
-                self.data.session.async_ensure_token_valid(), self.hass.loop
-            ).result()
-            self.data.client.set_auth(auth=self.data.session.token["access_token"])
-
-        current = self.data.client.current_playback()
+        current = self.data.playback.data
         self._currently_playing = current or {}
 
         context = self._currently_playing.get("context")
-        if context is not None and (
-            self._playlist is None or self._playlist["uri"] != context["uri"]
-        ):
+        if context is not None and context["uri"] != self._context_uri:
+            self._context_uri = context["uri"]
             self._playlist = None
             if context["type"] == MediaType.PLAYLIST:
-                self._playlist = self.data.client.playlist(current["context"]["uri"])
+                self.hass.async_create_task(self._async_update_playlist(context["uri"]))
+
+        self._sync_position(current or None)
+        self._update_attributes(current or None)
+        self.async_write_ha_state()
+
+    def _sync_position(self, current_playback: dict[str, Any] | None) -> None:
+        """Re-anchor the position on a state change or when it drifted."""
+        if not current_playback or current_playback.get("progress_ms") is None:
+            self._position = self._position_updated_at = self._position_key = None
+            return
 
-        current_playback = current
+        reported = current_playback["progress_ms"] / 1000
+        key = (
+            (current_playback.get("item") or {}).get("uri"),
+            current_playback.get("is_playing"),
+        )
+        if (
+            key != self._position_key
+            or abs(self._interpolated_position() - reported) > PLAYBACK_POSITION_DRIFT
+        ):
+            self._position = reported
+            self._position_updated_at = utcnow()
+            self._position_key = key
+
+    def _interpolated_position(self) -> float:
+        """Return the position in seconds extrapolated from the anchor."""
+        if self._position is None:
+            return 0.0
+        if not self._currently_playing.get("is_playing"):
+            return self._position
+        elapsed = (utcnow() - self._position_updated_at).total_seconds()
+        return min(self._position + elapsed, self._current_track_length / 1000)
+
+    def _track_percent(self) -> int:
+        position_ms = self._interpolated_position() * 1000
+        return min(100, int(position_ms / self._current_track_length * 100))
 
+    @callback
+    def _handle_progress_tick(self, _now=None) -> None:
+        """Advance media_track_percent locally while playing."""
+        if not self.enabled or not self._currently_playing.get("is_playing"):
+            return
+        percent = self._track_percent()
+        if percent != self._extra_attributes.get("media_track_percent"):
+            self._current_track_percent = percent
+            self._extra_attributes["media_track_percent"] = percent
+            self.async_write_ha_state()
+
+    def _update_attributes(self, current_playback: dict[str, Any] | None) -> None:
+        """Derive the extra attributes from a playback snapshot."""
         ## Add additional attributes to media_player entity. This requires no additional API calls.
         if current_playback is not None:
             if (
@@ -421,39 +482,24 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
                 duration_str = "00:00"
 
             self._current_track_length_readable = duration_str
-            self._current_track_length = duration_ms
-            self._current_track_progress = current_playback.get("progress_ms", {})
-
-            self._current_track_percent = int(
-                (self._current_track_progress / self._current_track_length) * 100
-            )
-
-            self._current_artist_id = (
-                current_playback.get("item", {}).get("artists", [{}])[0].get("id")
-            )
-
-            self._current_album_id = (
-                current_playback.get("item", {}).get("album", {}).get("id")
+            self._current_track_length = duration_ms or 1
+            self._current_track_percent = self._track_percent()
+
+            ## Ads have no item, episodes have images but no album
+            item = current_playback.get("item") or {}
+            self._current_artist_id = (item.get("artists") or [{}])[0].get("id")
+            self._current_album_id = item.get("album", {}).get("id")
+            self._current_album_img = item.get("album", {}).get(
+                "images", item.get("images")
             )
-
-            self._current_album_img = (
-                current_playback.get("item", {}).get("album", {}).get("images")
-            )
-
-            self._current_album_name = (
-                current_playback.get("item", {}).get("album", {}).get("name")
-            )
-
+            self._current_album_name = item.get("album", {}).get("name")
             self._current_track_isrc = (
-                current_playback.get("item", {})
-                .get("external_ids", {})
-                .get("isrc", "")
-                .upper()
+                item.get("external_ids", {}).get("isrc", "").upper()
             )
 
             self._current_device_id = current_playback.get("device", {}).get("id")
 
-        if self._current_album_img is None:
+        if not self._current_album_img:
             self._spotify_album_img = None
         else:
             self._spotify_album_img = self._current_album_img[0].get("url", "")
@@ -481,3 +527,14 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
         self.async_on_remove(
             self.data.devices.async_add_listener(self._handle_devices_update)
         )
+        self.async_on_remove(
+            self.data.playback.async_add_listener(self._handle_playback_update)
+        )
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._handle_progress_tick,
+                dt.timedelta(seconds=PLAYBACK_PROGRESS_TICK),
+            )
+        )
+        self._handle_playback_update()
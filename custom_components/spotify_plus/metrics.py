@@ -0,0 +1,148 @@
+"""Per-endpoint call metrics for Spotify and Musixmatch requests."""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+from .const import METRICS_WINDOW
+
+## Path segments following these are IDs and are folded into one endpoint
+ID_PARENTS = {
+    "albums",
+    "artists",
+    "audio-features",
+    "categories",
+    "episodes",
+    "playlists",
+    "shows",
+    "tracks",
+    "users",
+}
+
+
+def endpoint_name(path: str) -> str:
+    """Return an endpoint template such as ``playlists/{id}/tracks``."""
+    parts = path.strip("/").split("/")
+    if parts[0] == "me":
+        return "/".join(parts)
+    return "/".join(
+        "{id}" if index and parts[index - 1] in ID_PARENTS else part
+        for index, part in enumerate(parts)
+    )
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Return the nearest rank percentile of values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+@dataclass
+class CallRecord:
+    """Outcome of one request, filled in while it runs."""
+
+    status: int = 0
+    size: int = 0
+    retries: int = 0
+
+
+@dataclass
+class EndpointStats:
+    """Counters and rolling latencies of one endpoint."""
+
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes: int = 0
+    statuses: Counter = field(default_factory=Counter)
+    latencies: deque = field(default_factory=lambda: deque(maxlen=METRICS_WINDOW))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats with latency percentiles in milliseconds."""
+        latencies = list(self.latencies)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "statuses": dict(self.statuses),
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+        }
+
+
+class ApiMetrics:
+    """Rolling call metrics of a config entry.
+
+    Each endpoint keeps totals plus the latencies of its last
+    ``METRICS_WINDOW`` calls, and call times of the last minute are kept
+    for a calls per minute rate.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._endpoints: dict[tuple[str, str], EndpointStats] = {}
+        self._latencies: deque[float] = deque(maxlen=METRICS_WINDOW)
+        self._recent: deque[float] = deque()
+
+    @contextmanager
+    def measure(self, service: str, endpoint: str) -> Iterator[CallRecord]:
+        """Time a call and record it when the block exits."""
+        record = CallRecord()
+        started = monotonic()
+        try:
+            yield record
+        finally:
+            self.record(service, endpoint, record, (monotonic() - started) * 1000)
+
+    def record(
+        self, service: str, endpoint: str, record: CallRecord, latency_ms: float
+    ) -> None:
+        """Add one finished call."""
+        stats = self._endpoints.setdefault((service, endpoint), EndpointStats())
+        stats.calls += 1
+        stats.retries += record.retries
+        stats.bytes += record.size
+        stats.statuses[record.status] += 1
+        if not 200 <= record.status < 400:
+            stats.errors += 1
+        stats.latencies.append(latency_ms)
+        self._latencies.append(latency_ms)
+        self._recent.append(monotonic())
+        self._prune()
+
+    def _prune(self) -> None:
+        oldest = monotonic() - 60
+        while self._recent and self._recent[0] < oldest:
+            self._recent.popleft()
+
+    @property
+    def calls_per_minute(self) -> int:
+        """Return the number of calls made in the last minute."""
+        self._prune()
+        return len(self._recent)
+
+    def latency(self, pct: float) -> float | None:
+        """Return a latency percentile over recent calls of every endpoint."""
+        return percentile(list(self._latencies), pct)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every endpoint grouped by service."""
+        services: dict[str, dict[str, Any]] = {}
+        for (service, endpoint), stats in sorted(self._endpoints.items()):
+            services.setdefault(service, {})[endpoint] = stats.as_dict()
+        return {
+            "calls_per_minute": self.calls_per_minute,
+            "p50_ms": self.latency(50),
+            "p95_ms": self.latency(95),
+            "p99_ms": self.latency(99),
+            "services": services,
+        }
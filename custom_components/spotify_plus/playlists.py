@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, Optional
 import asyncio
-import requests
+import aiohttp
 from spotipy import SpotifyException
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.restore_state import RestoreEntity
@@ -20,7 +20,7 @@ def spotify_exception_handler(func):
             result = await func(self, *args, **kwargs)
             self._attr_available = True
             return result
-        except requests.RequestException:
+        except aiohttp.ClientError:
             self._attr_available = False
         except SpotifyException as exc:
             self._attr_available = False
@@ -89,17 +89,13 @@ class SpotifyPlaylists(RestoreEntity):
 
     async def spotify_playlists(self, call):
         """Build Playlist Details"""
-        ## Limit of 10 concurrent connections to Spotify API, reduced here to 8 to prevent pile up.
-        CONNECTION_LIMIT = 6
-        semaphore = asyncio.Semaphore(CONNECTION_LIMIT)
-
         playlists = []
         offset = 0
         limit = 20
 
         while True:
-            user_playlists = await self.hass.async_add_executor_job(
-                self.data.client.current_user_playlists, limit, offset
+            user_playlists = await self.data.client.current_user_playlists(
+                limit, offset
             )
 
             ## Check for playlists with no items
@@ -117,8 +113,7 @@ class SpotifyPlaylists(RestoreEntity):
 
         async def analyze_playlist_async(playlist_id):
             """Goes Deep on each playlist track - LIMIT OF 100 TRACKS!!!"""
-            playlist_tracks = await self.hass.async_add_executor_job(
-                self.data.client.playlist_items,
+            playlist_tracks = await self.data.client.playlist_items(
                 playlist_id,
                 "items(track(name,uri,popularity))",
                 100,
@@ -137,9 +132,7 @@ class SpotifyPlaylists(RestoreEntity):
             track_popularity = [
                 item["track"]["popularity"] for item in playlist_tracks["items"]
             ]
-            track_analysis = await self.hass.async_add_executor_job(
-                self.data.client.audio_features, track_uris
-            )
+            track_analysis = await self.data.client.audio_features(track_uris)
 
             num_tracks = len(track_analysis)
             analysis_attributes = [
@@ -169,37 +162,34 @@ class SpotifyPlaylists(RestoreEntity):
             return avg_analysis
 
         async def process_playlist_async(playlist):
-            """Get Full Details, limit to provided connection limit"""
-            async with semaphore:
-                playlist_id = playlist.get("uri", "")
-                analysis = await analyze_playlist_async(playlist_id)
+            """Get Full Details, throttled by the shared request scheduler"""
+            playlist_id = playlist.get("uri", "")
+            analysis = await analyze_playlist_async(playlist_id)
+
+            base_info = {}
+            try:
+                base_info["name"] = playlist.get("name", "")
+                base_info["uri"] = playlist.get("uri", "")
+                base_info["description"] = playlist.get("description", "")
 
-                base_info = {}
                 try:
-                    base_info["name"] = playlist.get("name", "")
-                    base_info["uri"] = playlist.get("uri", "")
-                    base_info["description"] = playlist.get("description", "")
-
-                    try:
-                        base_info["image"] = playlist.get("images", [{}])[0].get(
-                            "url", ""
-                        )
-                    except Exception:
-                        base_info["image"] = ""
-
-                    try:
-                        base_info["owner"] = playlist.get("owner", {}).get(
-                            "display_name", ""
-                        )
-                    except Exception:
-                        base_info["owner"] = ""
+                    base_info["image"] = playlist.get("images", [{}])[0].get("url", "")
+                except Exception:
+                    base_info["image"] = ""
 
+                try:
+                    base_info["owner"] = playlist.get("owner", {}).get(
+                        "display_name", ""
+                    )
                 except Exception:
-                    pass
+                    base_info["owner"] = ""
+
+            except Exception:
+                pass
 
-                return {**base_info, **analysis}
+            return {**base_info, **analysis}
 
-        ## Perform massive playlist data gathering, keeping below connection threshold
+        ## Perform massive playlist data gathering, the scheduler keeps us below rate limits
         coroutines = [process_playlist_async(playlist) for playlist in playlists]
         results = await asyncio.gather(*coroutines)
         _LOGGER.debug("All Playlists analyzed")
@@ -0,0 +1,106 @@
+"""Background warm-up of song data for upcoming queue tracks."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from spotipy import SpotifyException
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import _LOGGER, PREFETCH_IDLE_WAIT, PREFETCH_QUEUE_DEPTH
+from .lyrics import async_lyrics_link
+
+if TYPE_CHECKING:
+    from . import HomeAssistantSpotifyData
+
+
+class QueuePrefetcher:
+    """Warm the caches get_song_data reads for the next queued tracks.
+
+    Tracks, audio features and artists go into the catalog store in one
+    batched call each, followed by album track lists and lyrics links.
+    Calls run one at a time and only while no other request of the account
+    is in flight, and a newer queue replaces a prefetch still running.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        data: HomeAssistantSpotifyData,
+        mm_api_token: str | None = None,
+        depth: int = PREFETCH_QUEUE_DEPTH,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._data = data
+        self._mm_api_token = mm_api_token
+        self._depth = depth
+        self._task: asyncio.Task | None = None
+
+    @callback
+    def async_schedule(self, queue: list[dict[str, Any]]) -> None:
+        """Start prefetching the first tracks of a queue."""
+        self.async_cancel()
+        tracks = [
+            track for track in queue if track.get("type") == "track" and track.get("id")
+        ][: self._depth]
+        if tracks:
+            self._task = self._hass.async_create_task(self._async_prefetch(tracks))
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop a running prefetch."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def _async_idle(self) -> None:
+        """Wait until no other request of the account is running."""
+        while self._data.scheduler.in_flight:
+            await asyncio.sleep(PREFETCH_IDLE_WAIT)
+
+    async def _async_prefetch(self, tracks: list[dict[str, Any]]) -> None:
+        client = self._data.client
+        track_ids = [track["id"] for track in tracks]
+        artist_ids = list(
+            dict.fromkeys(
+                track["artists"][0]["id"] for track in tracks if track.get("artists")
+            )
+        )
+        album_ids = list(
+            dict.fromkeys(
+                track["album"]["id"] for track in tracks if track.get("album")
+            )
+        )
+        steps = [
+            lambda: client.tracks(track_ids),
+            lambda: client.audio_features(track_ids),
+            lambda: client.artists(artist_ids),
+            *(
+                lambda album_id=album_id: client.album_all_tracks(album_id)
+                for album_id in album_ids
+            ),
+        ]
+        if self._mm_api_token:
+            steps.extend(
+                lambda isrc=isrc: async_lyrics_link(
+                    self._data, self._mm_api_token, isrc
+                )
+                for isrc in dict.fromkeys(
+                    track.get("external_ids", {}).get("isrc", "").upper()
+                    for track in tracks
+                )
+                if isrc
+            )
+
+        try:
+            for step in steps:
+                await self._async_idle()
+                await step()
+        except (aiohttp.ClientError, SpotifyException, ValueError) as err:
+            _LOGGER.debug("Queue prefetch stopped: %s", err)
+        else:
+            _LOGGER.debug("Prefetched song data for %s queued tracks", len(tracks))
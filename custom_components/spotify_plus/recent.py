@@ -0,0 +1,112 @@
+"""Ring buffer of recently played tracks."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    _LOGGER,
+    RECENT_MAX_ITEMS,
+    RECENT_PAGE_SIZE,
+    RECENT_SAVE_DELAY,
+)
+
+if TYPE_CHECKING:
+    from .api import SpotifyApiClient
+
+STORAGE_VERSION = 1
+
+
+def _play(item: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields kept for one recently played item."""
+    track = item["track"]
+    return {
+        "played_at": item["played_at"],
+        "uri": track["uri"],
+        "id": track.get("id"),
+        "name": track.get("name"),
+        "artist": (track.get("artists") or [{}])[0].get("name"),
+        "image": ((track.get("album") or {}).get("images") or [{}])[0].get("url"),
+        "duration_ms": track.get("duration_ms"),
+        "context": (item.get("context") or {}).get("uri"),
+    }
+
+
+def _played_at(play: dict[str, Any]) -> float:
+    return dt_util.parse_datetime(play["played_at"]).timestamp()
+
+
+class RecentPlays:
+    """Recently played tracks, newest first, kept across restarts.
+
+    The buffer is seeded with one page of plays and afterwards only asks
+    for plays after the newest cursor, so a refresh with nothing new played
+    returns an empty page. Up to ``max_items`` plays are kept, far more than
+    Spotify returns in one call.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: SpotifyApiClient,
+        entry_id: str,
+        max_items: int = RECENT_MAX_ITEMS,
+    ) -> None:
+        """Initialize."""
+        self._client = client
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.recent")
+        self._plays: deque[dict[str, Any]] = deque(maxlen=max_items)
+        self._after: int | None = None
+
+    @property
+    def plays(self) -> list[dict[str, Any]]:
+        """Return the buffered plays, newest first."""
+        return list(self._plays)
+
+    async def async_load(self) -> None:
+        """Read the buffer saved by a previous run."""
+        if stored := await self._store.async_load():
+            self._plays.extend(stored["plays"])
+            self._after = stored.get("after")
+
+    async def async_update(self) -> list[dict[str, Any]]:
+        """Add the plays after the newest known one and return the buffer."""
+        seeding = self._after is None
+        known = {(play["played_at"], play["uri"]) for play in self._plays}
+        new: list[dict[str, Any]] = []
+        while True:
+            result = await self._client.current_user_recently_played(
+                RECENT_PAGE_SIZE, after=self._after
+            )
+            items = result.get("items") or []
+            for item in items:
+                ## Local files and removed tracks may lack parts, skip broken ones
+                try:
+                    play = _play(item)
+                except (KeyError, TypeError) as err:
+                    _LOGGER.debug("Skipping recently played item %s: %s", item, err)
+                    continue
+                if (key := (play["played_at"], play["uri"])) not in known:
+                    known.add(key)
+                    new.append(play)
+
+            previous = self._after
+            if cursor := (result.get("cursors") or {}).get("after"):
+                self._after = int(cursor)
+            if seeding or self._after == previous or len(items) < RECENT_PAGE_SIZE:
+                break
+
+        if new:
+            for play in sorted(new, key=_played_at):
+                self._plays.appendleft(play)
+            self._store.async_delay_save(self._data, RECENT_SAVE_DELAY)
+        return self.plays
+
+    def _data(self) -> dict[str, Any]:
+        return {"plays": list(self._plays), "after": self._after}
@@ -0,0 +1,154 @@
+"""Rate limit aware request scheduler shared by all Spotify calls of an account."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from time import monotonic
+
+from .const import (
+    _LOGGER,
+    SCHEDULER_BURST,
+    SCHEDULER_INCREASE_AFTER,
+    SCHEDULER_MIN_IN_FLIGHT,
+    SCHEDULER_RATE,
+)
+
+
+class RequestScheduler:
+    """Token bucket with an adaptive in-flight cap and Retry-After handling.
+
+    Every request takes a token from a bucket refilled at ``rate`` per second
+    and a slot below the current concurrency limit. The limit grows by one
+    after a run of successful calls and is halved on a 429, while the
+    ``Retry-After`` delay pauses every caller of the account, not just the
+    request that was throttled.
+
+    Waiters are queued in order and woken one at a time, when a slot is
+    released or the next token is due, so a long queue costs no more per
+    request than a short one.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        rate: float = SCHEDULER_RATE,
+        burst: int = SCHEDULER_BURST,
+    ) -> None:
+        """Initialize."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._refilled_at = monotonic()
+        self._max_in_flight = max(max_in_flight, SCHEDULER_MIN_IN_FLIGHT)
+        self._limit = self._max_in_flight
+        self._in_flight = 0
+        self._successes = 0
+        self._blocked_until = 0.0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._wakeup: asyncio.TimerHandle | None = None
+
+    @property
+    def limit(self) -> int:
+        """Return the current concurrency limit."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests currently running."""
+        return self._in_flight
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._refilled_at) * self._rate
+        )
+        self._refilled_at = now
+
+    def _take(self) -> float | None:
+        """Take a token and a slot, or return the seconds until one may be due.
+
+        Returns 0 when taken and None when only a released slot can help.
+        """
+        now = monotonic()
+        self._refill(now)
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self._in_flight >= self._limit:
+            return None
+        if self._tokens < 1:
+            return (1 - self._tokens) / self._rate
+        self._tokens -= 1
+        self._in_flight += 1
+        return 0
+
+    def _dispatch(self) -> None:
+        """Hand tokens and slots to the queued waiters in order."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        while self._waiters:
+            if self._waiters[0].done():
+                ## Cancelled while queued
+                self._waiters.popleft()
+                continue
+            if (delay := self._take()) is None:
+                return
+            if delay > 0:
+                self._wakeup = asyncio.get_running_loop().call_later(
+                    delay, self._dispatch
+                )
+                return
+            self._waiters.popleft().set_result(None)
+
+    async def _acquire(self) -> None:
+        if not self._waiters and self._take() == 0:
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                ## Granted just before the caller went away
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait until a request may be sent and hold its slot while it runs."""
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    def record_success(self) -> None:
+        """Grow the concurrency limit after a run of successful calls."""
+        self._successes += 1
+        if (
+            self._successes >= SCHEDULER_INCREASE_AFTER
+            and self._limit < self._max_in_flight
+        ):
+            self._successes = 0
+            self._limit += 1
+            self._dispatch()
+
+    def record_throttled(self, retry_after: float) -> None:
+        """Back off after a 429 response."""
+        self._successes = 0
+        self._limit = max(SCHEDULER_MIN_IN_FLIGHT, self._limit // 2)
+        self._blocked_until = max(self._blocked_until, monotonic() + retry_after)
+        self._tokens = 0
+        _LOGGER.warning(
+            "Spotify rate limit reached, pausing requests for %.1fs (limit %s)",
+            retry_after,
+            self._limit,
+        )
@@ -0,0 +1,144 @@
+"""Scrobble-style capture of plays from the shared playback snapshots."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from time import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    _LOGGER,
+    CAPTURE_MAX_ITEMS,
+    CAPTURE_PERCENT,
+    CAPTURE_SAVE_DELAY,
+    CAPTURE_SECONDS,
+    PLAYBACK_POSITION_DRIFT,
+)
+from .coordinator import PlaybackCoordinator
+
+STORAGE_VERSION = 1
+
+
+class PlayCapture:
+    """Record a play once enough of a track has been listened to.
+
+    Listening time is the progress made between consecutive snapshots of
+    the playback coordinator, capped by the time between them, so seeking
+    ahead does not count. A play is recorded once that time reaches the
+    percentage of the track or the number of seconds, whichever comes
+    first. No requests are made beyond the coordinator's own polls.
+    Plays are kept newest first in storage and handed to ``on_play``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        playback: PlaybackCoordinator,
+        entry_id: str,
+        percent: float = CAPTURE_PERCENT,
+        seconds: float = CAPTURE_SECONDS,
+        on_play: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        """Initialize."""
+        self._playback = playback
+        self._percent = percent
+        self._seconds = seconds
+        self._on_play = on_play
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.captured"
+        )
+        self._plays: deque[dict[str, Any]] = deque(maxlen=CAPTURE_MAX_ITEMS)
+        self._unsub: CALLBACK_TYPE | None = None
+
+        ## The play being listened to
+        self._uri: str | None = None
+        self._started_at = 0.0
+        self._listened = 0.0
+        self._recorded = False
+        self._progress = 0.0
+        self._polled_at: float | None = None
+
+    @property
+    def plays(self) -> list[dict[str, Any]]:
+        """Return the recorded plays, newest first."""
+        return list(self._plays)
+
+    async def async_load(self) -> None:
+        """Read the plays recorded by a previous run."""
+        if stored := await self._store.async_load():
+            self._plays.extend(stored["plays"])
+
+    @callback
+    def async_start(self) -> None:
+        """Follow the playback snapshots."""
+        self._unsub = self._playback.async_add_listener(self._handle_playback_update)
+
+    async def async_stop(self) -> None:
+        """Stop following playback and save the plays."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        await self._store.async_save(self._data())
+
+    @callback
+    def _handle_playback_update(self) -> None:
+        ## Failed polls notify listeners with the previous snapshot
+        polled_at = self._playback.updated_at
+        if polled_at == self._polled_at:
+            return
+        elapsed = polled_at - self._polled_at if self._polled_at else 0.0
+        self._polled_at = polled_at
+
+        playback = self._playback.data or {}
+        item = playback.get("item") or {}
+        if not item.get("uri") or playback.get("progress_ms") is None:
+            self._uri = None
+            return
+
+        progress = playback["progress_ms"] / 1000
+        if (
+            item["uri"] != self._uri
+            or progress < self._progress - PLAYBACK_POSITION_DRIFT
+        ):
+            ## A new play, part of it may have passed since the last poll
+            self._uri = item["uri"]
+            self._started_at = time() - progress
+            self._listened = min(progress, elapsed)
+            self._recorded = False
+        else:
+            self._listened += max(0.0, min(progress - self._progress, elapsed))
+        self._progress = progress
+
+        if not self._recorded and self._listened >= self._threshold(item):
+            self._recorded = True
+            self._record(playback, item)
+
+    def _threshold(self, item: dict[str, Any]) -> float:
+        """Return the seconds of listening that make a play."""
+        if duration := item.get("duration_ms"):
+            return min(duration / 1000 * self._percent / 100, self._seconds)
+        return self._seconds
+
+    def _record(self, playback: dict[str, Any], item: dict[str, Any]) -> None:
+        play = {
+            "played_at": dt_util.utc_from_timestamp(self._started_at).isoformat(),
+            "uri": item["uri"],
+            "name": item.get("name"),
+            "artist": (item.get("artists") or [{}])[0].get("name"),
+            "duration_ms": item.get("duration_ms"),
+            "context": (playback.get("context") or {}).get("uri"),
+        }
+        self._plays.appendleft(play)
+        self._store.async_delay_save(self._data, CAPTURE_SAVE_DELAY)
+        _LOGGER.debug("Captured play of %s", item["uri"])
+        if self._on_play is not None:
+            self._on_play(play)
+
+    def _data(self) -> dict[str, Any]:
+        return {"plays": list(self._plays)}
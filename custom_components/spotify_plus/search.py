@@ -1,7 +1,8 @@
 """Sensor for Spotify Search."""
+
 import asyncio
 from typing import Any, Dict, Optional
-import requests
+import aiohttp
 from spotipy import SpotifyException
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.entity import DeviceInfo
@@ -19,7 +20,7 @@ def spotify_exception_handler(func):
             result = await func(self, *args, **kwargs)
             self._attr_available = True
             return result
-        except requests.RequestException:
+        except aiohttp.ClientError:
             self._attr_available = False
         except SpotifyException as exc:
             self._attr_available = False
@@ -108,13 +109,8 @@ class SpotifySearch(RestoreEntity):
 
         ## Quick search to get top artist in search to tag as main artist
         if search_type == search_artist:
-            search_items = await self.hass.async_add_executor_job(
-                self.data.client.search,
-                search_param,
-                5,
-                0,
-                "artist",
-                self._user_country,
+            search_items = await self.data.client.search(
+                search_param, 5, 0, "artist", self._user_country
             )
 
             if search_items.get("artists", {}).get("items"):
@@ -129,34 +125,21 @@ class SpotifySearch(RestoreEntity):
                 _LOGGER.debug("Main artist ID or name not found. Skipping tasks.")
             else:
                 # Only perform these tasks if main_artist_id and main_artist_name are not None
-                artist_playlists_task = self.hass.async_add_executor_job(
-                    self.data.client.search,
-                    main_artist_name,
-                    30,
-                    0,
-                    "playlist",
-                    self._user_country,
-                )
-                artist_albums_task = self.hass.async_add_executor_job(
-                    self.data.client.artist_albums,
-                    main_artist_id,
-                    "album",
-                    self._user_country,
-                    50,
+                artist_playlists_task = self.data.client.search(
+                    main_artist_name, 30, 0, "playlist", self._user_country
                 )
-                related_artists_task = self.hass.async_add_executor_job(
-                    self.data.client.artist_related_artists, main_artist_id
+                artist_albums_task = self.data.client.artist_albums(
+                    main_artist_id, "album", self._user_country, 50
                 )
-                top_tracks_task = self.hass.async_add_executor_job(
-                    self.data.client.artist_top_tracks,
-                    main_artist_id,
-                    self._user_country,
+                related_artists_task = self.data.client.artist_related_artists(
+                    main_artist_id
                 )
-                artist_profile_task = self.hass.async_add_executor_job(
-                    self.data.client.artist, main_artist_id
+                top_tracks_task = self.data.client.artist_top_tracks(
+                    main_artist_id, self._user_country
                 )
-                artist_follow_task = self.hass.async_add_executor_job(
-                    self.data.client.current_user_following_artists, [main_artist_id]
+                artist_profile_task = self.data.client.artist(main_artist_id)
+                artist_follow_task = self.data.client.current_user_following_artists(
+                    [main_artist_id]
                 )
                 _LOGGER.debug("Artist %s Profile retrieved", search_param)
 
@@ -192,8 +175,8 @@ class SpotifySearch(RestoreEntity):
                     ]
 
                     uris = [track["uri"] for track in search_results["tracks"]]
-                    check_follow = await self.hass.async_add_executor_job(
-                        self.data.client.current_user_saved_tracks_contains, uris
+                    check_follow = (
+                        await self.data.client.current_user_saved_tracks_contains(uris)
                     )
 
                     for track, value in zip(search_results["tracks"], check_follow):
@@ -214,8 +197,8 @@ class SpotifySearch(RestoreEntity):
                     ]
 
                     uris = [album["uri"] for album in search_results["albums"]]
-                    check_follow = await self.hass.async_add_executor_job(
-                        self.data.client.current_user_saved_albums_contains, uris
+                    check_follow = (
+                        await self.data.client.current_user_saved_albums_contains(uris)
                     )
 
                     for album, value in zip(search_results["albums"], check_follow):
@@ -239,8 +222,8 @@ class SpotifySearch(RestoreEntity):
                 ]
 
                 uris = [artist["uri"] for artist in search_results["related_artists"]]
-                check_follow = await self.hass.async_add_executor_job(
-                    self.data.client.current_user_following_artists, uris
+                check_follow = await self.data.client.current_user_following_artists(
+                    uris
                 )
 
                 for artist, value in zip(
@@ -253,9 +236,11 @@ class SpotifySearch(RestoreEntity):
                         {
                             "name": item["name"],
                             "artists": None,
-                            "image": item["images"][0]["url"]
-                            if len(item["images"]) > 0
-                            else None,
+                            "image": (
+                                item["images"][0]["url"]
+                                if len(item["images"]) > 0
+                                else None
+                            ),
                             "uri": item["uri"],
                             "id": item["id"],
                             "info": item["description"],
@@ -276,9 +261,11 @@ class SpotifySearch(RestoreEntity):
                 formatted_followers = (
                     f"{followers / 1000000:.1f}M"
                     if followers >= 1000000
-                    else f"{followers / 1000:.1f}k"
-                    if followers >= 1000
-                    else str(followers)
+                    else (
+                        f"{followers / 1000:.1f}k"
+                        if followers >= 1000
+                        else str(followers)
+                    )
                 )
 
                 search_results["profile"] = {
@@ -294,13 +281,8 @@ class SpotifySearch(RestoreEntity):
                 self._state = "Artist Profile"
 
         else:
-            search_items = await self.hass.async_add_executor_job(
-                self.data.client.search,
-                search_param,
-                25,
-                0,
-                "track,album,playlist",
-                self._user_country,
+            search_items = await self.data.client.search(
+                search_param, 25, 0, "track,album,playlist", self._user_country
             )
             _LOGGER.debug("General Search executed %s", search_param)
 
@@ -320,8 +302,8 @@ class SpotifySearch(RestoreEntity):
                 ]
 
                 uris = [track["uri"] for track in search_results["tracks"]]
-                check_follow = await self.hass.async_add_executor_job(
-                    self.data.client.current_user_saved_tracks_contains, uris
+                check_follow = (
+                    await self.data.client.current_user_saved_tracks_contains(uris)
                 )
 
                 for track, value in zip(search_results["tracks"], check_follow):
@@ -332,9 +314,11 @@ class SpotifySearch(RestoreEntity):
                     {
                         "name": item["name"],
                         "artists": item["artists"][0]["name"],
-                        "image": item["images"][0]["url"]
-                        if len(item["images"]) > 0
-                        else None,
+                        "image": (
+                            item["images"][0]["url"]
+                            if len(item["images"]) > 0
+                            else None
+                        ),
                         "uri": item["uri"],
                         "id": item["id"],
                         "info": item["name"],
@@ -344,8 +328,8 @@ class SpotifySearch(RestoreEntity):
                 ]
 
                 uris = [album["uri"] for album in search_results["albums"]]
-                check_follow = await self.hass.async_add_executor_job(
-                    self.data.client.current_user_saved_albums_contains, uris
+                check_follow = (
+                    await self.data.client.current_user_saved_albums_contains(uris)
                 )
 
                 for album, value in zip(search_results["albums"], check_follow):
@@ -356,9 +340,11 @@ class SpotifySearch(RestoreEntity):
                     {
                         "name": item["name"],
                         "artists": None,
-                        "image": item["images"][0]["url"]
-                        if len(item["images"]) > 0
-                        else None,
+                        "image": (
+                            item["images"][0]["url"]
+                            if len(item["images"]) > 0
+                            else None
+                        ),
                         "uri": item["uri"],
                         "id": item["id"],
                         "info": item["description"],
@@ -448,8 +434,8 @@ class SpotifyCategoryPlaylists(RestoreEntity):
         limit = 50
 
         while True:
-            all_categories = await self.hass.async_add_executor_job(
-                self.data.client.categories, self._user_country, None, limit, offset
+            all_categories = await self.data.client.categories(
+                self._user_country, None, limit, offset
             )
 
             valid_categories = list(all_categories["categories"]["items"])
@@ -469,12 +455,8 @@ class SpotifyCategoryPlaylists(RestoreEntity):
             offset = 0
             limit = 50
             while True:
-                category_playlists = await self.hass.async_add_executor_job(
-                    self.data.client.category_playlists,
-                    category_id,
-                    self._user_country,
-                    limit,
-                    offset,
+                category_playlists = await self.data.client.category_playlists(
+                    category_id, self._user_country, limit, offset
                 )
 
                 valid_playlists = [
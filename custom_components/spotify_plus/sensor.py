@@ -1,4 +1,5 @@
 """Support for interacting with Spotify Connect."""
+
 from datetime import timedelta
 import asyncio
 from typing import Any, Dict, Optional
@@ -21,6 +22,7 @@ from .tools import SpotifyMusicMachine
 from .playlists import SpotifyPlaylists
 from .artists import SpotifyMyArtists
 from .artists import SpotifyTopArtists
+from .stats import STATS_SENSORS, SpotifyApiStats
 from .const import DOMAIN, SPOTIFY_SCOPES, _LOGGER
 
 SCAN_INTERVAL = timedelta(minutes=30)
@@ -45,6 +47,7 @@ async def async_setup_entry(
         entry.title,
         entry.data.get("country"),
         entry.options.get("mm_api_token"),
+        entry.options.get("refresh_on_track_change", False),
     )
     analysis = SpotifyHistoryAnalysis(
         hass.data[DOMAIN][entry.entry_id],
@@ -73,6 +76,8 @@ async def async_setup_entry(
         entry.data[CONF_ID],
         entry.title,
         entry.data["country"],
+        entry.options.get("refresh_on_track_change", False),
+        entry.options.get("mm_api_token"),
     )
 
     top_artists = SpotifyTopArtists(
@@ -95,6 +100,7 @@ async def async_setup_entry(
         entry.title,
         entry.data["country"],
         entry.options.get("spotify_history_playlist_id"),
+        entry.options,
     )
     playlists = SpotifyPlaylists(
         hass.data[DOMAIN][entry.entry_id],
@@ -124,6 +130,12 @@ async def async_setup_entry(
         tools,
     ]
 
+    if entry.options.get("api_stats_sensors", False):
+        sensors.extend(
+            SpotifyApiStats(hass.data[DOMAIN][entry.entry_id], entry.data[CONF_ID], key)
+            for key in STATS_SENSORS
+        )
+
     for sensor in sensors:
         async_add_entities([sensor], True)
 
@@ -201,22 +213,12 @@ class SpotifyPlus(SensorEntity):
             return
 
         ## Get user profile highlights
-        spotify_me_task = self.hass.async_add_executor_job(self.data.client.me)
-        spotify_artist_number_task = self.hass.async_add_executor_job(
-            self.data.client.current_user_followed_artists, 1
-        )
-        spotify_track_number_task = self.hass.async_add_executor_job(
-            self.data.client.current_user_saved_tracks, 1
-        )
-        spotify_album_number_task = self.hass.async_add_executor_job(
-            self.data.client.current_user_saved_albums, 1
-        )
-        spotify_playlist_number_task = self.hass.async_add_executor_job(
-            self.data.client.current_user_playlists, 1
-        )
-        spotify_seed_genres_task = self.hass.async_add_executor_job(
-            self.data.client.recommendation_genre_seeds
-        )
+        spotify_me_task = self.data.client.me()
+        spotify_artist_number_task = self.data.client.current_user_followed_artists(1)
+        spotify_track_number_task = self.data.client.current_user_saved_tracks(1)
+        spotify_album_number_task = self.data.client.current_user_saved_albums(1)
+        spotify_playlist_number_task = self.data.client.current_user_playlists(1)
+        spotify_seed_genres_task = self.data.client.recommendation_genre_seeds()
         (
             spotify_me,
             spotify_artist_number,
@@ -238,8 +240,8 @@ class SpotifyPlus(SensorEntity):
         limit = 50
 
         while True:
-            all_categories = await self.hass.async_add_executor_job(
-                self.data.client.categories, self._user_country, None, limit, offset
+            all_categories = await self.data.client.categories(
+                self._user_country, None, limit, offset
             )
 
             valid_categories = list(all_categories["categories"]["items"])
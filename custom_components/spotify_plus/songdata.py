@@ -1,17 +1,30 @@
-""" Song Details from Spotify."""
+"""Song Details from Spotify."""
 
 from typing import Any, Dict, Optional
 import asyncio
+from collections.abc import Awaitable, Callable
 import aiohttp
-import requests
 
 from spotipy import SpotifyException
+from homeassistant.core import Event
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 from . import HomeAssistantSpotifyData
-from .const import DOMAIN, _LOGGER, SPOTIFY_SCOPES, MM_API
+from .coordinator import playback_started
+from .cache import ResponseCache
+from .lyrics import async_lyrics_link
+from .const import (
+    DOMAIN,
+    _LOGGER,
+    SPOTIFY_SCOPES,
+    EVENT_PLAYBACK_CHANGED,
+    SONGDATA_CACHE_MAX_ENTRIES,
+    SONGDATA_TTL_CATALOG,
+    SONGDATA_TTL_LIBRARY,
+    SONGDATA_TTL_PLAYLIST,
+)
 
 
 def spotify_exception_handler(func):
@@ -23,7 +36,7 @@ def spotify_exception_handler(func):
             result = await func(self, *args, **kwargs)
             self._attr_available = True
             return result
-        except requests.RequestException:
+        except aiohttp.ClientError:
             self._attr_available = False
         except SpotifyException as exc:
             self._attr_available = False
@@ -47,6 +60,7 @@ class SpotifySongData(RestoreEntity):
         name: str,
         user_country: str,
         mm_api_token: str,
+        refresh_on_change: bool = False,
     ) -> None:
         """Initialize."""
         self._id = user_id
@@ -74,6 +88,8 @@ class SpotifySongData(RestoreEntity):
         self._state = None
         self._extra_attributes: Dict[str, Any] = {}
         self._mm_api_token = mm_api_token or None
+        self._refresh_on_change = refresh_on_change
+        self._enrichment = ResponseCache(SONGDATA_CACHE_MAX_ENTRIES)
         self._current_artist_name = None
         self._current_artist_id = None
         self._current_artist_uri = None
@@ -117,11 +133,26 @@ class SpotifySongData(RestoreEntity):
         }
         for service_name, service_func in service_options.items():
             self.hass.services.async_register(DOMAIN, service_name, service_func)
+        if self._refresh_on_change:
+            self.async_on_remove(
+                self.hass.bus.async_listen(
+                    EVENT_PLAYBACK_CHANGED, self._async_playback_changed
+                )
+            )
         last_state = await self.async_get_last_state()
         if last_state:
             self._state = last_state.state
             self._extra_attributes = dict(last_state.attributes)
 
+    async def _async_playback_changed(self, event: Event) -> None:
+        """Refresh when a new track or context of this account starts."""
+        if not playback_started(event.data, self._id):
+            return
+        try:
+            await self.get_song_data(None)
+        except (HomeAssistantError, aiohttp.ClientError, SpotifyException) as err:
+            _LOGGER.warning("Song data refresh after playback change failed: %s", err)
+
     @property
     def state(self) -> Optional[Dict[str, Any]]:
         """Return the state attributes of the sensor."""
@@ -141,19 +172,16 @@ class SpotifySongData(RestoreEntity):
 
     async def get_song_data(self, call):
         """Update the sensor."""
-        retry = True
-        retry_count = 0
+        ## Shared playback snapshot, polled only if the last one is stale
+        current_playback = await self.data.playback.async_get_snapshot()
 
-        while retry and retry_count < 2:
-            try:
-                current_playback = await self.hass.async_add_executor_job(
-                    self.data.client.currently_playing
-                )
-                retry = False
-            except Exception as err:
-                _LOGGER.error("Spotify Initialization Failure: %s", err)
-                retry_count += 1
-                asyncio.sleep(1)
+        ## Episodes and ads have no song data
+        if (
+            current_playback is not None
+            and current_playback.get("currently_playing_type") != "track"
+        ):
+            _LOGGER.debug("No track playing, song data not updated")
+            return
 
         if current_playback is None:
             self._state = None
@@ -190,40 +218,62 @@ class SpotifySongData(RestoreEntity):
                 .upper()
             )
 
-            ## Get details based on track for additional data
-            following_artist_task = self.hass.async_add_executor_job(
-                self.data.client.current_user_following_artists,
-                [self._current_artist_id],
-            )
-            following_album_task = self.hass.async_add_executor_job(
-                self.data.client.current_user_saved_albums_contains,
-                [self._current_album_id],
-            )
-            following_track_task = self.hass.async_add_executor_job(
-                self.data.client.current_user_saved_tracks_contains,
-                [self._current_track_uri],
-            )
-            track_details_task = self.hass.async_add_executor_job(
-                self.data.client.track, self._current_track_uri
-            )
-
+            ## Library flags change often, the rest is cached per track,
+            ## album, artist and playlist
             (
-                following_artist,
-                following_album,
-                following_track,
+                self._following_artist,
+                self._following_album,
+                self._following_track,
                 track_details,
+                audio_features,
+                self._artist_img,
+                self._album_tracks,
             ) = await asyncio.gather(
-                following_artist_task,
-                following_album_task,
-                following_track_task,
-                track_details_task,
+                self._cached(
+                    "library_artist",
+                    self._current_artist_id,
+                    SONGDATA_TTL_LIBRARY,
+                    self._following_artist_flag,
+                ),
+                self._cached(
+                    "library_album",
+                    self._current_album_id,
+                    SONGDATA_TTL_LIBRARY,
+                    self._saved_album_flag,
+                ),
+                self._cached(
+                    "library_track",
+                    self._current_track_uri,
+                    SONGDATA_TTL_LIBRARY,
+                    self._saved_track_flag,
+                ),
+                self._cached(
+                    "track",
+                    self._current_track_uri,
+                    SONGDATA_TTL_CATALOG,
+                    lambda: self.data.client.track(self._current_track_uri),
+                ),
+                self._cached(
+                    "audio_features",
+                    self._current_track_uri,
+                    SONGDATA_TTL_CATALOG,
+                    self._track_audio_features,
+                ),
+                self._cached(
+                    "artist_img",
+                    self._current_artist_id,
+                    SONGDATA_TTL_CATALOG,
+                    self._artist_image,
+                ),
+                self._cached(
+                    "album_tracks",
+                    self._current_album_id,
+                    SONGDATA_TTL_CATALOG,
+                    self._album_track_list,
+                ),
             )
-
-            ## Flags for following artist, album, track
-            self._following_artist = following_artist[0]
-            self._following_album = following_album[0]
-            self._following_track = following_track[0]
             self._track_details = track_details
+            self._audio_features = audio_features
 
             ## Other than Release Date, this data is rarely populated by Spotify
             self._current_track_copyright = track_details["album"].get("copyrights", "")
@@ -246,41 +296,41 @@ class SpotifySongData(RestoreEntity):
                 )
                 if current_playback.get("context", {}).get("type", "") == "playlist":
                     playlist_id = current_context_uri.replace("spotify:playlist:", "")
-                    self._spotify_playlist_follow = (
-                        await self.hass.async_add_executor_job(
-                            self.data.client.playlist_is_following,
+                    (
+                        self._spotify_playlist_follow,
+                        self._spotify_playlist,
+                    ) = await asyncio.gather(
+                        self._cached(
+                            "library_playlist",
                             playlist_id,
-                            [self._id],
-                        )
-                    )
-                    spotify_playlist = await self.hass.async_add_executor_job(
-                        lambda: self.data.client.playlist(
-                            playlist_id, fields="name, images, description"
-                        )
+                            SONGDATA_TTL_LIBRARY,
+                            lambda: self.data.client.playlist_is_following(
+                                playlist_id, [self._id]
+                            ),
+                        ),
+                        self._cached(
+                            "playlist",
+                            playlist_id,
+                            SONGDATA_TTL_PLAYLIST,
+                            lambda: self.data.client.playlist(
+                                playlist_id, fields="name, images, description"
+                            ),
+                        ),
                     )
-                    self._spotify_playlist = spotify_playlist
                     self._spotify_context_uri = current_context_uri
             else:
                 self._play_source = "queue"
 
             ## If MusixMatch token provided, get lyrics URL
             if self._mm_api_token is not None:
-                url_lyrics = f"{MM_API}?format=json&apikey={self._mm_api_token}&track_isrc={self._current_track_isrc}"
-
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url_lyrics) as response:
-                        response_json = await response.json(content_type="text/plain")
-
-                if (
-                    "message" in response_json
-                    and "body" in response_json["message"]
-                    and "track" in response_json["message"]["body"]
-                ):
-                    self._lyrics_link = response_json["message"]["body"]["track"][
-                        "track_share_url"
-                    ]
-                else:
-                    self._lyrics_link = None
+                self._lyrics_link = await self._cached(
+                    "lyrics",
+                    self._current_track_isrc,
+                    SONGDATA_TTL_CATALOG,
+                    lambda: async_lyrics_link(
+                        self.data, self._mm_api_token, self._current_track_isrc
+                    ),
+                )
 
             duration_ms = current_playback["item"]["duration_ms"]
             duration_sec = duration_ms // 1000
@@ -288,33 +338,6 @@ class SpotifySongData(RestoreEntity):
             duration_str = f"{minutes:02d}:{seconds:02d}"
             self._track_length = duration_str
 
-            ## Get even more data
-            audio_features_task = self.hass.async_add_executor_job(
-                self.data.client.audio_features, [self._current_track_uri]
-            )
-            artist_img_task = self.hass.async_add_executor_job(
-                self.data.client.artist, self._current_artist_id
-            )
-            album_tracks_task = self.hass.async_add_executor_job(
-                self.data.client.album_tracks, current_playback["item"]["album"]["id"]
-            )
-
-            audio_features, artist_img, album_tracks = await asyncio.gather(
-                audio_features_task, artist_img_task, album_tracks_task
-            )
-
-            self._audio_features = audio_features[0]
-            self._artist_img = artist_img["images"][0]["url"]
-            self._album_tracks = [
-                {
-                    "trackNumber": track["track_number"],
-                    "name": track["name"],
-                    "artist": track["artists"][0]["name"],
-                    "uri": track["uri"],
-                }
-                for track in album_tracks["items"]
-            ]
-
             self._extra_attributes = {
                 "spotify": {
                     "spotify_track_id": self._current_track_id,
@@ -366,131 +389,182 @@ class SpotifySongData(RestoreEntity):
             }
         self.async_write_ha_state()
 
+    async def _cached(
+        self,
+        kind: str,
+        key: str | None,
+        ttl: int,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return an enrichment value, fetching it only when missing or expired.
+
+        None results are not kept, so failed lookups are retried.
+        """
+        if (entry := self._enrichment.get((kind, key))) is not None:
+            self._enrichment.hits += 1
+            return entry.body
+        self._enrichment.misses += 1
+        if (value := await fetch()) is not None:
+            self._enrichment.set((kind, key), value, None, ttl)
+        return value
+
+    async def _following_artist_flag(self) -> bool:
+        return (
+            await self.data.client.current_user_following_artists(
+                [self._current_artist_id]
+            )
+        )[0]
+
+    async def _saved_album_flag(self) -> bool:
+        return (
+            await self.data.client.current_user_saved_albums_contains(
+                [self._current_album_id]
+            )
+        )[0]
+
+    async def _saved_track_flag(self) -> bool:
+        return (
+            await self.data.client.current_user_saved_tracks_contains(
+                [self._current_track_uri]
+            )
+        )[0]
+
+    async def _track_audio_features(self) -> dict[str, Any]:
+        return (await self.data.client.audio_features([self._current_track_uri]))[0]
+
+    async def _artist_image(self) -> str:
+        artist = await self.data.client.artist(self._current_artist_id)
+        return artist["images"][0]["url"]
+
+    async def _album_track_list(self) -> list[dict[str, Any]]:
+        album_tracks = await self.data.client.album_all_tracks(self._current_album_id)
+        return [
+            {
+                "discNumber": track.get("disc_number", 1),
+                "trackNumber": track["track_number"],
+                "name": track["name"],
+                "artist": track["artists"][0]["name"],
+                "uri": track["uri"],
+            }
+            for track in album_tracks
+        ]
+
     @spotify_exception_handler
     async def spotify_follow_artist(self, call):
         """Add Artist to Spotify Library"""
+        self._enrichment.invalidate("library")
         if "artist_id" in call.data and call.data["artist_id"]:
-            await self.hass.async_add_executor_job(
-                self.data.client.user_follow_artists, [call.data["artist_id"]]
-            )
+            await self.data.client.user_follow_artists([call.data["artist_id"]])
             _LOGGER.debug("Spotify Artist %s Added", call.data["artist_id"])
         else:
             if self._current_artist_id:
-                await self.hass.async_add_executor_job(
-                    self.data.client.user_follow_artists, [self._current_artist_id]
-                )
+                await self.data.client.user_follow_artists([self._current_artist_id])
                 _LOGGER.debug("Spotify Artist %s Added", self._current_artist_id)
 
     @spotify_exception_handler
     async def spotify_follow_album(self, call):
         """Add Album to Spotify Library"""
+        self._enrichment.invalidate("library")
         if "album_id" in call.data and call.data["album_id"]:
-            await self.hass.async_add_executor_job(
-                self.data.client.current_user_saved_albums_add, [call.data["album_id"]]
+            await self.data.client.current_user_saved_albums_add(
+                [call.data["album_id"]]
             )
             _LOGGER.debug("Spotify Album %s Added", call.data["album_id"])
         else:
             if self._current_album_id:
-                await self.hass.async_add_executor_job(
-                    self.data.client.current_user_saved_albums_add,
-                    [self._current_album_id],
+                await self.data.client.current_user_saved_albums_add(
+                    [self._current_album_id]
                 )
                 _LOGGER.debug("Spotify Album %s Added", self._current_album_id)
 
     @spotify_exception_handler
     async def spotify_follow_track(self, call):
         """Add Track to Spotify Library"""
+        self._enrichment.invalidate("library")
         if "track_id" in call.data and call.data["track_id"]:
-            await self.hass.async_add_executor_job(
-                self.data.client.current_user_saved_tracks_add, [call.data["track_id"]]
+            await self.data.client.current_user_saved_tracks_add(
+                [call.data["track_id"]]
             )
             _LOGGER.debug("Spotify Track %s Added", call.data["track_id"])
         else:
             if self._current_track_uri:
-                await self.hass.async_add_executor_job(
-                    self.data.client.current_user_saved_tracks_add,
-                    [self._current_track_uri],
+                await self.data.client.current_user_saved_tracks_add(
+                    [self._current_track_uri]
                 )
                 _LOGGER.debug("Spotify Track %s Added", self._current_track_uri)
 
     @spotify_exception_handler
     async def spotify_follow_playlist(self, call):
         """Add Playlist to Spotify Library"""
+        self._enrichment.invalidate("library")
         if "playlist_id" in call.data and call.data["playlist_id"]:
-            await self.hass.async_add_executor_job(
-                self.data.client.current_user_follow_playlist, call.data["playlist_id"]
+            await self.data.client.current_user_follow_playlist(
+                call.data["playlist_id"]
             )
             _LOGGER.debug("Spotify Playlist %s Added", call.data["playlist_id"])
         else:
             if self._spotify_context_uri:
-                await self.hass.async_add_executor_job(
-                    self.data.client.current_user_follow_playlist,
-                    self._spotify_context_uri,
+                await self.data.client.current_user_follow_playlist(
+                    self._spotify_context_uri
                 )
                 _LOGGER.debug("Spotify Playlist %s Added", self._spotify_context_uri)
 
     @spotify_exception_handler
     async def spotify_unfollow_artist(self, call):
         """Add Artist to Spotify Library"""
+        self._enrichment.invalidate("library")
         if "artist_id" in call.data and call.data["artist_id"]:
-            await self.hass.async_add_executor_job(
-                self.data.client.user_unfollow_artists, [call.data["artist_id"]]
-            )
+            await self.data.client.user_unfollow_artists([call.data["artist_id"]])
             _LOGGER.debug("Spotify Artist %s Added", call.data["artist_id"])
         else:
             if self._current_artist_id:
-                await self.hass.async_add_executor_job(
-                    self.data.client.user_unfollow_artists, [self._current_artist_id]
-                )
+                await self.data.client.user_unfollow_artists([self._current_artist_id])
                 _LOGGER.debug("Spotify Artist %s Deleted", self._current_artist_id)
 
     @spotify_exception_handler
     async def spotify_unfollow_album(self, call):
         """Add Album to Spotify Library"""
+        self._enrichment.invalidate("library")
         if "album_id" in call.data and call.data["album_id"]:
-            await self.hass.async_add_executor_job(
-                self.data.client.current_user_saved_albums_delete,
-                [call.data["album_id"]],
+            await self.data.client.current_user_saved_albums_delete(
+                [call.data["album_id"]]
             )
             _LOGGER.debug("Spotify Album %s Deleted", call.data["album_id"])
         else:
             if self._current_album_id:
-                await self.hass.async_add_executor_job(
-                    self.data.client.current_user_saved_albums_delete,
-                    [self._current_album_id],
+                await self.data.client.current_user_saved_albums_delete(
+                    [self._current_album_id]
                 )
                 _LOGGER.debug("Spotify Album %s Deleted", self._current_album_id)
 
     @spotify_exception_handler
     async def spotify_unfollow_track(self, call):
         """Add Track to Spotify Library"""
+        self._enrichment.invalidate("library")
         if "track_id" in call.data and call.data["track_id"]:
-            await self.hass.async_add_executor_job(
-                self.data.client.current_user_saved_tracks_delete,
-                [call.data["track_id"]],
+            await self.data.client.current_user_saved_tracks_delete(
+                [call.data["track_id"]]
             )
             _LOGGER.debug("Spotify Track %s Deleted", call.data["track_id"])
         else:
             if self._current_track_uri:
-                await self.hass.async_add_executor_job(
-                    self.data.client.current_user_saved_tracks_delete,
-                    [self._current_track_uri],
+                await self.data.client.current_user_saved_tracks_delete(
+                    [self._current_track_uri]
                 )
                 _LOGGER.debug("Spotify Track %s Deleted", self._current_track_uri)
 
     @spotify_exception_handler
     async def spotify_unfollow_playlist(self, call):
         """Add Playlist to Spotify Library"""
+        self._enrichment.invalidate("library")
         if "playlist_id" in call.data and call.data["playlist_id"]:
-            await self.hass.async_add_executor_job(
-                self.data.client.current_user_unfollow_playlist,
-                call.data["playlist_id"],
+            await self.data.client.current_user_unfollow_playlist(
+                call.data["playlist_id"]
             )
             _LOGGER.debug("Spotify Playlist %s Deleted", call.data["playlist_id"])
         else:
             if self._spotify_context_uri:
-                await self.hass.async_add_executor_job(
-                    self.data.client.current_user_unfollow_playlist,
-                    self._spotify_context_uri,
+                await self.data.client.current_user_unfollow_playlist(
+                    self._spotify_context_uri
                 )
                 _LOGGER.debug("Spotify Playlist %s Deleted", self._spotify_context_uri)
@@ -0,0 +1,60 @@
+"""Spotify API call statistics sensors."""
+
+from datetime import timedelta
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import UnitOfTime
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.event import async_track_time_interval
+from . import HomeAssistantSpotifyData
+from .const import DOMAIN
+
+STATS_INTERVAL = timedelta(seconds=30)
+
+## Sensor key: (name, latency percentile or None for the call rate)
+STATS_SENSORS = {
+    "latency_p50": ("Spotify API Latency p50", 50),
+    "latency_p95": ("Spotify API Latency p95", 95),
+    "latency_p99": ("Spotify API Latency p99", 99),
+    "calls_per_minute": ("Spotify API Calls Per Minute", None),
+}
+
+
+class SpotifyApiStats(SensorEntity):
+    """Latency percentile or call rate of the Spotify API."""
+
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:speedometer"
+
+    def __init__(self, data: HomeAssistantSpotifyData, user_id: str, key: str):
+        """Initialize the sensor."""
+        self.data = data
+        self._attr_name, self._percentile = STATS_SENSORS[key]
+        self._attr_unique_id = f"SpotifyApiStats_{key}_{user_id}"
+        if self._percentile is not None:
+            self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+        else:
+            self._attr_native_unit_of_measurement = "calls/min"
+
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, user_id)},
+        )
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(
+            async_track_time_interval(self.hass, self._async_refresh, STATS_INTERVAL)
+        )
+
+    async def _async_refresh(self, _now=None) -> None:
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self):
+        """Return the current value."""
+        if self._percentile is None:
+            return self.data.metrics.calls_per_minute
+        if (latency := self.data.metrics.latency(self._percentile)) is None:
+            return None
+        return round(latency)
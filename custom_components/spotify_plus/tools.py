@@ -106,9 +106,8 @@ class SpotifyMusicMachine(RestoreEntity):
         if device_name:
             for device in self.data.devices.data:
                 if device["name"] == device_name:
-                    self.hass.async_add_executor_job(
-                        self.data.client.transfer_playback, device["id"]
-                    )
+                    await self.data.client.transfer_playback(device["id"])
+                    self.data.playback.async_note_command()
         try:
             SEED_ARTISTS = call.data["seed_artists"].replace(" ", "").split(",")
         except (TypeError, ValueError, KeyError):
@@ -207,38 +206,29 @@ class SpotifyMusicMachine(RestoreEntity):
             params["min_popularity"] = TARGET_POP_MIN
             params["max_popularity"] = TARGET_POP_MAX
 
-        playlists = await self.hass.async_add_executor_job(
-            self.data.client.current_user_playlists
-        )
+        playlists = await self.data.client.current_user_playlists()
 
         if create_playlist:
             for playlist in playlists["items"]:
                 if playlist["name"] == playlist_name:
                     existing_pl_flag = True
                     existing_playlist_uri = playlist["uri"]
-                    existing_playlist_items = await self.hass.async_add_executor_job(
-                        self.data.client.playlist_items,
-                        existing_playlist_uri,
-                        "items(track(uri))",
-                        100,
+                    existing_playlist_items = await self.data.client.playlist_items(
+                        existing_playlist_uri, "items(track(uri))", 100
                     )
                     existing_playlist_item_uris = [
                         item["track"]["uri"]
                         for item in existing_playlist_items["items"]
                     ]
-                    await self.hass.async_add_executor_job(
-                        self.data.client.playlist_remove_all_occurrences_of_items,
-                        existing_playlist_uri,
-                        existing_playlist_item_uris,
+                    await self.data.client.playlist_remove_all_occurrences_of_items(
+                        existing_playlist_uri, existing_playlist_item_uris
                     )
 
         if not (SEED_ARTISTS or SEED_GENRES or SEED_TRACKS):
             ## This is a hack to get beyond 50 Top Tracks to 99
-            resultst1_task = self.hass.async_add_executor_job(
-                self.data.client.current_user_top_tracks, 49, 0, time_range
-            )
-            resultst2_task = self.hass.async_add_executor_job(
-                self.data.client.current_user_top_tracks, 50, 49, time_range
+            resultst1_task = self.data.client.current_user_top_tracks(49, 0, time_range)
+            resultst2_task = self.data.client.current_user_top_tracks(
+                50, 49, time_range
             )
             resultst1, resultst2 = await asyncio.gather(resultst1_task, resultst2_task)
 
@@ -254,9 +244,7 @@ class SpotifyMusicMachine(RestoreEntity):
 
             if artist_focus:
                 ## Option for playlist from my followed artists or my top artists. If my artists, no time_range applies
-                results = await self.hass.async_add_executor_job(
-                    self.data.client.current_user_followed_artists, 50
-                )
+                results = await self.data.client.current_user_followed_artists(50)
 
                 while results:
                     artists.extend(
@@ -264,19 +252,17 @@ class SpotifyMusicMachine(RestoreEntity):
                         for artist in results["artists"]["items"]
                     )
                     if results["artists"]["next"]:
-                        results = await self.hass.async_add_executor_job(
-                            self.data.client.next, (results["artists"])
-                        )
+                        results = await self.data.client.next(results["artists"])
                     else:
                         break
 
             else:
                 ## Spotify is only supposed to allow 50 Top Artists. Calling the max with an offset of 49 can get a total of 99
-                results1_task = self.hass.async_add_executor_job(
-                    self.data.client.current_user_top_artists, 49, 0, time_range
+                results1_task = self.data.client.current_user_top_artists(
+                    49, 0, time_range
                 )
-                results2_task = self.hass.async_add_executor_job(
-                    self.data.client.current_user_top_artists, 50, 49, time_range
+                results2_task = self.data.client.current_user_top_artists(
+                    50, 49, time_range
                 )
                 results1, results2 = await asyncio.gather(results1_task, results2_task)
 
@@ -305,15 +291,9 @@ class SpotifyMusicMachine(RestoreEntity):
             params3 = params.copy()
             params3["seed_tracks"] = list(random_track_ids[:5])
 
-            recs1_task = self.hass.async_add_executor_job(
-                lambda: self.data.client.recommendations(**params1)
-            )
-            recs2_task = self.hass.async_add_executor_job(
-                lambda: self.data.client.recommendations(**params2)
-            )
-            recs3_task = self.hass.async_add_executor_job(
-                lambda: self.data.client.recommendations(**params3)
-            )
+            recs1_task = self.data.client.recommendations(**params1)
+            recs2_task = self.data.client.recommendations(**params2)
+            recs3_task = self.data.client.recommendations(**params3)
             _LOGGER.debug("Spotify Parameters %s", params)
 
             recs1, recs2, recs3 = await asyncio.gather(
@@ -350,9 +330,7 @@ class SpotifyMusicMachine(RestoreEntity):
 
             if len(SEED_ARTISTS) > 0:
                 paramsx["seed_artists"] = SEED_ARTISTS
-                artists_info = await self.hass.async_add_executor_job(
-                    self.data.client.artists, SEED_ARTISTS
-                )
+                artists_info = await self.data.client.artists(SEED_ARTISTS)
                 random_artist_names = [
                     artist["name"] for artist in artists_info["artists"]
                 ]
@@ -363,16 +341,12 @@ class SpotifyMusicMachine(RestoreEntity):
 
             if len(SEED_TRACKS) > 0:
                 paramsx["seed_tracks"] = SEED_TRACKS
-                tracks_info = await self.hass.async_add_executor_job(
-                    self.data.client.tracks, SEED_TRACKS
-                )
+                tracks_info = await self.data.client.tracks(SEED_TRACKS)
                 random_track_names = [track["name"] for track in tracks_info["tracks"]]
 
             _LOGGER.debug("User Provided Seed Params: %s", paramsx)
 
-            recsx = await self.hass.async_add_executor_job(
-                lambda: self.data.client.recommendations(**paramsx)
-            )
+            recsx = await self.data.client.recommendations(**paramsx)
 
             seed_details = {
                 "Recs": recsx["seeds"],
@@ -389,14 +363,10 @@ class SpotifyMusicMachine(RestoreEntity):
         if create_playlist:
             try:
                 if existing_pl_flag:
-                    await self.hass.async_add_executor_job(
-                        self.data.client.user_playlist_add_tracks,
-                        self._id,
-                        existing_playlist_uri,
-                        list(rec_tracks),
+                    await self.data.client.user_playlist_add_tracks(
+                        self._id, existing_playlist_uri, list(rec_tracks)
                     )
-                    await self.hass.async_add_executor_job(
-                        self.data.client.user_playlist_change_details,
+                    await self.data.client.user_playlist_change_details(
                         self._id,
                         existing_playlist_uri,
                         playlist_name,
@@ -406,20 +376,12 @@ class SpotifyMusicMachine(RestoreEntity):
                     )
                     context_playlist = existing_playlist_uri
                 else:
-                    create_playlist = await self.hass.async_add_executor_job(
-                        self.data.client.user_playlist_create,
-                        self._id,
-                        playlist_name,
-                        False,
-                        False,
-                        playlist_desc,
+                    create_playlist = await self.data.client.user_playlist_create(
+                        self._id, playlist_name, False, False, playlist_desc
                     )
                     context_playlist = create_playlist["uri"]
-                    await self.hass.async_add_executor_job(
-                        self.data.client.user_playlist_add_tracks,
-                        self._id,
-                        context_playlist,
-                        list(rec_tracks),
+                    await self.data.client.user_playlist_add_tracks(
+                        self._id, context_playlist, list(rec_tracks)
                     )
             except Exception as err:
                 _LOGGER.error("Playlist Creation Failure: %s", err)
@@ -427,16 +389,14 @@ class SpotifyMusicMachine(RestoreEntity):
 
         try:
             if play_now and not create_playlist:
-                await self.hass.async_add_executor_job(
-                    self.data.client.start_playback, None, None, rec_tracks
-                )
+                await self.data.client.start_playback(None, None, rec_tracks)
+                self.data.playback.async_note_command()
                 playlist_name = "Queue Only"
                 _LOGGER.debug("Queue Created")
 
             if play_now and create_playlist:
-                await self.hass.async_add_executor_job(
-                    self.data.client.start_playback, None, context_playlist
-                )
+                await self.data.client.start_playback(None, context_playlist)
+                self.data.playback.async_note_command()
                 _LOGGER.debug("Playlist %s Created", context_playlist)
 
         except Exception as e: